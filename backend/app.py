@@ -6,15 +6,21 @@ Main application entry point
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
-from fastapi import FastAPI, Request, status
+from fastapi import FastAPI, Request, WebSocket, status
+from fastapi.encoders import jsonable_encoder
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
 from pydantic import ValidationError
 
-from routes import markets, tournaments, staking, ai
+from routes import markets, tournaments, staking, ai, stream
 from routes import stats as stats_routes
+from config import settings
 from services.websocket import websocket_manager
+from services.tournament_scheduler import tournament_scheduler
+from services.payouts import payout_worker
+from services.inference import inference_executor
+from services.prediction_refresher import prediction_refresher
 from storage import storage
 from seed_data import get_seed_markets
 
@@ -34,11 +40,32 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         storage.create_market(market)
     print(f"✅ Loaded {len(seed_markets)} seed markets")
 
+    await websocket_manager.start()
+    print(f"✅ WebSocket pub/sub bus attached ({type(websocket_manager.pubsub).__name__})")
+
+    await tournament_scheduler.start()
+    await payout_worker.start()
+    mode = "live" if payout_worker.enabled else "mock"
+    print(f"✅ Payout worker running ({mode}, groups of {payout_worker.group_size})")
+
+    await inference_executor.start()
+    print(f"✅ AI inference running ({inference_executor.workers} workers, batches of {inference_executor.batch_size})")
+
+    await prediction_refresher.start()
+    print(f"✅ AI prediction refresher running ({prediction_refresher.max_per_minute} refreshes/min)")
+
+    print(f"✅ Tournament scheduler running ({len(tournament_scheduler.heap)} deadlines)")
+
     yield
 
     # Shutdown
     print("👋 PolyGrand backend shutting down...")
+    await tournament_scheduler.stop()
+    await payout_worker.stop()
+    await prediction_refresher.stop()
+    await inference_executor.stop()
     await websocket_manager.disconnect_all()
+    await websocket_manager.stop()
 
 
 # Create FastAPI app
@@ -76,7 +103,7 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
     return JSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content={
-            "detail": exc.errors(),
+            "detail": jsonable_encoder(exc.errors()),
             "body": str(exc.body) if hasattr(exc, 'body') else None
         }
     )
@@ -110,16 +137,21 @@ app.include_router(tournaments.router, prefix="/api/v1/tournaments", tags=["Tour
 app.include_router(staking.router, prefix="/api/v1/staking", tags=["Staking"])
 app.include_router(ai.router, prefix="/api/v1/ai", tags=["AI"])
 app.include_router(stats_routes.router, prefix="/api/v1/stats", tags=["Stats"])
+app.include_router(stream.router, prefix="/api/v1/stream", tags=["Streaming"])
 
 
 # WebSocket endpoint
 @app.websocket("/ws/{client_id}")
-async def websocket_endpoint(websocket, client_id: str) -> None:
+async def websocket_endpoint(websocket: WebSocket, client_id: str) -> None:
     """WebSocket endpoint for real-time updates"""
     await websocket_manager.connect(websocket, client_id)
     try:
         while True:
             data = await websocket.receive_text()
+            websocket_manager.touch(client_id)
+            if await websocket_manager.handle_client_message(client_id, data):
+                continue
+
             # Echo back for now, or handle specific messages
             await websocket_manager.send_personal_message(
                 f"Message received: {data}", client_id
@@ -137,5 +169,7 @@ if __name__ == "__main__":
         host="0.0.0.0",
         port=8000,
         reload=True,
-        log_level="info"
+        log_level="info",
+        ws_ping_interval=settings.WS_PING_INTERVAL,
+        ws_ping_timeout=settings.WS_PING_TIMEOUT
     )
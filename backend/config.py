@@ -37,6 +37,36 @@ class Settings(BaseSettings):
     # Redis (for future use)
     REDIS_URL: str = "redis://localhost:6379/0"
 
+    # WebSocket pub/sub (memory, unix or redis)
+    WS_PUBSUB_BACKEND: str = "memory"
+    WS_PUBSUB_SOCKET_PATH: str = "/tmp/polygrand-ws.sock"
+    WS_PUBSUB_CHANNEL: str = "polygrand:ws"
+    WS_PUBSUB_BATCH_SIZE: int = 100
+    WS_PUBSUB_FLUSH_INTERVAL_MS: int = 5
+
+    # WebSocket liveness (seconds)
+    WS_PING_INTERVAL: float = 20.0  # Protocol-level ping frames (uvicorn)
+    WS_PING_TIMEOUT: float = 20.0
+    WS_HEARTBEAT_INTERVAL: float = 20.0  # Application-level {"type": "ping"}
+    WS_IDLE_TIMEOUT: float = 60.0
+    WS_SEND_TIMEOUT: float = 5.0
+
+    # Server-Sent Events
+    SSE_HISTORY_SIZE: int = 1000  # Events kept for Last-Event-ID resume
+    SSE_QUEUE_SIZE: int = 256  # Per-listener backlog before it is dropped
+    SSE_KEEPALIVE_SECONDS: float = 15.0
+    SSE_RETRY_MS: int = 3000  # Reconnect delay advertised to clients
+
+    # Reward payouts
+    PAYOUTS_ENABLED: bool = False  # Send real Algorand payments (mock txids otherwise)
+    PAYOUT_GROUP_SIZE: int = 16  # Payments per atomic group (Algorand max is 16)
+    PAYOUT_FLUSH_INTERVAL_MS: int = 50  # Wait for a group to fill before sending
+    PAYOUT_RECONCILE_INTERVAL_SECONDS: float = 10.0  # Re-check groups whose confirmation timed out
+
+    # Stake reasoning storage
+    REASONING_COLD_DIR: str = "data/reasoning"  # Compressed texts of resolved stakes
+    REASONING_CACHE_SIZE: int = 1024  # Cold texts kept in memory after a read
+
     # Security
     SECRET_KEY: str = "change-this-in-production"
     ALGORITHM: str = "HS256"
@@ -54,6 +84,17 @@ class Settings(BaseSettings):
     # AI Settings
     AI_MODEL_ENABLED: bool = True
     AI_PREDICTION_THRESHOLD: float = 0.7
+    AI_INFERENCE_WORKERS: int = 2  # Inference processes (0 runs batches in a thread)
+    AI_INFERENCE_BATCH_SIZE: int = 32  # Max predictions per batch
+    AI_INFERENCE_BATCH_TIMEOUT_MS: int = 10  # Wait for a batch to fill before running it
+    AI_REFRESH_INTERVAL_SECONDS: float = 5.0  # How often stale predictions are refreshed
+    AI_REFRESH_MAX_PER_MINUTE: int = 600  # Global budget for background refreshes
+    AI_REFRESH_MAX_UPDATES: int = 10  # Trades and stakes before a prediction is stale
+    AI_REFRESH_MIN_AGE_SECONDS: float = 60.0  # Staleness budget for markets about to end
+    AI_REFRESH_MAX_AGE_SECONDS: float = 3600.0  # Staleness budget for long-running markets
+    AI_PREDICTION_CACHE_SIZE: int = 10_000  # Markets with a cached prediction
+    AI_PREDICTION_TTL_SECONDS: float = 300.0  # Max age of a cached prediction
+    CROWD_FORECAST_REPUTATION_WEIGHTED: bool = False  # Weight crowd forecast stakes by staker reputation
 
     class Config:
         env_file = ".env"
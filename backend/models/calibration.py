@@ -0,0 +1,158 @@
+"""Per-staker calibration aggregates"""
+
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from models.leaderboard import Leaderboard
+from models.participant_registry import ParticipantRegistry
+
+RELIABILITY_BINS = 10
+
+# Brier skill (1 - Brier) of always answering 0.5; reputations start here
+NEUTRAL_SKILL = 0.75
+
+
+class CalibrationBook:
+    """Running calibration statistics for every staker
+
+    Each staker gets a dense id and a row in fixed-width arrays: resolved
+    stake count, summed Brier score, correct and total amounts, and a
+    reliability histogram of confidence against outcome. Settlement folds a
+    whole market in with a few np.add.at calls; nothing is replayed later.
+
+    Reputation is the mean Brier skill (1 - Brier), shrunk toward the skill of
+    a coin flip by ``prior_stakes`` pseudo-observations so a handful of lucky
+    stakes cannot top the rankings.
+    """
+
+    def __init__(self, prior_stakes: float = 10.0, capacity: int = 64) -> None:
+        self.prior_stakes = prior_stakes
+        self.stakers = ParticipantRegistry()
+        self.resolved = np.zeros(capacity, dtype=np.int64)
+        self.correct = np.zeros(capacity, dtype=np.int64)
+        self.brier_sum = np.zeros(capacity, dtype=np.float64)
+        self.amount_total = np.zeros(capacity, dtype=np.float64)
+        self.amount_correct = np.zeros(capacity, dtype=np.float64)
+        self.bin_count = np.zeros((capacity, RELIABILITY_BINS), dtype=np.int64)
+        self.bin_correct = np.zeros((capacity, RELIABILITY_BINS), dtype=np.int64)
+        self.bin_confidence = np.zeros((capacity, RELIABILITY_BINS), dtype=np.float64)
+        self.rankings = Leaderboard()  # staker_id -> reputation
+
+    def staker_id(self, address: str) -> int:
+        """Get or assign a staker's dense id"""
+        staker_id = self.stakers.add(address)
+        if staker_id >= len(self.resolved):
+            self._grow(2 * len(self.resolved))
+        return staker_id
+
+    def _grow(self, capacity: int) -> None:
+        """Resize every per-staker array"""
+        for name in (
+            "resolved", "correct", "brier_sum", "amount_total", "amount_correct",
+            "bin_count", "bin_correct", "bin_confidence"
+        ):
+            old = getattr(self, name)
+            new = np.zeros((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:len(old)] = old
+            setattr(self, name, new)
+
+    def record(
+        self,
+        staker_ids: np.ndarray,
+        confidences: np.ndarray,
+        correct: np.ndarray,
+        amounts: np.ndarray
+    ) -> None:
+        """
+        Fold a batch of settled stakes into the aggregates
+
+        Args:
+            staker_ids: Staker id per stake
+            confidences: Stated probability of the staked outcome per stake
+            correct: Whether each stake's outcome won
+            amounts: Amount per stake
+        """
+        if len(staker_ids) == 0:
+            return
+
+        hits = correct.astype(np.float64)
+        bins = np.minimum((confidences * RELIABILITY_BINS).astype(np.intp), RELIABILITY_BINS - 1)
+
+        np.add.at(self.resolved, staker_ids, 1)
+        np.add.at(self.correct, staker_ids, correct.astype(np.int64))
+        np.add.at(self.brier_sum, staker_ids, (confidences - hits) ** 2)
+        np.add.at(self.amount_total, staker_ids, amounts)
+        np.add.at(self.amount_correct, staker_ids, amounts * hits)
+        np.add.at(self.bin_count, (staker_ids, bins), 1)
+        np.add.at(self.bin_correct, (staker_ids, bins), correct.astype(np.int64))
+        np.add.at(self.bin_confidence, (staker_ids, bins), confidences)
+
+        updated = np.unique(staker_ids)
+        for staker_id, score in zip(updated.tolist(), self.reputations(updated).tolist()):
+            self.rankings.set_score(staker_id, score)
+
+    def reputations(self, staker_ids: np.ndarray) -> np.ndarray:
+        """Shrunk Brier skill for a set of stakers"""
+        resolved = self.resolved[staker_ids]
+        skill_sum = resolved - self.brier_sum[staker_ids]
+        return (skill_sum + self.prior_stakes * NEUTRAL_SKILL) / (resolved + self.prior_stakes)
+
+    def reputation_of(self, address: str) -> float:
+        """Reputation of a staker (neutral if they have no resolved stakes)"""
+        staker_id = self.stakers.id_of(address)
+        if staker_id is None:
+            return NEUTRAL_SKILL
+        return float(self.reputations(np.array([staker_id]))[0])
+
+    def get_stats(self, address: str) -> Optional[Dict]:
+        """
+        Calibration summary for a staker
+
+        Args:
+            address: Staker address
+
+        Returns:
+            Statistics, or None for unknown stakers
+        """
+        staker_id = self.stakers.id_of(address)
+        if staker_id is None:
+            return None
+
+        resolved = int(self.resolved[staker_id])
+        amount_total = float(self.amount_total[staker_id])
+        reliability = []
+        for b in range(RELIABILITY_BINS):
+            count = int(self.bin_count[staker_id, b])
+            reliability.append({
+                "confidence_range": [b / RELIABILITY_BINS, (b + 1) / RELIABILITY_BINS],
+                "count": count,
+                "mean_confidence": float(self.bin_confidence[staker_id, b]) / count if count else None,
+                "observed_frequency": int(self.bin_correct[staker_id, b]) / count if count else None
+            })
+
+        return {
+            "address": address,
+            "resolved_stakes": resolved,
+            "correct_stakes": int(self.correct[staker_id]),
+            "brier_score": float(self.brier_sum[staker_id]) / resolved if resolved else None,
+            "accuracy": int(self.correct[staker_id]) / resolved if resolved else None,
+            "stake_weighted_accuracy": (
+                float(self.amount_correct[staker_id]) / amount_total if amount_total else None
+            ),
+            "reputation": self.reputation_of(address),
+            "rank": self.rankings.rank_of(staker_id),
+            "reliability": reliability
+        }
+
+    def top(self, k: int) -> List[Dict]:
+        """Top-k stakers by reputation"""
+        return [
+            {
+                "rank": idx + 1,
+                "address": self.stakers.address_of(staker_id),
+                "reputation": reputation,
+                "resolved_stakes": int(self.resolved[staker_id])
+            }
+            for idx, (staker_id, reputation) in enumerate(self.rankings.page(0, k))
+        ]
@@ -0,0 +1,65 @@
+"""Running crowd forecast built from insight stakes"""
+
+from typing import Dict, List, Optional
+
+import numpy as np
+
+
+class CrowdForecast:
+    """Amount- and confidence-weighted probability over a market's outcomes
+
+    Each stake is read as a forecast putting its confidence on the staked
+    outcome and spreading the rest evenly over the other outcomes, weighted by
+    its amount (and optionally by the staker's reputation). Per outcome only
+    the weighted confidence and weighted doubt of its stakes are kept, so a
+    stake is folded in with O(1) work and the distribution is read in
+    O(outcomes).
+    """
+
+    def __init__(self, outcomes: List[str]) -> None:
+        self.outcomes = outcomes
+        self.index = {outcome: idx for idx, outcome in enumerate(outcomes)}
+        self.num_stakes = 0
+        # [plain, reputation-weighted] x outcome
+        self._weight = np.zeros(2, dtype=np.float64)
+        self._confidence = np.zeros((2, len(outcomes)), dtype=np.float64)  # sum w * confidence
+        self._doubt = np.zeros((2, len(outcomes)), dtype=np.float64)  # sum w * (1 - confidence)
+
+    def add(self, outcome: str, amount: float, confidence: float, reputation: float = 1.0) -> None:
+        """
+        Fold a stake into the forecast
+
+        Args:
+            outcome: Staked outcome
+            amount: Amount staked
+            confidence: Stated probability of the staked outcome
+            reputation: Staker's reputation when staking
+        """
+        idx = self.index.get(outcome)
+        if idx is None:
+            return
+
+        weights = np.array([amount, amount * reputation])
+        self.num_stakes += 1
+        self._weight += weights
+        self._confidence[:, idx] += weights * confidence
+        self._doubt[:, idx] += weights * (1.0 - confidence)
+
+    def distribution(self, reputation_weighted: bool = False) -> Optional[Dict[str, float]]:
+        """
+        Current crowd probabilities
+
+        Args:
+            reputation_weighted: Weight stakes by staker reputation as well
+
+        Returns:
+            Outcome probabilities, or None before the first stake
+        """
+        w = int(reputation_weighted)
+        if self._weight[w] <= 0:
+            return None
+
+        others = max(len(self.outcomes) - 1, 1)
+        doubt = self._doubt[w]
+        probs = (self._confidence[w] + (doubt.sum() - doubt) / others) / self._weight[w]
+        return {outcome: float(p) for outcome, p in zip(self.outcomes, probs)}
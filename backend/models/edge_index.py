@@ -0,0 +1,91 @@
+"""Dense AI probability and price arrays for scanning trading edges"""
+
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from models.market import Market, MarketStatus
+
+# Matches the outcome limit of CreateMarketRequest
+MAX_OUTCOMES = 10
+
+
+class EdgeIndex:
+    """AI probabilities and market prices of every market, row-aligned
+
+    Each market owns one row of two (markets x MAX_OUTCOMES) matrices; unused
+    outcome slots and markets without a prediction hold NaN. Rows are updated
+    in place on trades and prediction refreshes, so finding the best edges is
+    a handful of array operations over all markets plus an argpartition.
+    """
+
+    def __init__(self, capacity: int = 1024) -> None:
+        self.market_ids: List[str] = []  # row -> market_id
+        self.rows: Dict[str, int] = {}  # market_id -> row
+        self._prices = np.full((capacity, MAX_OUTCOMES), np.nan)
+        self._ai = np.full((capacity, MAX_OUTCOMES), np.nan)
+        self._active = np.zeros(capacity, dtype=bool)
+
+    def __len__(self) -> int:
+        return len(self.market_ids)
+
+    def _row(self, market_id: str) -> int:
+        """Get or assign a market's row"""
+        row = self.rows.get(market_id)
+        if row is not None:
+            return row
+
+        row = self.rows[market_id] = len(self.market_ids)
+        self.market_ids.append(market_id)
+        if row == len(self._active):
+            self._prices = np.vstack([self._prices, np.full_like(self._prices, np.nan)])
+            self._ai = np.vstack([self._ai, np.full_like(self._ai, np.nan)])
+            self._active = np.concatenate([self._active, np.zeros(row, dtype=bool)])
+        return row
+
+    def update_market(self, market: Market) -> None:
+        """Sync a market's prices and status"""
+        row = self._row(market.id)
+        self._prices[row, :len(market.outcomes)] = [market.prices[o] for o in market.outcomes]
+        self._active[row] = market.status == MarketStatus.ACTIVE
+
+    def set_prediction(self, market: Market, prediction: Dict[str, float]) -> None:
+        """Store a market's latest AI probabilities"""
+        row = self._row(market.id)
+        self._ai[row, :len(market.outcomes)] = [prediction.get(o, np.nan) for o in market.outcomes]
+
+    def top_edges(self, k: int, min_edge: float = 0.0) -> Tuple[List[Tuple[str, int, float]], int]:
+        """
+        Best trading edge per active market, largest first
+
+        Args:
+            k: Number of markets to return
+            min_edge: Smallest absolute edge worth reporting
+
+        Returns:
+            ([(market_id, outcome index, edge)], number of active markets scanned)
+        """
+        n = len(self)
+        active = self._active[:n]
+        if k <= 0 or not active.any():
+            return [], int(active.sum())
+
+        edges = self._ai[:n] - self._prices[:n]
+        magnitude = np.abs(edges)
+        magnitude[np.isnan(magnitude) | ~active[:, None]] = -1.0
+        best_outcome = magnitude.argmax(axis=1)
+        best = magnitude[np.arange(n), best_outcome]
+
+        candidates = np.flatnonzero(best > min_edge)
+        if len(candidates) > k:
+            candidates = candidates[np.argpartition(-best[candidates], k - 1)[:k]]
+        candidates = candidates[np.argsort(-best[candidates], kind="stable")]
+
+        return [
+            (
+                self.market_ids[i],
+                int(best_outcome[i]),
+                float(edges[i, best_outcome[i]])
+            )
+            for i in candidates
+        ], int(active.sum())
@@ -0,0 +1,204 @@
+"""Incrementally maintained per-market features for AI models"""
+
+import hashlib
+import time
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from models.edge_index import MAX_OUTCOMES
+from models.market import Market
+from models.stake import Stake
+from models.trade import Trade
+from utils.dates import epoch_seconds
+
+# EWMA time constants in seconds, from short-term to long-term
+WINDOWS: Tuple[Tuple[str, float], ...] = (("1m", 60.0), ("1h", 3600.0), ("1d", 86400.0))
+
+FEATURE_NAMES: List[str] = [
+    f"{feature}_{label}"
+    for label, _ in WINDOWS
+    for feature in ("volume_velocity", "price_momentum", "price_volatility")
+] + ["price", "unique_traders", "stake_imbalance", "hours_to_expiry"]
+
+# Unique traders over the last day, in a ring of TRADER_BUCKETS buckets
+TRADER_BUCKET_SECONDS = 6 * 3600
+TRADER_BUCKETS = 4
+
+# HyperLogLog registers per bucket (2 ** precision), ~9% standard error
+HLL_PRECISION = 7
+HLL_REGISTERS = 1 << HLL_PRECISION
+HLL_ALPHA = 0.7213 / (1 + 1.079 / HLL_REGISTERS)
+
+
+def _trader_register(address: str) -> Tuple[int, int]:
+    """HyperLogLog register and rank (position of the first set bit) of an address"""
+    hashed = int.from_bytes(hashlib.blake2b(address.encode(), digest_size=8).digest(), "little")
+    register = hashed & (HLL_REGISTERS - 1)
+    rest = hashed >> HLL_PRECISION
+    return register, 64 - HLL_PRECISION - rest.bit_length() + 1
+
+
+def _estimate_distinct(registers: np.ndarray) -> np.ndarray:
+    """HyperLogLog estimates for rows of registers, linear counting when small"""
+    raw = HLL_ALPHA * HLL_REGISTERS ** 2 / np.exp2(-registers.astype(np.float64)).sum(axis=1)
+    empty = (registers == 0).sum(axis=1)
+    linear = HLL_REGISTERS * np.log(HLL_REGISTERS / np.maximum(empty, 1))
+    return np.where((raw <= 2.5 * HLL_REGISTERS) & (empty > 0), linear, raw)
+
+
+class FeatureStore:
+    """Per-market trading and staking features in fixed-width arrays
+
+    Each market owns one row. Trades update exponentially weighted volume
+    rates, price means and squared price changes for every window in
+    ``WINDOWS`` in O(windows); stakes update per-outcome staked amounts. The
+    tracked price is that of the market's first outcome (Yes for binary
+    markets). Reading decays the rates to the present, so a market's feature
+    vector is O(1) and a matrix over many markets is a few array operations.
+
+    Unique traders are counted over the last day with a HyperLogLog sketch
+    per ring bucket, so memory per market is fixed however many addresses
+    trade it; buckets are cleared as the ring advances over them.
+    """
+
+    def __init__(self, capacity: int = 1024) -> None:
+        self.market_ids: List[str] = []  # row -> market_id
+        self.rows: Dict[str, int] = {}  # market_id -> row
+        self.tau = np.array([seconds for _, seconds in WINDOWS])
+        windows = len(WINDOWS)
+        self._last_trade = np.zeros(capacity)  # epoch seconds
+        self._end_time = np.zeros(capacity)  # epoch seconds
+        self._price = np.zeros(capacity)
+        self._trader_head = np.full(capacity, -1, dtype=np.int64)  # newest trader bucket number
+        self._trader_registers = np.zeros((capacity, TRADER_BUCKETS, HLL_REGISTERS), dtype=np.uint8)
+        self._volume_rate = np.zeros((capacity, windows))  # ALGO per second
+        self._price_mean = np.zeros((capacity, windows))
+        self._price_var = np.zeros((capacity, windows))  # of price changes
+        self._staked = np.zeros((capacity, MAX_OUTCOMES))
+
+    def __len__(self) -> int:
+        return len(self.market_ids)
+
+    def _row(self, market_id: str) -> int:
+        """Get or assign a market's row"""
+        row = self.rows.get(market_id)
+        if row is not None:
+            return row
+
+        row = self.rows[market_id] = len(self.market_ids)
+        self.market_ids.append(market_id)
+        if row == len(self._price):
+            for name in (
+                "_last_trade", "_end_time", "_price", "_trader_registers",
+                "_volume_rate", "_price_mean", "_price_var", "_staked"
+            ):
+                column = getattr(self, name)
+                setattr(self, name, np.concatenate([column, np.zeros_like(column)]))
+            self._trader_head = np.concatenate([self._trader_head, np.full(row, -1, dtype=np.int64)])
+        return row
+
+    def add_market(self, market: Market) -> None:
+        """Register a market with its current price"""
+        row = self._row(market.id)
+        price = market.prices[market.outcomes[0]]
+        self._end_time[row] = epoch_seconds(market.end_time)
+        self._price[row] = price
+        self._price_mean[row] = price
+        self._last_trade[row] = epoch_seconds(market.created_at)
+
+    def record_trade(self, market: Market, trade: Trade) -> None:
+        """
+        Fold a trade into the market's features
+
+        Args:
+            market: Market with prices already updated by the trade
+            trade: The trade
+        """
+        row = self._row(market.id)
+        now = epoch_seconds(trade.created_at)
+        decay = np.exp(-max(now - self._last_trade[row], 0.0) / self.tau)
+
+        price = market.prices[market.outcomes[0]]
+        change = price - self._price[row]
+        self._volume_rate[row] = self._volume_rate[row] * decay + trade.amount / self.tau
+        self._price_mean[row] += (1 - decay) * (price - self._price_mean[row])
+        self._price_var[row] = self._price_var[row] * decay + (1 - decay) * change ** 2
+        self._price[row] = price
+        self._last_trade[row] = now
+
+        self._record_trader(row, trade.trader_address, now)
+
+    def _record_trader(self, row: int, address: str, now: float) -> None:
+        """Add a trader to the current bucket's sketch"""
+        bucket = int(now // TRADER_BUCKET_SECONDS)
+        head = int(self._trader_head[row])
+        if bucket > head:
+            # Clear the buckets the ring advances over
+            for skipped in range(max(head + 1, bucket - TRADER_BUCKETS + 1), bucket + 1):
+                self._trader_registers[row, skipped % TRADER_BUCKETS] = 0
+            self._trader_head[row] = bucket
+        elif bucket <= head - TRADER_BUCKETS:
+            return  # Older than the window
+
+        register, rank = _trader_register(address)
+        registers = self._trader_registers[row, bucket % TRADER_BUCKETS]
+        registers[register] = max(registers[register], rank)
+
+    def _unique_traders(self, rows: np.ndarray, now: float) -> np.ndarray:
+        """Estimated distinct traders over the live buckets of each row"""
+        heads = self._trader_head[rows][:, None]
+        slots = np.arange(TRADER_BUCKETS)
+        numbers = heads - (heads - slots) % TRADER_BUCKETS  # Bucket number held by each slot
+        live = (numbers > int(now // TRADER_BUCKET_SECONDS) - TRADER_BUCKETS) & (heads >= 0)
+        merged = (self._trader_registers[rows] * live[:, :, None]).max(axis=1)
+        return _estimate_distinct(merged)
+
+    def record_stake(self, market: Market, stake: Stake) -> None:
+        """Fold a stake into the market's staked amounts"""
+        row = self._row(market.id)
+        if stake.outcome in market.outcomes:
+            self._staked[row, market.outcomes.index(stake.outcome)] += stake.amount
+
+    def matrix(self, market_ids: List[str], now: Optional[float] = None) -> np.ndarray:
+        """
+        Feature vectors of several markets, one row each
+
+        Args:
+            market_ids: Registered markets
+            now: Epoch seconds to evaluate at (defaults to the current time)
+
+        Returns:
+            (len(market_ids), len(FEATURE_NAMES)) array, columns in FEATURE_NAMES order
+        """
+        now = time.time() if now is None else now
+        rows = np.array([self.rows[market_id] for market_id in market_ids], dtype=np.intp)
+
+        idle = np.maximum(now - self._last_trade[rows], 0.0)[:, None]
+        velocity = self._volume_rate[rows] * np.exp(-idle / self.tau)
+        momentum = self._price[rows][:, None] - self._price_mean[rows]
+        volatility = np.sqrt(self._price_var[rows])
+
+        staked = self._staked[rows]
+        total = staked.sum(axis=1)
+        top_two = -np.partition(-staked, 1, axis=1)[:, :2]
+        imbalance = np.divide(
+            top_two[:, 0] - top_two[:, 1], total, out=np.zeros(len(rows)), where=total > 0
+        )
+
+        per_window = np.stack([velocity, momentum, volatility], axis=2).reshape(len(rows), -1)
+        return np.column_stack([
+            per_window,
+            self._price[rows],
+            self._unique_traders(rows, now),
+            imbalance,
+            (self._end_time[rows] - now) / 3600
+        ])
+
+    def vector(self, market_id: str, now: Optional[float] = None) -> np.ndarray:
+        """Feature vector of one market"""
+        return self.matrix([market_id], now)[0]
+
+    def as_dict(self, market_id: str, now: Optional[float] = None) -> Dict[str, float]:
+        """Named features of one market"""
+        return dict(zip(FEATURE_NAMES, self.vector(market_id, now).tolist()))
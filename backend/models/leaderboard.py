@@ -0,0 +1,65 @@
+"""Leaderboard model"""
+
+from itertools import islice
+from typing import Dict, List, Optional, Tuple
+
+from sortedcontainers import SortedList
+
+LeaderboardKey = Tuple[int, float, int]  # (-stage, -score, participant_id)
+
+
+class Leaderboard:
+    """Order-statistics ranking of participant scores
+
+    Entries are keyed by (-stage, -score, participant_id), so participants
+    who reached a later stage (e.g. survived more battle royale rounds) rank
+    first, higher scores rank first within a stage, and ties keep join order.
+    Updates, rank lookups and page seeks are O(log n).
+    """
+
+    def __init__(self) -> None:
+        self._entries = SortedList()
+        self._keys: Dict[int, LeaderboardKey] = {}  # participant_id -> entry
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, participant_id: int) -> bool:
+        return participant_id in self._keys
+
+    def set_score(self, participant_id: int, score: float, stage: int = 0) -> None:
+        """Insert or move a participant"""
+        key = (-stage, -score, participant_id)
+        old_key = self._keys.get(participant_id)
+        if old_key == key:
+            return
+        if old_key is not None:
+            self._entries.remove(old_key)
+
+        self._entries.add(key)
+        self._keys[participant_id] = key
+
+    def get_score(self, participant_id: int) -> Optional[float]:
+        """Get a participant's score"""
+        key = self._keys.get(participant_id)
+        return None if key is None else -key[1]
+
+    def rank_of(self, participant_id: int) -> Optional[int]:
+        """Get a participant's 1-based rank"""
+        key = self._keys.get(participant_id)
+        if key is None:
+            return None
+        return self._entries.index(key) + 1
+
+    def page(self, offset: int = 0, limit: int = 100) -> List[Tuple[int, float]]:
+        """Get (participant_id, score) pairs ranked offset+1 .. offset+limit"""
+        return [
+            (participant_id, -neg_score)
+            for _, neg_score, participant_id in islice(
+                self._entries.islice(offset, offset + limit), limit
+            )
+        ]
+
+    def top(self, k: int) -> List[int]:
+        """Get the ids of the k highest ranked participants"""
+        return [participant_id for participant_id, _ in self.page(0, k)]
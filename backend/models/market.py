@@ -4,6 +4,9 @@ from datetime import datetime
 from enum import Enum
 from typing import Optional, Dict, List
 
+from config import settings
+from models.crowd_forecast import CrowdForecast
+
 
 class MarketStatus(str, Enum):
     """Market status enum"""
@@ -45,6 +48,9 @@ class Market:
         self.resolved_outcome: Optional[str] = None
         self.resolved_at: Optional[datetime] = None
 
+        # Bumped on every change that affects AI predictions
+        self.version = 0
+
         # Financial data
         self.total_liquidity = 0.0
         self.total_volume = 0.0
@@ -63,8 +69,16 @@ class Market:
 
         # Staking data
         self.total_staked_insights = 0
+        self.crowd = CrowdForecast(outcomes)  # Maintained by storage as stakes arrive
         self.ai_prediction: Optional[Dict[str, float]] = None
 
+    @property
+    def crowd_forecast(self) -> Optional[Dict[str, float]]:
+        """Stake-weighted crowd probabilities (None before the first stake)"""
+        return self.crowd.distribution(
+            reputation_weighted=settings.CROWD_FORECAST_REPUTATION_WEIGHTED
+        )
+
     def to_dict(self) -> dict:
         """Convert to dictionary"""
         return {
@@ -88,5 +102,6 @@ class Market:
             "prices": self.prices,
             "volumes": self.volumes,
             "total_staked_insights": self.total_staked_insights,
+            "crowd_forecast": self.crowd_forecast,
             "ai_prediction": self.ai_prediction
         }
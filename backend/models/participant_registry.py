@@ -0,0 +1,41 @@
+"""Participant registry model"""
+
+from typing import Dict, Iterator, List, Optional
+
+
+class ParticipantRegistry:
+    """Participant addresses with dense integer ids assigned in join order"""
+
+    def __init__(self) -> None:
+        self.ids: Dict[str, int] = {}  # address -> participant_id
+        self.addresses: List[str] = []  # participant_id -> address
+
+    def __contains__(self, address: str) -> bool:
+        return address in self.ids
+
+    def __len__(self) -> int:
+        return len(self.addresses)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.addresses)
+
+    def add(self, address: str) -> int:
+        """Register an address and return its participant id"""
+        participant_id = self.ids.get(address)
+        if participant_id is None:
+            participant_id = len(self.addresses)
+            self.ids[address] = participant_id
+            self.addresses.append(address)
+        return participant_id
+
+    def id_of(self, address: str) -> Optional[int]:
+        """Get the participant id for an address"""
+        return self.ids.get(address)
+
+    def address_of(self, participant_id: int) -> str:
+        """Get the address for a participant id"""
+        return self.addresses[participant_id]
+
+    def to_list(self) -> List[str]:
+        """Addresses in join order"""
+        return list(self.addresses)
@@ -0,0 +1,38 @@
+"""Payout structure model"""
+
+from enum import Enum
+from typing import List, Optional
+
+
+class PayoutCurve(str, Enum):
+    """How a tournament prize pool is spread over the final ranking"""
+    TOP_K = "top_k"  # Fixed percentages for the top places
+    GEOMETRIC = "geometric"  # Each paid place gets ratio x the place above
+    TOP_PERCENT = "top_percent"  # Equal shares for the top X% of the field
+
+
+class PayoutStructure:
+    """Payout curve and its parameters"""
+
+    def __init__(
+        self,
+        curve: PayoutCurve = PayoutCurve.TOP_K,
+        percentages: Optional[List[float]] = None,
+        ratio: float = 0.7,
+        places: int = 10,
+        top_percent: float = 10.0
+    ):
+        self.curve = curve
+        self.percentages = percentages or [50.0, 30.0, 20.0]  # top_k
+        self.ratio = ratio  # geometric
+        self.places = places  # geometric
+        self.top_percent = top_percent  # top_percent
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary with only the active curve's parameters"""
+        params = {
+            PayoutCurve.TOP_K: {"percentages": self.percentages},
+            PayoutCurve.GEOMETRIC: {"ratio": self.ratio, "places": self.places},
+            PayoutCurve.TOP_PERCENT: {"top_percent": self.top_percent},
+        }[self.curve]
+        return {"curve": self.curve.value, **params}
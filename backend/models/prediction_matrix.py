@@ -0,0 +1,230 @@
+"""Prediction matrix model for tournament picks"""
+
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+NO_PREDICTION = -1
+
+Forecast = Union[str, Dict[str, float]]  # outcome pick or outcome -> probability
+
+
+class PredictionMatrix:
+    """Participant-by-market matrix of predicted outcome indices
+
+    Row i holds participant i's picks, column j the picks for market j.
+    Cells are int8 outcome indices into the market's outcome list, or
+    NO_PREDICTION. Rows grow by doubling as participants join.
+
+    Probabilistic matrices also keep a float32 (participant, market, outcome)
+    tensor of forecast distributions; a pick is stored as a one-hot
+    distribution and a missing forecast as NaN.
+    """
+
+    def __init__(
+        self,
+        market_ids: List[str],
+        market_outcomes: Dict[str, List[str]],
+        capacity: int = 16,
+        probabilistic: bool = False
+    ) -> None:
+        self.market_ids = list(market_ids)
+        self.market_index: Dict[str, int] = {m: j for j, m in enumerate(self.market_ids)}
+        self.outcome_names: List[List[str]] = [
+            list(market_outcomes.get(m, [])) for m in self.market_ids
+        ]
+        self.outcome_index: List[Dict[str, int]] = [
+            {outcome: k for k, outcome in enumerate(names)} for names in self.outcome_names
+        ]
+
+        self.picks = np.full((capacity, len(self.market_ids)), NO_PREDICTION, dtype=np.int8)
+        self.submitted = np.zeros(capacity, dtype=bool)  # Row has a submission
+        self.rows = 0
+
+        # Forecast distributions, padded to the widest market
+        self.max_outcomes = max((len(names) for names in self.outcome_names), default=1)
+        self.uniform = np.zeros((len(self.market_ids), self.max_outcomes), dtype=np.float32)
+        for j, names in enumerate(self.outcome_names):
+            if names:
+                self.uniform[j, :len(names)] = 1.0 / len(names)
+        self.probabilities: Optional[np.ndarray] = (
+            self._empty_probabilities(capacity) if probabilistic else None
+        )
+
+    @property
+    def probabilistic(self) -> bool:
+        """Whether forecast distributions are stored"""
+        return self.probabilities is not None
+
+    def _empty_probabilities(self, capacity: int) -> np.ndarray:
+        """Allocate a forecast tensor with no forecasts"""
+        return np.full(
+            (capacity, len(self.market_ids), self.max_outcomes), np.nan, dtype=np.float32
+        )
+
+    def ensure_rows(self, rows: int) -> None:
+        """Make room for at least `rows` participants"""
+        if rows > len(self.picks):
+            capacity = max(rows, 2 * len(self.picks))
+            picks = np.full((capacity, len(self.market_ids)), NO_PREDICTION, dtype=np.int8)
+            picks[:self.rows] = self.picks[:self.rows]
+            submitted = np.zeros(capacity, dtype=bool)
+            submitted[:self.rows] = self.submitted[:self.rows]
+            self.picks, self.submitted = picks, submitted
+            if self.probabilistic:
+                probabilities = self._empty_probabilities(capacity)
+                probabilities[:self.rows] = self.probabilities[:self.rows]
+                self.probabilities = probabilities
+        self.rows = max(self.rows, rows)
+
+    def encode(self, market_id: str, outcome: str) -> Optional[int]:
+        """Get the outcome index for a market's outcome"""
+        column = self.market_index.get(market_id)
+        if column is None:
+            return None
+        return self.outcome_index[column].get(outcome)
+
+    def validation_error(self, predictions: Dict[str, Forecast]) -> Optional[str]:
+        """
+        Check forecasts against the tournament's markets and outcomes
+
+        Args:
+            predictions: market_id -> outcome, or market_id -> {outcome: probability}
+
+        Returns:
+            Error message, or None if every forecast is valid
+        """
+        for market_id, forecast in predictions.items():
+            column = self.market_index.get(market_id)
+            if column is None:
+                return f"Market {market_id} is not part of this tournament"
+
+            outcomes = [forecast] if isinstance(forecast, str) else forecast.keys()
+            for outcome in outcomes:
+                if outcome not in self.outcome_index[column]:
+                    return f"Invalid outcome {outcome} for market {market_id}"
+        return None
+
+    def set_row(self, row: int, predictions: Dict[str, Forecast]) -> None:
+        """
+        Merge forecasts into a participant's row
+
+        Markets missing from `predictions` keep their earlier forecasts, so
+        submitting one round's forecasts leaves other rounds untouched.
+
+        Args:
+            row: Participant id
+            predictions: market_id -> outcome, or market_id -> {outcome: probability}
+        """
+        self.ensure_rows(row + 1)
+        for market_id, forecast in predictions.items():
+            column = self.market_index[market_id]
+            distribution = self.distribution(market_id, forecast)
+            self.picks[row, column] = int(np.argmax(distribution))
+            if self.probabilistic:
+                self.probabilities[row, column] = distribution
+
+        self.submitted[row] = True
+
+    def distribution(self, market_id: str, forecast: Forecast) -> np.ndarray:
+        """Convert a pick or probability map into a normalized outcome vector"""
+        column = self.market_index[market_id]
+        vector = np.zeros(self.max_outcomes, dtype=np.float32)
+        if isinstance(forecast, str):
+            vector[self.outcome_index[column][forecast]] = 1.0
+            return vector
+
+        for outcome, probability in forecast.items():
+            vector[self.outcome_index[column][outcome]] = probability
+        total = vector.sum(dtype=np.float64)
+        return vector / total if total > 0 else self.uniform[column].copy()
+
+    def get_forecasts(self, row: int) -> Dict[str, Dict[str, float]]:
+        """Decode a participant's forecast distributions"""
+        if not self.probabilistic:
+            return {}
+        return {
+            self.market_ids[j]: {
+                name: round(float(p), 6) for name, p in zip(self.outcome_names[j], self.probabilities[row, j])
+            }
+            for j in range(len(self.market_ids))
+            if not np.isnan(self.probabilities[row, j, 0])
+        }
+
+    def get_row(self, row: int) -> Dict[str, str]:
+        """Decode a participant's picks"""
+        return {
+            self.market_ids[j]: self.outcome_names[j][k]
+            for j, k in enumerate(self.picks[row].tolist())
+            if k != NO_PREDICTION
+        }
+
+    def has_row(self, row: int) -> bool:
+        """Whether a participant has submitted predictions"""
+        return row < self.rows and bool(self.submitted[row])
+
+    def column_hits(self, market_id: str, outcome: str) -> np.ndarray:
+        """Boolean vector of participants who picked a market's outcome"""
+        index = self.encode(market_id, outcome)
+        if index is None:
+            return np.zeros(self.rows, dtype=bool)
+        return self.picks[:self.rows, self.market_index[market_id]] == index
+
+    def score(self, resolved_outcomes: Dict[str, str], rows: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Count correct picks against resolved outcomes in one comparison
+
+        Args:
+            resolved_outcomes: market_id -> winning outcome
+            rows: Participant rows to score (all rows if None)
+
+        Returns:
+            Float vector of correct pick counts
+        """
+        picks = self.picks[:self.rows] if rows is None else self.picks[rows]
+        columns, winners = self.resolved_columns(resolved_outcomes)
+        if not columns:
+            return np.zeros(len(picks), dtype=np.float64)
+
+        return (picks[:, columns] == winners).sum(axis=1).astype(np.float64)
+
+    def resolved_columns(self, resolved_outcomes: Dict[str, str]) -> Tuple[List[int], np.ndarray]:
+        """Get the columns and winning outcome indices of resolved markets"""
+        columns, winners = [], []
+        for market_id, outcome in resolved_outcomes.items():
+            index = self.encode(market_id, outcome)
+            if index is not None:
+                columns.append(self.market_index[market_id])
+                winners.append(index)
+        return columns, np.array(winners, dtype=np.int8)
+
+    def forecasts(self, columns: List[int], rows: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Get forecast distributions for a block of the matrix
+
+        Missing forecasts are filled with the uniform distribution over the
+        market's outcomes, so abstaining never beats an honest forecast.
+
+        Args:
+            columns: Market columns
+            rows: Participant rows (all rows if None)
+
+        Returns:
+            float64 array shaped (participants, markets, outcomes)
+        """
+        probabilities = self.probabilities[:self.rows] if rows is None else self.probabilities[rows]
+        if columns == list(range(len(self.market_ids))):
+            block = probabilities.astype(np.float64)
+        else:
+            block = probabilities[:, columns].astype(np.float64)
+
+        missing = np.isnan(block)
+        np.copyto(block, np.broadcast_to(self.uniform[columns], block.shape), where=missing)
+        return block
+
+    def to_dict(self, addresses: List[str]) -> Dict[str, Dict[str, str]]:
+        """Decode every submitted row keyed by participant address"""
+        return {
+            addresses[row]: self.get_row(row)
+            for row in np.flatnonzero(self.submitted[:self.rows]).tolist()
+        }
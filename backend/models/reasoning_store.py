@@ -0,0 +1,174 @@
+"""Content-addressed storage for stake reasoning text"""
+
+import asyncio
+import hashlib
+import os
+import zlib
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Tuple
+
+from config import settings
+
+
+def reasoning_key(text: str) -> bytes:
+    """Content address of a reasoning text"""
+    return hashlib.blake2b(text.encode(), digest_size=16).digest()
+
+
+class ReasoningStore:
+    """Deduplicated reasoning texts with a compressed cold tier on disk
+
+    Identical texts share one in-memory copy, reference counted by the stakes
+    on unresolved markets that use them. When a market resolves, texts no
+    longer referenced by any open stake are appended to a zlib-compressed
+    segment file and dropped from memory. Cold texts are read back lazily
+    through a small LRU cache.
+    """
+
+    def __init__(self, directory: str, cache_size: int = 1024) -> None:
+        """Initialize store"""
+        self.directory = directory
+        self.cache_size = cache_size
+        self._hot: Dict[bytes, str] = {}  # key -> text
+        self._refs: Dict[bytes, int] = {}  # key -> open stakes using it
+        self._cold: Dict[bytes, Tuple[str, int, int]] = {}  # key -> (segment path, offset, length)
+        self._cache: "OrderedDict[bytes, str]" = OrderedDict()
+
+    def intern(self, text: str) -> bytes:
+        """
+        Store a text (or add a reference to an identical one)
+
+        Args:
+            text: Reasoning text
+
+        Returns:
+            The text's key
+        """
+        key = reasoning_key(text)
+        if key in self._refs:
+            self._refs[key] += 1
+        else:
+            self._refs[key] = 1
+        self._hot.setdefault(key, text)
+        return key
+
+    def get(self, key: bytes) -> str:
+        """
+        Get a text, loading it from its cold segment if needed
+
+        Args:
+            key: The text's key
+
+        Returns:
+            The text, or "" if its segment is missing or corrupt
+        """
+        text = self._hot.get(key)
+        if text is not None:
+            return text
+
+        text = self._cache.get(key)
+        if text is not None:
+            self._cache.move_to_end(key)
+            return text
+
+        path, offset, length = self._cold[key]
+        try:
+            with open(path, "rb") as segment:
+                segment.seek(offset)
+                text = zlib.decompress(segment.read(length)).decode()
+        except (OSError, zlib.error, UnicodeDecodeError) as e:
+            print(f"Error reading reasoning from {path}: {e}")
+            return ""
+
+        self._cache[key] = text
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return text
+
+    def release(self, keys: Iterable[bytes]) -> List[bytes]:
+        """
+        Drop references held by stakes that are being archived
+
+        Args:
+            keys: One key per archived stake
+
+        Returns:
+            Keys no open stake references any more
+        """
+        unreferenced = []
+        for key in keys:
+            refs = self._refs.get(key, 0) - 1
+            if refs > 0:
+                self._refs[key] = refs
+            elif key in self._refs:
+                del self._refs[key]
+                unreferenced.append(key)
+        return unreferenced
+
+    async def archive(self, segment: str, keys: Iterable[bytes]) -> int:
+        """
+        Move texts of resolved stakes to a compressed segment
+
+        Compression and file I/O run in a worker thread; the in-memory
+        indexes are only touched on the event loop.
+
+        Args:
+            segment: Segment name (e.g. the market id)
+            keys: Keys of the archived stakes, one per stake
+
+        Returns:
+            Number of texts moved out of memory
+        """
+        unreferenced = self.release(keys)
+        if not unreferenced:
+            return 0
+
+        # Texts already cold from an earlier segment are not written again
+        texts = [
+            (key, self._hot[key]) for key in unreferenced
+            if key in self._hot and key not in self._cold
+        ]
+        if texts:
+            path, entries = await asyncio.to_thread(self._write_segment, segment, texts)
+            for key, offset, length in entries:
+                self._cold[key] = (path, offset, length)
+
+        # Evict only texts that were not picked up again by a new stake
+        evicted = 0
+        for key in unreferenced:
+            if key in self._cold and key not in self._refs and self._hot.pop(key, None) is not None:
+                evicted += 1
+        return evicted
+
+    def _write_segment(
+        self, segment: str, texts: List[Tuple[bytes, str]]
+    ) -> Tuple[str, List[Tuple[bytes, int, int]]]:
+        """
+        Append compressed texts to a segment file
+
+        Args:
+            segment: Segment name
+            texts: (key, text) pairs
+
+        Returns:
+            Segment path and (key, offset, length) per text
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory, f"{segment}.seg")
+
+        entries = []
+        with open(path, "ab") as out:
+            offset = out.tell()
+            for key, text in texts:
+                blob = zlib.compress(text.encode())
+                out.write(blob)
+                entries.append((key, offset, len(blob)))
+                offset += len(blob)
+        return path, entries
+
+
+# Global singleton instance
+reasoning_store = ReasoningStore(
+    directory=settings.REASONING_COLD_DIR,
+    cache_size=settings.REASONING_CACHE_SIZE
+)
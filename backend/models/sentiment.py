@@ -0,0 +1,123 @@
+"""Rolling per-outcome trading windows for market sentiment"""
+
+import time
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from models.edge_index import MAX_OUTCOMES
+from models.market import Market
+from models.trade import Trade
+from utils.dates import epoch_seconds
+
+# Exponentially decayed window
+DECAY_SECONDS = 3600.0
+
+# Fixed window: the last BUCKETS buckets of BUCKET_SECONDS each (one hour)
+BUCKET_SECONDS = 300
+BUCKETS = 12
+
+
+class SentimentWindows:
+    """Recent trading volume per outcome for every market
+
+    Two views are maintained on each trade: volumes and trade counts decayed
+    with time constant ``DECAY_SECONDS``, and a ring of fixed-interval buckets
+    covering the last ``BUCKETS * BUCKET_SECONDS`` seconds. Buckets that fall
+    out of the window are cleared lazily when the ring advances, and reads
+    skip them, so a snapshot costs O(BUCKETS x outcomes) regardless of how
+    many trades a market has seen.
+    """
+
+    def __init__(self, capacity: int = 1024) -> None:
+        self.rows: Dict[str, int] = {}  # market_id -> row
+        self._last_trade = np.zeros(capacity)  # epoch seconds
+        self._decayed = np.zeros((capacity, MAX_OUTCOMES))
+        self._decayed_trades = np.zeros(capacity)
+        self._head = np.full(capacity, -1, dtype=np.int64)  # newest bucket number
+        self._buckets = np.zeros((capacity, BUCKETS, MAX_OUTCOMES))
+        self._bucket_trades = np.zeros((capacity, BUCKETS), dtype=np.int64)
+
+    def _row(self, market_id: str) -> int:
+        """Get or assign a market's row"""
+        row = self.rows.get(market_id)
+        if row is not None:
+            return row
+
+        row = self.rows[market_id] = len(self.rows)
+        if row == len(self._head):
+            for name in ("_last_trade", "_decayed", "_decayed_trades", "_buckets", "_bucket_trades"):
+                column = getattr(self, name)
+                setattr(self, name, np.concatenate([column, np.zeros_like(column)]))
+            self._head = np.concatenate([self._head, np.full(row, -1, dtype=np.int64)])
+        return row
+
+    def record_trade(self, market: Market, trade: Trade) -> None:
+        """Fold a trade into its market's windows"""
+        if trade.outcome not in market.outcomes:
+            return
+        row = self._row(market.id)
+        outcome = market.outcomes.index(trade.outcome)
+        now = epoch_seconds(trade.created_at)
+
+        decay = np.exp(-max(now - self._last_trade[row], 0.0) / DECAY_SECONDS)
+        self._decayed[row] *= decay
+        self._decayed[row, outcome] += trade.amount
+        self._decayed_trades[row] = self._decayed_trades[row] * decay + 1
+        self._last_trade[row] = max(now, self._last_trade[row])
+
+        bucket = int(now // BUCKET_SECONDS)
+        head = int(self._head[row])
+        if bucket > head:
+            # Clear the buckets the ring advances over
+            for skipped in range(max(head + 1, bucket - BUCKETS + 1), bucket + 1):
+                self._buckets[row, skipped % BUCKETS] = 0
+                self._bucket_trades[row, skipped % BUCKETS] = 0
+            self._head[row] = bucket
+        elif bucket <= head - BUCKETS:
+            return  # Older than the fixed window
+
+        self._buckets[row, bucket % BUCKETS, outcome] += trade.amount
+        self._bucket_trades[row, bucket % BUCKETS] += 1
+
+    def snapshot(self, market: Market, now: Optional[float] = None) -> Dict:
+        """
+        Recent per-outcome volumes of a market
+
+        Args:
+            market: Market to read
+            now: Epoch seconds to evaluate at (defaults to the current time)
+
+        Returns:
+            Decayed volumes and trade count, and fixed-window volumes and trade count
+        """
+        now = time.time() if now is None else now
+        outcomes: List[str] = market.outcomes
+        row = self.rows.get(market.id)
+        if row is None:
+            empty = {outcome: 0.0 for outcome in outcomes}
+            return {
+                "outcome_volumes": empty,
+                "trades": 0.0,
+                "window_seconds": BUCKETS * BUCKET_SECONDS,
+                "window_volumes": dict(empty),
+                "window_trades": 0
+            }
+
+        decay = np.exp(-max(now - self._last_trade[row], 0.0) / DECAY_SECONDS)
+        decayed = self._decayed[row, :len(outcomes)] * decay
+
+        # Bucket number held by each ring slot, and whether it is still in the window
+        head = int(self._head[row])
+        slots = np.arange(BUCKETS)
+        numbers = head - (head - slots) % BUCKETS
+        live = numbers > int(now // BUCKET_SECONDS) - BUCKETS
+        window = self._buckets[row, live, :len(outcomes)].sum(axis=0)
+
+        return {
+            "outcome_volumes": dict(zip(outcomes, decayed.tolist())),
+            "trades": float(self._decayed_trades[row] * decay),
+            "window_seconds": BUCKETS * BUCKET_SECONDS,
+            "window_volumes": dict(zip(outcomes, window.tolist())),
+            "window_trades": int(self._bucket_trades[row, live].sum())
+        }
@@ -3,6 +3,9 @@
 from datetime import datetime
 from typing import Optional
 
+from models.reasoning_store import reasoning_store
+from models.stake_book import StakeBook
+
 
 class Stake:
     """Stake model for in-memory storage"""
@@ -24,15 +27,38 @@ class Stake:
         self.staker_address = staker_address
         self.outcome = outcome
         self.amount = amount  # Amount staked in ALGO
-        self.reasoning = reasoning  # Why they believe this outcome
+        self.reasoning_key = reasoning_store.intern(reasoning)  # Why they believe this outcome
         self.confidence = confidence  # Confidence level (0-1)
         self.txn_id = txn_id  # Algorand transaction ID
         self.created_at = created_at or datetime.utcnow()
 
+        # Position in the market's stake book, whose ledger holds rewards
+        self.book: Optional[StakeBook] = None
+        self.row: Optional[int] = None
+
         # Rewards
-        self.reward_amount: Optional[float] = None
-        self.is_correct: Optional[bool] = None
         self.claimed = False
+        self.payout_txn_id: Optional[str] = None
+        self.payout_confirmed = False
+
+    @property
+    def reasoning(self) -> str:
+        """Reasoning text (read from cold storage once the market resolved)"""
+        return reasoning_store.get(self.reasoning_key)
+
+    @property
+    def is_correct(self) -> Optional[bool]:
+        """Whether the stake was correct (None until the market is settled)"""
+        if self.book is None or self.book.ledger is None:
+            return None
+        return self.book.ledger.is_correct(self.row)
+
+    @property
+    def reward_amount(self) -> Optional[float]:
+        """Reward for a correct stake (None otherwise)"""
+        if self.book is None or self.book.ledger is None:
+            return None
+        return self.book.ledger.reward(self.row)
 
     def to_dict(self) -> dict:
         """Convert to dictionary"""
@@ -48,5 +74,7 @@ class Stake:
             "created_at": self.created_at.isoformat(),
             "reward_amount": self.reward_amount,
             "is_correct": self.is_correct,
-            "claimed": self.claimed
+            "claimed": self.claimed,
+            "payout_txn_id": self.payout_txn_id,
+            "payout_confirmed": self.payout_confirmed
         }
@@ -0,0 +1,123 @@
+"""Column-oriented stake storage and settlement ledger"""
+
+from typing import Dict, List, Optional
+
+import numpy as np
+
+
+class ClaimLedger:
+    """Read-only settlement result for one market's stakes
+
+    Arrays are indexed by the stake's row in its StakeBook and frozen once
+    written, so claims are a dict lookup plus two array reads.
+    """
+
+    def __init__(
+        self,
+        winning_outcome: str,
+        correct: np.ndarray,
+        rewards: np.ndarray,
+        rows: Dict[str, int],
+        total_correct: float,
+        total_incorrect: float
+    ):
+        correct.setflags(write=False)
+        rewards.setflags(write=False)
+        self.winning_outcome = winning_outcome
+        self.correct = correct  # row -> predicted the winning outcome
+        self.rewards = rewards  # row -> payout in ALGO (0 for incorrect stakes)
+        self.rows = rows  # stake_id -> row
+        self.total_correct = total_correct
+        self.total_incorrect = total_incorrect
+
+    def __len__(self) -> int:
+        return len(self.correct)
+
+    def __contains__(self, stake_id: str) -> bool:
+        return self.rows.get(stake_id, len(self)) < len(self)
+
+    def is_correct(self, row: int) -> Optional[bool]:
+        """Whether a stake was correct (None if it was not settled)"""
+        if row >= len(self):
+            return None
+        return bool(self.correct[row])
+
+    def reward(self, row: int) -> Optional[float]:
+        """Reward for a correct stake (None otherwise)"""
+        if not self.is_correct(row):
+            return None
+        return float(self.rewards[row])
+
+    def reward_for(self, stake_id: str) -> Optional[float]:
+        """Reward for a correct stake looked up by id"""
+        row = self.rows.get(stake_id)
+        return None if row is None else self.reward(row)
+
+
+class StakeBook:
+    """Amounts, outcome codes, stakers and confidences of a market's stakes in growable arrays"""
+
+    def __init__(self, capacity: int = 64) -> None:
+        self._amounts = np.zeros(capacity, dtype=np.float64)
+        self._outcome_codes = np.zeros(capacity, dtype=np.int16)
+        self._staker_ids = np.zeros(capacity, dtype=np.int64)
+        self._confidences = np.zeros(capacity, dtype=np.float64)
+        self.stake_ids: List[str] = []  # row -> stake_id
+        self.rows: Dict[str, int] = {}  # stake_id -> row
+        self.outcome_names: List[str] = []  # code -> outcome
+        self.outcome_codes: Dict[str, int] = {}  # outcome -> code
+        self.ledger: Optional[ClaimLedger] = None
+
+    def __len__(self) -> int:
+        return len(self.stake_ids)
+
+    @property
+    def amounts(self) -> np.ndarray:
+        """Stake amounts by row"""
+        return self._amounts[:len(self)]
+
+    @property
+    def codes(self) -> np.ndarray:
+        """Outcome codes by row"""
+        return self._outcome_codes[:len(self)]
+
+    @property
+    def staker_ids(self) -> np.ndarray:
+        """Calibration staker ids by row"""
+        return self._staker_ids[:len(self)]
+
+    @property
+    def confidences(self) -> np.ndarray:
+        """Stated confidences by row"""
+        return self._confidences[:len(self)]
+
+    def code_of(self, outcome: str) -> int:
+        """Get or assign the code for an outcome"""
+        code = self.outcome_codes.get(outcome)
+        if code is None:
+            code = self.outcome_codes[outcome] = len(self.outcome_names)
+            self.outcome_names.append(outcome)
+        return code
+
+    def add(
+        self,
+        stake_id: str,
+        outcome: str,
+        amount: float,
+        staker_id: int = 0,
+        confidence: float = 0.0
+    ) -> int:
+        """Append a stake and return its row"""
+        row = len(self)
+        if row == len(self._amounts):
+            for name in ("_amounts", "_outcome_codes", "_staker_ids", "_confidences"):
+                column = getattr(self, name)
+                setattr(self, name, np.concatenate([column, np.zeros(row, dtype=column.dtype)]))
+
+        self._amounts[row] = amount
+        self._outcome_codes[row] = self.code_of(outcome)
+        self._staker_ids[row] = staker_id
+        self._confidences[row] = confidence
+        self.stake_ids.append(stake_id)
+        self.rows[stake_id] = row
+        return row
@@ -0,0 +1,64 @@
+"""Running stake aggregates for market insight panels"""
+
+import heapq
+from typing import Dict, List, Tuple
+
+from models.stake import Stake
+
+TOP_REASONING_COUNT = 3
+
+
+class OutcomeInsights:
+    """Running totals and the top-k stakes by amount x confidence for one outcome"""
+
+    def __init__(self, k: int = TOP_REASONING_COUNT) -> None:
+        self.k = k
+        self.total_staked = 0.0
+        self.num_stakers = 0
+        self.confidence_sum = 0.0
+        # Min-heap of (amount * confidence, -arrival, stake_id); earlier stakes win ties
+        self._top: List[Tuple[float, int, str]] = []
+
+    @property
+    def avg_confidence(self) -> float:
+        """Mean confidence of stakes on this outcome"""
+        return self.confidence_sum / self.num_stakers if self.num_stakers else 0
+
+    def add(self, stake: Stake) -> None:
+        """Fold a new stake into the aggregates"""
+        self.total_staked += stake.amount
+        self.num_stakers += 1
+        self.confidence_sum += stake.confidence
+
+        entry = (stake.amount * stake.confidence, -self.num_stakers, stake.id)
+        if len(self._top) < self.k:
+            heapq.heappush(self._top, entry)
+        elif entry > self._top[0]:
+            heapq.heapreplace(self._top, entry)
+
+    def top_stake_ids(self) -> List[str]:
+        """Stake ids of the top-k, best first"""
+        return [stake_id for _, _, stake_id in sorted(self._top, reverse=True)]
+
+
+class MarketInsights:
+    """Per-outcome insight aggregates for one market"""
+
+    def __init__(self) -> None:
+        self.total_stakes = 0
+        self.total_amount_staked = 0.0
+        self.outcomes: Dict[str, OutcomeInsights] = {}
+
+    def add(self, stake: Stake) -> None:
+        """Fold a new stake into the aggregates"""
+        self.total_stakes += 1
+        self.total_amount_staked += stake.amount
+
+        outcome = self.outcomes.get(stake.outcome)
+        if outcome is None:
+            outcome = self.outcomes[stake.outcome] = OutcomeInsights()
+        outcome.add(stake)
+
+    def get_outcome(self, outcome: str) -> OutcomeInsights:
+        """Aggregates for an outcome (empty if nobody staked on it)"""
+        return self.outcomes.get(outcome) or OutcomeInsights()
@@ -0,0 +1,69 @@
+"""Survivor set model"""
+
+import numpy as np
+
+_ONE = np.uint64(1)
+
+
+class SurvivorSet:
+    """Participant ids still alive in an elimination tournament
+
+    Membership is a bitset with one bit per participant id, and the surviving
+    ids are also kept in a dense array in join order. Eliminating a round
+    therefore touches only the survivors, not everyone who ever entered.
+    """
+
+    def __init__(self, capacity: int = 64) -> None:
+        self.bits = np.zeros((capacity + 63) // 64, dtype=np.uint64)
+        self._ids = np.empty(capacity, dtype=np.intp)
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, participant_id: int) -> bool:
+        word = participant_id >> 6
+        if word >= len(self.bits):
+            return False
+        return bool((self.bits[word] >> np.uint64(participant_id & 63)) & _ONE)
+
+    @property
+    def ids(self) -> np.ndarray:
+        """Surviving participant ids in join order"""
+        return self._ids[:self._count]
+
+    def add(self, participant_id: int) -> None:
+        """Add a participant (ids must be added in increasing order)"""
+        if participant_id in self:
+            return
+
+        word = participant_id >> 6
+        if word >= len(self.bits):
+            bits = np.zeros(max(word + 1, 2 * len(self.bits)), dtype=np.uint64)
+            bits[:len(self.bits)] = self.bits
+            self.bits = bits
+        if self._count == len(self._ids):
+            ids = np.empty(max(1, 2 * len(self._ids)), dtype=np.intp)
+            ids[:self._count] = self.ids
+            self._ids = ids
+
+        self.bits[word] |= _ONE << np.uint64(participant_id & 63)
+        self._ids[self._count] = participant_id
+        self._count += 1
+
+    def contains_many(self, participant_ids: np.ndarray) -> np.ndarray:
+        """Vectorized membership test"""
+        shifts = (participant_ids & 63).astype(np.uint64)
+        return ((self.bits[participant_ids >> 6] >> shifts) & _ONE).astype(bool)
+
+    def remove(self, participant_ids: np.ndarray) -> None:
+        """Eliminate participants"""
+        if len(participant_ids) == 0:
+            return
+
+        masks = np.invert(_ONE << (participant_ids & 63).astype(np.uint64))
+        np.bitwise_and.at(self.bits, participant_ids >> 6, masks)
+
+        survivors = self.ids[self.contains_many(self.ids)]
+        self._count = len(survivors)
+        self._ids[:self._count] = survivors
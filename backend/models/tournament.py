@@ -2,7 +2,17 @@
 
 from datetime import datetime
 from enum import Enum
-from typing import Optional, Dict, List
+from typing import Callable, Optional, Dict, Iterable, List, Tuple
+
+import numpy as np
+
+from models.leaderboard import Leaderboard
+from models.participant_registry import ParticipantRegistry
+from models.payout import PayoutStructure
+from models.prediction_matrix import Forecast, PredictionMatrix
+from models.survivor_set import SurvivorSet
+
+NOT_ELIMINATED = -1
 
 
 class TournamentStatus(str, Enum):
@@ -13,6 +23,55 @@ class TournamentStatus(str, Enum):
     CANCELLED = "cancelled"
 
 
+class ScoringRule(str, Enum):
+    """How tournament forecasts are scored"""
+    ACCURACY = "accuracy"  # 1.0 per correct pick
+    BRIER = "brier"  # Quadratic score, 1 - Brier
+    LOG = "log"  # ln(probability of the outcome)
+    SPHERICAL = "spherical"  # p_outcome / ||p||
+
+
+# Fields returned by default; fields that grow with the number of participants
+# are only included when requested or read through the paginated sub-resources
+SUMMARY_FIELDS = (
+    "id",
+    "name",
+    "description",
+    "creator_address",
+    "market_ids",
+    "entry_fee",
+    "prize_pool",
+    "start_time",
+    "end_time",
+    "max_participants",
+    "scoring_rule",
+    "created_at",
+    "status",
+    "participant_count",
+    "winners",
+    "payout",
+    "mode",
+    "rounds",
+    "elimination_fraction",
+    "current_round",
+    "survivor_count"
+)
+DETAIL_FIELDS = (
+    "participants",
+    "participant_scores",
+    "predictions",
+    "prize_distribution",
+    "prize_distribution_microalgos"
+)
+TOURNAMENT_FIELDS = SUMMARY_FIELDS + DETAIL_FIELDS
+
+
+class TournamentMode(str, Enum):
+    """How a tournament is played"""
+    STANDARD = "standard"  # Single pass over all markets
+    BATTLE_ROYALE = "battle_royale"  # Rounds of markets, bottom fraction cut after each
+
+
 class Tournament:
     """Tournament model for in-memory storage"""
 
@@ -28,6 +87,12 @@ class Tournament:
         start_time: datetime,
         end_time: datetime,
         max_participants: int,
+        market_outcomes: Optional[Dict[str, List[str]]] = None,
+        scoring_rule: ScoringRule = ScoringRule.ACCURACY,
+        mode: TournamentMode = TournamentMode.STANDARD,
+        rounds: Optional[List[List[str]]] = None,
+        elimination_fraction: float = 0.5,
+        payout: Optional[PayoutStructure] = None,
         created_at: Optional[datetime] = None
     ):
         self.id = id
@@ -40,41 +105,288 @@ class Tournament:
         self.start_time = start_time
         self.end_time = end_time
         self.max_participants = max_participants
+        self.scoring_rule = scoring_rule
+        self.mode = mode
+        self.rounds = rounds or [market_ids]  # Market ids per round
+        self.elimination_fraction = elimination_fraction
+        self.payout = payout or PayoutStructure()
         self.created_at = created_at or datetime.utcnow()
 
         # Status
         self.status = TournamentStatus.PENDING
 
         # Participants
-        self.participants: List[str] = []  # List of addresses
-        self.participant_scores: Dict[str, float] = {}  # address -> score
+        self.participants = ParticipantRegistry()
+        self.scores = np.zeros(16, dtype=np.float64)  # participant_id -> score
+        self.leaderboard = Leaderboard()  # participant_id -> ranked score
 
-        # Predictions
-        self.predictions: Dict[str, Dict[str, str]] = {}  # address -> {market_id: outcome}
+        # Elimination state (battle royale only)
+        self.current_round = 0
+        self.survivors = SurvivorSet()
+        self.eliminated_round = np.full(16, NOT_ELIMINATED, dtype=np.int16)  # participant_id -> round
+
+        # Predictions (participant_id x market outcome indices)
+        self.prediction_matrix = PredictionMatrix(
+            market_ids,
+            market_outcomes or {},
+            probabilistic=scoring_rule != ScoringRule.ACCURACY
+        )
+
+        # Outcomes of tournament markets already applied to scores
+        self.resolved_outcomes: Dict[str, str] = {}  # market_id -> outcome
 
         # Results
         self.winners: List[str] = []
-        self.prize_distribution: Dict[str, float] = {}
+        self.prize_distribution: Dict[str, float] = {}  # address -> ALGO
+        self.prize_distribution_microalgos: Dict[str, int] = {}
+
+    @property
+    def participant_scores(self) -> Dict[str, float]:
+        """Scores keyed by participant address"""
+        count = len(self.participants)
+        return dict(zip(self.participants.addresses, self.scores[:count].tolist()))
+
+    @property
+    def predictions(self) -> Dict[str, Dict[str, str]]:
+        """Predictions keyed by participant address, then market id"""
+        return self.prediction_matrix.to_dict(self.participants.addresses)
+
+    @property
+    def is_battle_royale(self) -> bool:
+        """Whether participants are eliminated between rounds"""
+        return self.mode == TournamentMode.BATTLE_ROYALE
+
+    def add_participant(self, address: str) -> int:
+        """Register a participant with a zero score and return their id"""
+        participant_id = self.participants.add(address)
+        if participant_id >= len(self.scores):
+            scores = np.zeros(2 * len(self.scores), dtype=np.float64)
+            scores[:len(self.scores)] = self.scores
+            self.scores = scores
+
+            eliminated_round = np.full(len(scores), NOT_ELIMINATED, dtype=np.int16)
+            eliminated_round[:len(self.eliminated_round)] = self.eliminated_round
+            self.eliminated_round = eliminated_round
+        self.prediction_matrix.ensure_rows(participant_id + 1)
+        if self.is_battle_royale:
+            self.survivors.add(participant_id)
+        self.set_scores(np.array([participant_id]), np.zeros(1))
+        return participant_id
+
+    def get_score(self, address: str) -> float:
+        """Get a participant's score (0 for non-participants)"""
+        participant_id = self.participants.id_of(address)
+        if participant_id is None:
+            return 0.0
+        return float(self.scores[participant_id])
+
+    def set_scores(self, participant_ids: np.ndarray, scores: np.ndarray) -> None:
+        """Update scores and leaderboard positions for a set of participants"""
+        self.scores[participant_ids] = scores
+        self._update_leaderboard(participant_ids)
+
+    def _update_leaderboard(self, participant_ids: np.ndarray) -> None:
+        """Re-key participants on the leaderboard by stage and score"""
+        stages = self.stages(participant_ids)
+        for participant_id, score, stage in zip(
+            participant_ids.tolist(), self.scores[participant_ids].tolist(), stages.tolist()
+        ):
+            self.leaderboard.set_score(participant_id, score, stage)
+
+    def stages(self, participant_ids: np.ndarray) -> np.ndarray:
+        """
+        Ranking stage of participants, the primary ranking key
+
+        In a battle royale survivors are at stage len(rounds) and eliminated
+        participants at the round they were knocked out in; everyone is at
+        stage 0 otherwise.
+        """
+        if not self.is_battle_royale:
+            return np.zeros(len(participant_ids), dtype=np.int32)
+        eliminated_round = self.eliminated_round[participant_ids].astype(np.int32)
+        return np.where(eliminated_round == NOT_ELIMINATED, len(self.rounds), eliminated_round)
+
+    def scoring_ids(self) -> Optional[np.ndarray]:
+        """Participant ids whose scores still change (None for everyone)"""
+        return self.survivors.ids if self.is_battle_royale else None
+
+    def is_eliminated(self, address: str) -> bool:
+        """Whether a participant was knocked out of a battle royale"""
+        participant_id = self.participants.id_of(address)
+        return (
+            participant_id is not None
+            and self.eliminated_round[participant_id] != NOT_ELIMINATED
+        )
 
-    def to_dict(self) -> dict:
-        """Convert to dictionary"""
+    def elimination_round_of(self, participant_id: int) -> Optional[int]:
+        """Round a participant was eliminated in (None while surviving)"""
+        eliminated_round = int(self.eliminated_round[participant_id])
+        return None if eliminated_round == NOT_ELIMINATED else eliminated_round
+
+    def round_resolved(self, round_index: int) -> bool:
+        """Whether every market in a round has been applied to scores"""
+        return all(m in self.resolved_outcomes for m in self.rounds[round_index])
+
+    def eliminate(self, participant_ids: np.ndarray) -> None:
+        """Knock participants out in the current round"""
+        self.survivors.remove(participant_ids)
+        self.eliminated_round[participant_ids] = self.current_round
+        self._update_leaderboard(participant_ids)
+
+    def final_ranking(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Rank every participant in one vectorized sort
+
+        In a battle royale survivors outrank everyone eliminated, and later
+        eliminations outrank earlier ones; score orders each group. Ties keep
+        join order. This is the same order as the live leaderboard.
+
+        Returns:
+            (participant ids best first, True where a position is not tied
+            with the one above)
+        """
+        count = len(self.participants)
+        ids = np.arange(count)
+        scores = self.scores[:count]
+        keys = [-scores]
+        if self.is_battle_royale:
+            keys.append(-self.stages(ids))
+
+        # lexsort uses the last key as the primary one
+        order = np.lexsort((ids, *keys))
+
+        new_group = np.ones(count, dtype=bool)
+        if count > 1:
+            changed = np.zeros(count - 1, dtype=bool)
+            for key in keys:
+                ranked = key[order]
+                changed |= ranked[1:] != ranked[:-1]
+            new_group[1:] = changed
+        return order, new_group
+
+    def validation_error(self, predictions: Dict[str, Forecast]) -> Optional[str]:
+        """
+        Check forecasts against the tournament's open markets and their outcomes
+
+        Markets that have already resolved take no more forecasts, so picks
+        are always made before their outcome is known.
+
+        Args:
+            predictions: market_id -> outcome, or market_id -> {outcome: probability}
+
+        Returns:
+            Error message, or None if every forecast is valid
+        """
+        for market_id in predictions:
+            if market_id in self.resolved_outcomes:
+                return f"Market {market_id} has already resolved"
+        return self.prediction_matrix.validation_error(predictions)
+
+    def set_predictions(self, address: str, predictions: Dict[str, Forecast]) -> None:
+        """Merge predictions into a participant's forecasts"""
+        self.prediction_matrix.set_row(self.participants.id_of(address), predictions)
+
+    def get_predictions(self, address: str) -> Dict[str, str]:
+        """Get a participant's predictions"""
+        participant_id = self.participants.id_of(address)
+        if participant_id is None or not self.prediction_matrix.has_row(participant_id):
+            return {}
+        return self.prediction_matrix.get_row(participant_id)
+
+    def ranked_participants(self, offset: int = 0, limit: int = 100) -> List[Dict]:
+        """Get a page of the leaderboard as rank/participant/score entries"""
+        entries = []
+        for idx, (participant_id, score) in enumerate(self.leaderboard.page(offset, limit)):
+            entry = {
+                "rank": offset + idx + 1,
+                "participant": self.participants.address_of(participant_id),
+                "score": score
+            }
+            if self.is_battle_royale:
+                entry["eliminated_round"] = self.elimination_round_of(participant_id)
+            entries.append(entry)
+        return entries
+
+    def rank_of(self, address: str) -> Optional[int]:
+        """Get a participant's 1-based leaderboard rank"""
+        participant_id = self.participants.id_of(address)
+        if participant_id is None:
+            return None
+        return self.leaderboard.rank_of(participant_id)
+
+    def participants_page(self, offset: int = 0, limit: int = 100) -> List[str]:
+        """Get a page of participant addresses in join order"""
+        return self.participants.addresses[offset:offset + limit]
+
+    def scores_page(self, offset: int = 0, limit: int = 100) -> List[Dict]:
+        """Get a page of participant/score entries in join order"""
+        addresses = self.participants_page(offset, limit)
+        scores = self.scores[offset:offset + len(addresses)].tolist()
+        return [
+            {"participant": address, "score": score}
+            for address, score in zip(addresses, scores)
+        ]
+
+    def predictions_page(self, offset: int = 0, limit: int = 100) -> List[Dict]:
+        """Get a page of submitted predictions in join order"""
+        matrix = self.prediction_matrix
+        entries = []
+        for participant_id in range(offset, min(offset + limit, len(self.participants))):
+            if not matrix.has_row(participant_id):
+                continue
+            entry = {
+                "participant": self.participants.address_of(participant_id),
+                "predictions": matrix.get_row(participant_id)
+            }
+            if matrix.probabilistic:
+                entry["forecasts"] = matrix.get_forecasts(participant_id)
+            entries.append(entry)
+        return entries
+
+    def _serializers(self) -> Dict[str, Callable[[], object]]:
+        """Field name -> function producing its serialized value"""
         return {
-            "id": self.id,
-            "name": self.name,
-            "description": self.description,
-            "creator_address": self.creator_address,
-            "market_ids": self.market_ids,
-            "entry_fee": self.entry_fee,
-            "prize_pool": self.prize_pool,
-            "start_time": self.start_time.isoformat(),
-            "end_time": self.end_time.isoformat(),
-            "max_participants": self.max_participants,
-            "created_at": self.created_at.isoformat(),
-            "status": self.status.value,
-            "participants": self.participants,
-            "participant_count": len(self.participants),
-            "participant_scores": self.participant_scores,
-            "predictions": self.predictions,
-            "winners": self.winners,
-            "prize_distribution": self.prize_distribution
+            "id": lambda: self.id,
+            "name": lambda: self.name,
+            "description": lambda: self.description,
+            "creator_address": lambda: self.creator_address,
+            "market_ids": lambda: self.market_ids,
+            "entry_fee": lambda: self.entry_fee,
+            "prize_pool": lambda: self.prize_pool,
+            "start_time": lambda: self.start_time.isoformat(),
+            "end_time": lambda: self.end_time.isoformat(),
+            "max_participants": lambda: self.max_participants,
+            "scoring_rule": lambda: self.scoring_rule.value,
+            "created_at": lambda: self.created_at.isoformat(),
+            "status": lambda: self.status.value,
+            "participant_count": lambda: len(self.participants),
+            "winners": lambda: self.winners,
+            "payout": lambda: self.payout.to_dict(),
+            "mode": lambda: self.mode.value,
+            "rounds": lambda: self.rounds,
+            "elimination_fraction": lambda: self.elimination_fraction,
+            "current_round": lambda: self.current_round,
+            "survivor_count": lambda: (
+                len(self.survivors) if self.is_battle_royale else len(self.participants)
+            ),
+            # Detail fields grow with the number of participants
+            "participants": lambda: self.participants.to_list(),
+            "participant_scores": lambda: self.participant_scores,
+            "predictions": lambda: self.predictions,
+            "prize_distribution": lambda: self.prize_distribution,
+            "prize_distribution_microalgos": lambda: self.prize_distribution_microalgos
         }
+
+    def to_dict(self, fields: Optional[Iterable[str]] = None) -> dict:
+        """
+        Convert to dictionary
+
+        Args:
+            fields: Fields to include (None for the summary fields)
+
+        Returns:
+            Dictionary with the requested fields, always including id
+        """
+        serializers = self._serializers()
+        selected = SUMMARY_FIELDS if fields is None else ("id", *fields)
+        return {field: serializers[field]() for field in dict.fromkeys(selected)}
@@ -2,7 +2,6 @@
 AI routes - AI predictions and analysis
 """
 
-from typing import List, Dict
 from datetime import datetime
 
 from fastapi import APIRouter, HTTPException, status
@@ -10,10 +9,14 @@ from fastapi.responses import JSONResponse
 
 from storage import storage
 from services.ai_service import ai_service
+from services.prediction_cache import prediction_cache
 from models.market import MarketStatus
 
 router = APIRouter()
 
+# Only edges above this are reported as opportunities
+MIN_OPPORTUNITY_EDGE = 0.05
+
 
 @router.get("/prediction/{market_id}")
 async def get_ai_prediction(market_id: str) -> JSONResponse:
@@ -31,16 +34,8 @@ async def get_ai_prediction(market_id: str) -> JSONResponse:
             detail=f"Market {market_id} not found"
         )
 
-    # Get or generate AI prediction
-    if market.ai_prediction:
-        prediction = market.ai_prediction
-    else:
-        prediction = ai_service.get_ai_prediction(
-            market_question=market.question,
-            outcomes=market.outcomes
-        )
-        market.ai_prediction = prediction
-        storage.update_market(market_id, market)
+    # Cached per market version; concurrent misses share one model run
+    prediction = await prediction_cache.get(market)
 
     confidence = ai_service.get_ai_confidence(prediction)
 
@@ -77,17 +72,12 @@ async def get_trading_recommendation(market_id: str) -> JSONResponse:
         )
 
     # Get AI prediction
-    if not market.ai_prediction:
-        market.ai_prediction = ai_service.get_ai_prediction(
-            market_question=market.question,
-            outcomes=market.outcomes
-        )
-        storage.update_market(market_id, market)
+    prediction = await prediction_cache.get(market)
 
     # Generate recommendation
     recommendation = ai_service.get_trading_recommendation(
         market=market.to_dict(),
-        ai_prediction=market.ai_prediction,
+        ai_prediction=prediction,
         current_prices=market.prices
     )
 
@@ -95,7 +85,7 @@ async def get_trading_recommendation(market_id: str) -> JSONResponse:
         "market_id": market_id,
         "recommendation": recommendation,
         "current_prices": market.prices,
-        "ai_prediction": market.ai_prediction
+        "ai_prediction": prediction
     })
 
 
@@ -115,13 +105,10 @@ async def get_market_sentiment(market_id: str) -> JSONResponse:
             detail=f"Market {market_id} not found"
         )
 
-    # Get trades for sentiment analysis
-    trades = storage.get_trades_by_market(market_id)
-    trade_dicts = [t.to_dict() for t in trades]
-
+    # Rolling windows are maintained as trades arrive
     sentiment = ai_service.analyze_market_sentiment(
         market_id=market_id,
-        trades=trade_dicts
+        windows=storage.sentiment.snapshot(market)
     )
 
     return JSONResponse({
@@ -131,6 +118,30 @@ async def get_market_sentiment(market_id: str) -> JSONResponse:
     })
 
 
+@router.get("/features/{market_id}")
+async def get_market_features(market_id: str) -> JSONResponse:
+    """
+    Get the model features of a market
+
+    Volume velocity, price momentum and volatility per window, unique
+    traders, stake imbalance and time to expiry, maintained as trades
+    and stakes arrive
+    """
+    market = storage.get_market(market_id)
+
+    if not market:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Market {market_id} not found"
+        )
+
+    return JSONResponse({
+        "market_id": market_id,
+        "features": storage.features.as_dict(market_id),
+        "computed_at": datetime.utcnow().isoformat()
+    })
+
+
 @router.get("/performance")
 async def get_ai_performance() -> JSONResponse:
     """
@@ -164,57 +175,31 @@ async def get_top_opportunities(limit: int = 10) -> JSONResponse:
 
     Finds markets where AI prediction differs most from market prices
     Ranked by expected value
+
+    Scans the latest prediction of every active market in one vectorized
+    pass; predictions are kept fresh by the background refresher
     """
-    active_markets = storage.get_active_markets()
-    opportunities = []
+    edges, analyzed = storage.edge_index.top_edges(limit, min_edge=MIN_OPPORTUNITY_EDGE)
 
-    for market in active_markets:
-        # Generate AI prediction if not exists
-        if not market.ai_prediction:
-            market.ai_prediction = ai_service.get_ai_prediction(
-                market_question=market.question,
-                outcomes=market.outcomes
-            )
-            storage.update_market(market.id, market)
-
-        # Find best opportunity in this market
-        best_edge = 0
-        best_outcome = None
-        best_action = None
-
-        for outcome in market.outcomes:
-            ai_prob = market.ai_prediction[outcome]
-            market_price = market.prices.get(outcome, 0.5)
-            edge = ai_prob - market_price
-
-            if abs(edge) > abs(best_edge):
-                best_edge = edge
-                best_outcome = outcome
-                best_action = "BUY" if edge > 0 else "SELL"
-
-        if best_outcome and abs(best_edge) > 0.05:  # Only significant edges
-            opportunities.append({
-                "market_id": market.id,
-                "question": market.question,
-                "outcome": best_outcome,
-                "action": best_action,
-                "edge": best_edge,
-                "ai_probability": market.ai_prediction[best_outcome],
-                "market_price": market.prices[best_outcome],
-                "volume": market.total_volume,
-                "liquidity": market.total_liquidity
-            })
-
-    # Sort by edge (absolute value)
-    opportunities = sorted(
-        opportunities,
-        key=lambda x: abs(x["edge"]),
-        reverse=True
-    )[:limit]
+    opportunities = []
+    for market_id, outcome_idx, edge in edges:
+        market = storage.get_market(market_id)
+        outcome = market.outcomes[outcome_idx]
+        opportunities.append({
+            "market_id": market.id,
+            "question": market.question,
+            "outcome": outcome,
+            "action": "BUY" if edge > 0 else "SELL",
+            "edge": edge,
+            "ai_probability": market.ai_prediction[outcome],
+            "market_price": market.prices[outcome],
+            "volume": market.total_volume,
+            "liquidity": market.total_liquidity
+        })
 
     return JSONResponse({
         "opportunities": opportunities,
-        "total_markets_analyzed": len(active_markets),
+        "total_markets_analyzed": analyzed,
         "generated_at": datetime.utcnow().isoformat()
     })
 
@@ -234,25 +219,9 @@ async def refresh_ai_prediction(market_id: str) -> JSONResponse:
             detail=f"Market {market_id} not found"
         )
 
-    # Get latest trades for historical data
-    trades = storage.get_trades_by_market(market_id)
-    historical_data = {
-        "trades": [t.to_dict() for t in trades],
-        "current_prices": market.prices,
-        "volume": market.total_volume
-    }
-
-    # Generate new prediction
-    new_prediction = ai_service.get_ai_prediction(
-        market_question=market.question,
-        outcomes=market.outcomes,
-        historical_data=historical_data
-    )
-
-    # Update market
+    # Generate new prediction (replaces the cached one)
     old_prediction = market.ai_prediction
-    market.ai_prediction = new_prediction
-    storage.update_market(market_id, market)
+    new_prediction = await prediction_cache.refresh(market)
 
     return JSONResponse({
         "market_id": market_id,
@@ -10,6 +10,7 @@ from fastapi import APIRouter, HTTPException, status
 from fastapi.responses import JSONResponse
 
 from models.market import Market, MarketStatus
+from models.reasoning_store import reasoning_store
 from models.trade import Trade
 from schemas.market import (
     CreateMarketRequest,
@@ -20,6 +21,9 @@ from schemas.market import (
 from storage import storage
 from services.algorand import algorand_service
 from services.ai_service import ai_service
+from services.prediction_refresher import prediction_refresher
+from services.settlement import settlement_service
+from services.tournament_scoring import tournament_scoring
 from services.websocket import websocket_manager
 
 router = APIRouter()
@@ -91,6 +95,7 @@ async def create_market(request: CreateMarketRequest) -> MarketResponse:
 
         # Save to storage
         storage.create_market(market)
+        prediction_refresher.schedule(market)
         
         print(f"✅ Market created successfully!")
         print(f"   - Status: {market.status.value}")
@@ -98,7 +103,7 @@ async def create_market(request: CreateMarketRequest) -> MarketResponse:
 
         # Broadcast market creation via WebSocket
         try:
-            await websocket_manager.broadcast(
+            await websocket_manager.announce(
                 f"New market created: {market.question}"
             )
         except:
@@ -213,6 +218,7 @@ async def execute_trade(market_id: str, request: TradeRequest) -> JSONResponse:
         # Update market stats
         market.total_volume += request.amount
         market.total_traders += 1
+        market.version += 1
 
         # Create trade record
         trade = Trade(
@@ -228,6 +234,7 @@ async def execute_trade(market_id: str, request: TradeRequest) -> JSONResponse:
 
         storage.create_trade(trade)
         storage.update_market(market_id, market)
+        prediction_refresher.note_update(market)
 
         # Update user stats
         user = storage.get_or_create_user(request.trader_address)
@@ -300,25 +307,12 @@ async def resolve_market(market_id: str, request: ResolveMarketRequest) -> Marke
     market.status = MarketStatus.RESOLVED
     market.resolved_outcome = request.winning_outcome
     market.resolved_at = datetime.utcnow()
+    market.version += 1
 
     storage.update_market(market_id, market)
 
-    # Process stakes - reward correct predictions
-    stakes = storage.get_stakes_by_market(market_id)
-    total_correct_stake = sum(
-        s.amount for s in stakes if s.outcome == request.winning_outcome
-    )
-    total_incorrect_stake = sum(
-        s.amount for s in stakes if s.outcome != request.winning_outcome
-    )
-
-    for stake in stakes:
-        stake.is_correct = (stake.outcome == request.winning_outcome)
-        if stake.is_correct and total_correct_stake > 0:
-            # Reward = original stake + proportional share of incorrect stakes
-            stake.reward_amount = stake.amount + (
-                stake.amount / total_correct_stake * total_incorrect_stake
-            )
+    # Settle stakes - reward correct predictions
+    settlement_service.settle_market(market)
 
     # Broadcast resolution
     await websocket_manager.send_market_update(
@@ -331,6 +325,33 @@ async def resolve_market(market_id: str, request: ResolveMarketRequest) -> Marke
         }
     )
 
+    # Update live scores in tournaments that include this market
+    for tournament in tournament_scoring.on_market_resolved(market):
+        await websocket_manager.send_tournament_update(
+            tournament_id=tournament.id,
+            update_type="scores_updated",
+            data={
+                "market_id": market_id,
+                "resolved_outcome": request.winning_outcome,
+                "markets_resolved": len(tournament.resolved_outcomes)
+            }
+        )
+
+        for result in tournament_scoring.advance_rounds(tournament):
+            await websocket_manager.send_tournament_update(
+                tournament_id=tournament.id,
+                update_type="round_completed",
+                data=result
+            )
+
+    # Move reasoning of settled stakes out of memory (texts stay in memory on failure)
+    try:
+        await reasoning_store.archive(
+            market_id, [s.reasoning_key for s in storage.get_stakes_by_market(market_id)]
+        )
+    except Exception as e:
+        print(f"Error archiving reasoning for market {market_id}: {e}")
+
     return MarketResponse(**market.to_dict())
 
 
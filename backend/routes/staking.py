@@ -14,6 +14,9 @@ from models.market import MarketStatus
 from schemas.stake import StakeRequest, StakeResponse
 from storage import storage
 from services.algorand import algorand_service
+from services.payouts import payout_worker, record_payout
+from services.prediction_refresher import prediction_refresher
+from services.prize_distribution import to_microalgos
 from services.websocket import websocket_manager
 
 router = APIRouter()
@@ -72,7 +75,9 @@ async def create_stake(request: StakeRequest) -> StakeResponse:
 
         # Update market stats
         market.total_staked_insights += 1
+        market.version += 1
         storage.update_market(request.market_id, market)
+        prediction_refresher.note_update(market)
 
         # Update user stats
         user = storage.get_or_create_user(request.staker_address)
@@ -172,35 +177,112 @@ async def claim_stake_reward(stake_id: str, claimer_address: str) -> JSONRespons
             detail="Rewards already claimed"
         )
 
-    # Check if market is resolved
-    market = storage.get_market(stake.market_id)
-    if not market or market.status != MarketStatus.RESOLVED:
+    # Check if market is resolved (settlement writes the claim ledger)
+    ledger = storage.get_claim_ledger(stake.market_id)
+    if ledger is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Market not yet resolved"
         )
 
     # Check if stake was correct
-    if not stake.is_correct:
+    if not ledger.is_correct(stake.row):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Stake did not predict correctly - no rewards available"
         )
 
-    if stake.reward_amount is None or stake.reward_amount <= 0:
+    reward_amount = ledger.reward(stake.row)
+    if reward_amount is None or reward_amount <= 0:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="No rewards available"
         )
 
-    # Process reward payment (mock - in production, send Algorand transaction)
+    # Process reward payment
     stake.claimed = True
+    txn_id, = await payout_worker.pay_many([
+        (stake.staker_address, to_microalgos(reward_amount), f"PolyGrand reward {stake_id}")
+    ])
+    if isinstance(txn_id, Exception):
+        stake.claimed = False
+        raise HTTPException(
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail=f"Reward payment failed: {str(txn_id)}"
+        )
+    txn_id = record_payout(stake, txn_id)
+
+    return JSONResponse(
+        {
+            "success": True,
+            "stake_id": stake_id,
+            "reward_amount": reward_amount,
+            "txn_id": txn_id,
+            "confirmed": stake.payout_confirmed
+        },
+        status_code=status.HTTP_200_OK if stake.payout_confirmed else status.HTTP_202_ACCEPTED
+    )
+
+
+@router.post("/user/{user_address}/claim")
+async def claim_all_stake_rewards(user_address: str) -> JSONResponse:
+    """
+    Claim rewards from every claimable stake of a user
+
+    Payments are sent in atomic groups of up to 16 transactions
+    Stakes that are unresolved, incorrect or already claimed are skipped
+    Stakes whose payment group failed are released and listed as failed
+    Stakes whose payment group is still unconfirmed stay claimed
+    """
+    claims = []
+    for stake in storage.get_stakes_by_user(user_address):
+        if stake.claimed:
+            continue
+        ledger = storage.get_claim_ledger(stake.market_id)
+        reward_amount = ledger.reward(stake.row) if ledger else None
+        if reward_amount is not None and reward_amount > 0:
+            claims.append((stake, reward_amount))
+
+    if not claims:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="No rewards available"
+        )
+
+    # Process reward payments
+    for stake, _ in claims:
+        stake.claimed = True
+    txn_ids = await payout_worker.pay_many([
+        (user_address, to_microalgos(reward_amount), f"PolyGrand reward {stake.id}")
+        for stake, reward_amount in claims
+    ])
+
+    paid = []
+    failed = []
+    for (stake, reward_amount), txn_id in zip(claims, txn_ids):
+        if isinstance(txn_id, Exception):
+            stake.claimed = False
+            failed.append({"stake_id": stake.id, "error": str(txn_id)})
+        else:
+            paid.append({
+                "stake_id": stake.id,
+                "reward_amount": reward_amount,
+                "txn_id": record_payout(stake, txn_id),
+                "confirmed": stake.payout_confirmed
+            })
+
+    if not paid:
+        raise HTTPException(
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail=f"Reward payment failed: {failed[0]['error']}"
+        )
 
     return JSONResponse({
-        "success": True,
-        "stake_id": stake_id,
-        "reward_amount": stake.reward_amount,
-        "txn_id": f"reward_txn_{uuid.uuid4().hex[:12]}"
+        "success": not failed,
+        "claimed": len(paid),
+        "total_reward": sum(claim["reward_amount"] for claim in paid),
+        "claims": paid,
+        "failed": failed
     })
 
 
@@ -209,7 +291,7 @@ async def get_market_insights(market_id: str) -> JSONResponse:
     """
     Get aggregated insights for a market
 
-    Analyzes all stakes to show community sentiment
+    Shows community sentiment from running per-outcome aggregates
     Shows most popular predictions and reasoning
     """
     market = storage.get_market(market_id)
@@ -220,29 +302,18 @@ async def get_market_insights(market_id: str) -> JSONResponse:
             detail=f"Market {market_id} not found"
         )
 
-    stakes = storage.get_stakes_by_market(market_id)
+    insights = storage.get_stake_insights(market_id)
 
-    # Aggregate by outcome
+    # Aggregates are kept up to date as stakes arrive
     outcome_stats = {}
     for outcome in market.outcomes:
-        outcome_stakes = [s for s in stakes if s.outcome == outcome]
-        total_staked = sum(s.amount for s in outcome_stakes)
-        avg_confidence = (
-            sum(s.confidence for s in outcome_stakes) / len(outcome_stakes)
-            if outcome_stakes else 0
-        )
-
-        # Get top reasoning
-        top_stakes = sorted(
-            outcome_stakes,
-            key=lambda s: s.amount * s.confidence,
-            reverse=True
-        )[:3]
+        outcome_insights = insights.get_outcome(outcome)
+        top_stakes = [storage.get_stake(sid) for sid in outcome_insights.top_stake_ids()]
 
         outcome_stats[outcome] = {
-            "total_staked": total_staked,
-            "num_stakers": len(outcome_stakes),
-            "avg_confidence": avg_confidence,
+            "total_staked": outcome_insights.total_staked,
+            "num_stakers": outcome_insights.num_stakers,
+            "avg_confidence": outcome_insights.avg_confidence,
             "top_reasoning": [
                 {
                     "staker": s.staker_address,
@@ -256,7 +327,41 @@ async def get_market_insights(market_id: str) -> JSONResponse:
 
     return JSONResponse({
         "market_id": market_id,
-        "total_stakes": len(stakes),
-        "total_amount_staked": sum(s.amount for s in stakes),
+        "total_stakes": insights.total_stakes,
+        "total_amount_staked": insights.total_amount_staked,
+        "crowd_forecast": market.crowd_forecast,
         "outcome_insights": outcome_stats
     })
+
+
+@router.get("/reputation/top")
+async def get_top_insight_providers(limit: int = 10) -> JSONResponse:
+    """
+    Get the stakers with the best calibrated insights
+
+    Ranked by reputation: Brier skill on resolved stakes, shrunk toward
+    a coin flip for stakers with few resolved stakes
+    """
+    limit = max(1, min(limit, 100))
+    return JSONResponse({
+        "providers": storage.calibration.top(limit)
+    })
+
+
+@router.get("/reputation/{address}")
+async def get_staker_reputation(address: str) -> JSONResponse:
+    """
+    Get a staker's calibration and reputation
+
+    Includes Brier score, accuracy, stake-weighted accuracy and a
+    reliability histogram of stated confidence against outcomes
+    """
+    stats = storage.calibration.get_stats(address)
+
+    if stats is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"No stakes found for {address}"
+        )
+
+    return JSONResponse(stats)
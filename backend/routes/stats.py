@@ -7,6 +7,11 @@ from fastapi import APIRouter
 
 from models.market import MarketStatus
 from storage import storage
+from services.inference import inference_executor
+from services.prediction_cache import prediction_cache
+from services.prediction_refresher import prediction_refresher
+from services.sse import sse_broadcaster
+from services.websocket import websocket_manager
 
 router = APIRouter()
 
@@ -51,3 +56,35 @@ async def get_leaderboard(limit: int = 10) -> list:
         }
         for idx, user in enumerate(sorted_users)
     ]
+
+
+@router.get("/websocket")
+async def get_websocket_stats() -> dict:
+    """
+    Get WebSocket capacity metrics for this worker
+
+    Reports connection count, queue depths, send latency percentiles
+    and message throughput for sizing the WebSocket tier
+    """
+    return {
+        **websocket_manager.get_metrics(),
+        "sse": sse_broadcaster.get_metrics(),
+        "timestamp": datetime.utcnow().isoformat()
+    }
+
+
+@router.get("/ai")
+async def get_ai_stats() -> dict:
+    """
+    Get AI prediction serving metrics for this worker
+
+    Reports prediction cache size, hit rate and in-flight computations,
+    inference queue depth, batch sizes and latencies, and background
+    refresh counts against the compute budget
+    """
+    return {
+        "prediction_cache": prediction_cache.get_metrics(),
+        "inference": inference_executor.get_metrics(),
+        "refresh": prediction_refresher.get_metrics(),
+        "timestamp": datetime.utcnow().isoformat()
+    }
@@ -0,0 +1,77 @@
+"""
+Streaming routes - Server-Sent Events feeds of market updates
+"""
+
+from typing import Optional
+
+from fastapi import APIRouter, Header, HTTPException, status
+from fastapi.responses import StreamingResponse
+
+from storage import storage
+from services.sse import sse_broadcaster
+
+router = APIRouter()
+
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "Connection": "keep-alive",
+    "X-Accel-Buffering": "no"  # Disable proxy buffering (nginx)
+}
+
+
+def _parse_last_event_id(header: Optional[str], query: Optional[str]) -> Optional[str]:
+    """Resolve the resume point from the Last-Event-ID header or query string"""
+    if query is not None:
+        return query
+    return header
+
+
+@router.get("/markets")
+async def stream_all_markets(
+    last_event_id: Optional[str] = None,
+    last_event_id_header: Optional[str] = Header(None, alias="Last-Event-ID")
+) -> StreamingResponse:
+    """
+    Stream updates for every market (firehose)
+
+    Emits the same market_update payloads as the WebSocket feed
+    Send Last-Event-ID to resume after a disconnect; a reset event means
+    the missed updates are gone and state should be refetched
+    """
+    resume_from = _parse_last_event_id(last_event_id_header, last_event_id)
+
+    return StreamingResponse(
+        sse_broadcaster.stream(last_event_id=resume_from),
+        media_type="text/event-stream",
+        headers=SSE_HEADERS
+    )
+
+
+@router.get("/markets/{market_id}")
+async def stream_market(
+    market_id: str,
+    last_event_id: Optional[str] = None,
+    last_event_id_header: Optional[str] = Header(None, alias="Last-Event-ID")
+) -> StreamingResponse:
+    """
+    Stream updates for a single market
+
+    Emits trades, stakes and resolution events as they happen
+    Send Last-Event-ID to resume after a disconnect; a reset event means
+    the missed updates are gone and state should be refetched
+    """
+    market = storage.get_market(market_id)
+
+    if not market:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Market {market_id} not found"
+        )
+
+    resume_from = _parse_last_event_id(last_event_id_header, last_event_id)
+
+    return StreamingResponse(
+        sse_broadcaster.stream(market_id=market_id, last_event_id=resume_from),
+        media_type="text/event-stream",
+        headers=SSE_HEADERS
+    )
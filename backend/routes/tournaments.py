@@ -3,26 +3,59 @@ Tournament routes - Create and manage prediction tournaments
 """
 
 import uuid
-from typing import List
+from typing import List, Optional
 from datetime import datetime
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Query, status
 from fastapi.responses import JSONResponse
 
-from models.tournament import Tournament, TournamentStatus
+from models.payout import PayoutStructure
+from models.tournament import TOURNAMENT_FIELDS, Tournament, TournamentStatus
 from schemas.tournament import (
     CreateTournamentRequest,
     TournamentResponse,
     JoinTournamentRequest,
-    SubmitPredictionRequest
+    SubmitPredictionRequest,
+    BulkJoinTournamentRequest,
+    BulkSubmitPredictionRequest
 )
 from storage import storage
+from services.tournament_scoring import tournament_scoring
+from services.tournament_scheduler import tournament_scheduler
 from services.websocket import websocket_manager
 
 router = APIRouter()
 
 
-@router.post("/", response_model=TournamentResponse, status_code=status.HTTP_201_CREATED)
+def parse_fields(fields: Optional[str]) -> Optional[List[str]]:
+    """
+    Parse a comma-separated field selection
+
+    Args:
+        fields: e.g. "name,status,participants" (None for the summary view)
+
+    Returns:
+        Field names, or None for the summary view
+    """
+    if fields is None:
+        return None
+
+    selected = [f.strip() for f in fields.split(",") if f.strip()]
+    unknown = [f for f in selected if f not in TOURNAMENT_FIELDS]
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown fields: {', '.join(unknown)}"
+        )
+    return selected
+
+
+@router.post(
+    "/",
+    response_model=TournamentResponse,
+    response_model_exclude_unset=True,
+    status_code=status.HTTP_201_CREATED
+)
 async def create_tournament(request: CreateTournamentRequest) -> TournamentResponse:
     """
     Create a new prediction tournament
@@ -32,6 +65,7 @@ async def create_tournament(request: CreateTournamentRequest) -> TournamentRespo
     """
     try:
         # Validate all markets exist
+        market_outcomes = {}
         for market_id in request.market_ids:
             market = storage.get_market(market_id)
             if not market:
@@ -39,6 +73,7 @@ async def create_tournament(request: CreateTournamentRequest) -> TournamentRespo
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail=f"Market {market_id} not found"
                 )
+            market_outcomes[market_id] = market.outcomes
 
         # Generate tournament ID
         tournament_id = f"tournament_{uuid.uuid4().hex[:12]}"
@@ -54,13 +89,21 @@ async def create_tournament(request: CreateTournamentRequest) -> TournamentRespo
             prize_pool=request.prize_pool,
             start_time=request.start_time,
             end_time=request.end_time,
-            max_participants=request.max_participants
+            max_participants=request.max_participants,
+            market_outcomes=market_outcomes,
+            scoring_rule=request.scoring_rule,
+            mode=request.mode,
+            rounds=request.rounds,
+            elimination_fraction=request.elimination_fraction,
+            payout=PayoutStructure(**request.payout.model_dump())
         )
 
         storage.create_tournament(tournament)
+        tournament_scoring.register_tournament(tournament)
+        tournament_scheduler.schedule(tournament)
 
         # Broadcast tournament creation
-        await websocket_manager.broadcast(
+        await websocket_manager.announce(
             f"New tournament created: {tournament.name}"
         )
 
@@ -75,10 +118,11 @@ async def create_tournament(request: CreateTournamentRequest) -> TournamentRespo
         )
 
 
-@router.get("/", response_model=List[TournamentResponse])
+@router.get("/", response_model=List[TournamentResponse], response_model_exclude_unset=True)
 async def get_tournaments(
     status_filter: str | None = None,
-    limit: int = 100
+    limit: int = 100,
+    fields: str | None = None
 ) -> List[TournamentResponse]:
     """
     Get all tournaments with optional filtering
@@ -86,7 +130,9 @@ async def get_tournaments(
     Query Parameters:
     - status: Filter by tournament status (pending, active, completed)
     - limit: Maximum number of tournaments to return
+    - fields: Comma-separated fields to return (defaults to the summary view)
     """
+    selected = parse_fields(fields)
     tournaments = storage.get_all_tournaments()
 
     # Apply filters
@@ -99,12 +145,18 @@ async def get_tournaments(
     # Apply limit
     tournaments = tournaments[:limit]
 
-    return [TournamentResponse(**t.to_dict()) for t in tournaments]
+    return [TournamentResponse(**t.to_dict(selected)) for t in tournaments]
 
 
-@router.get("/{tournament_id}", response_model=TournamentResponse)
-async def get_tournament(tournament_id: str) -> TournamentResponse:
-    """Get a single tournament by ID"""
+@router.get("/{tournament_id}", response_model=TournamentResponse, response_model_exclude_unset=True)
+async def get_tournament(tournament_id: str, fields: str | None = None) -> TournamentResponse:
+    """
+    Get a single tournament by ID
+
+    Query Parameters:
+    - fields: Comma-separated fields to return (defaults to the summary view)
+    """
+    selected = parse_fields(fields)
     tournament = storage.get_tournament(tournament_id)
 
     if not tournament:
@@ -113,10 +165,10 @@ async def get_tournament(tournament_id: str) -> TournamentResponse:
             detail=f"Tournament {tournament_id} not found"
         )
 
-    return TournamentResponse(**tournament.to_dict())
+    return TournamentResponse(**tournament.to_dict(selected))
 
 
-@router.post("/{tournament_id}/join", response_model=TournamentResponse)
+@router.post("/{tournament_id}/join", response_model=TournamentResponse, response_model_exclude_unset=True)
 async def join_tournament(
     tournament_id: str,
     request: JoinTournamentRequest
@@ -153,9 +205,9 @@ async def join_tournament(
             detail="Already joined this tournament"
         )
 
-    # Add participant
-    tournament.participants.append(request.participant_address)
-    tournament.participant_scores[request.participant_address] = 0.0
+    # Add participant (probabilistic rules credit a uniform forecast on resolved markets)
+    tournament.add_participant(request.participant_address)
+    tournament_scoring.rescore_participant(tournament, request.participant_address)
 
     storage.update_tournament(tournament_id, tournament)
 
@@ -176,7 +228,67 @@ async def join_tournament(
     return TournamentResponse(**tournament.to_dict())
 
 
-@router.post("/{tournament_id}/start", response_model=TournamentResponse)
+@router.post("/{tournament_id}/join/bulk")
+async def bulk_join_tournament(
+    tournament_id: str,
+    request: BulkJoinTournamentRequest
+) -> JSONResponse:
+    """
+    Join many participants to a tournament in one request
+
+    Addresses that already joined or do not fit are reported, not fatal
+    Returns a summary instead of the full tournament
+    """
+    tournament = storage.get_tournament(tournament_id)
+
+    if not tournament:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Tournament {tournament_id} not found"
+        )
+
+    if tournament.status != TournamentStatus.PENDING:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Tournament has already started or is completed"
+        )
+
+    joined = []
+    rejected = []
+    for address in request.participant_addresses:
+        if address in tournament.participants:
+            rejected.append({"participant": address, "reason": "already_joined"})
+        elif len(tournament.participants) >= tournament.max_participants:
+            rejected.append({"participant": address, "reason": "tournament_full"})
+        else:
+            tournament.add_participant(address)
+            joined.append(address)
+
+            user = storage.get_or_create_user(address)
+            user.tournaments_joined += 1
+
+    if joined:
+        tournament_scoring.rescore_participants(tournament, joined)
+        storage.update_tournament(tournament_id, tournament)
+
+        await websocket_manager.send_tournament_update(
+            tournament_id=tournament_id,
+            update_type="participants_joined",
+            data={
+                "joined": len(joined),
+                "total_participants": len(tournament.participants)
+            }
+        )
+
+    return JSONResponse({
+        "tournament_id": tournament_id,
+        "joined": len(joined),
+        "rejected": rejected,
+        "total_participants": len(tournament.participants)
+    })
+
+
+@router.post("/{tournament_id}/start", response_model=TournamentResponse, response_model_exclude_unset=True)
 async def start_tournament(tournament_id: str, creator_address: str) -> TournamentResponse:
     """
     Start a tournament
@@ -220,14 +332,21 @@ async def start_tournament(tournament_id: str, creator_address: str) -> Tourname
         update_type="started",
         data={
             "start_time": datetime.utcnow().isoformat(),
-            "participants": tournament.participants
+            "participants": tournament.participants.to_list()
         }
     )
 
+    for result in tournament_scoring.advance_rounds(tournament):
+        await websocket_manager.send_tournament_update(
+            tournament_id=tournament_id,
+            update_type="round_completed",
+            data=result
+        )
+
     return TournamentResponse(**tournament.to_dict())
 
 
-@router.post("/{tournament_id}/predict", response_model=TournamentResponse)
+@router.post("/{tournament_id}/predict", response_model=TournamentResponse, response_model_exclude_unset=True)
 async def submit_prediction(
     tournament_id: str,
     request: SubmitPredictionRequest
@@ -258,29 +377,22 @@ async def submit_prediction(
             detail="Not a participant in this tournament"
         )
 
-    # Validate predictions
-    for market_id, outcome in request.predictions.items():
-        if market_id not in tournament.market_ids:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Market {market_id} is not part of this tournament"
-            )
-
-        market = storage.get_market(market_id)
-        if not market:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Market {market_id} not found"
-            )
+    if tournament.is_eliminated(request.participant_address):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Participant has been eliminated"
+        )
 
-        if outcome not in market.outcomes:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Invalid outcome {outcome} for market {market_id}"
-            )
+    # Validate predictions against the tournament's open markets and outcomes
+    error = tournament.validation_error(request.predictions)
+    if error:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=error
+        )
 
-    # Save predictions
-    tournament.predictions[request.participant_address] = request.predictions
+    # Save predictions; they are scored as their markets resolve
+    tournament.set_predictions(request.participant_address, request.predictions)
 
     storage.update_tournament(tournament_id, tournament)
 
@@ -297,7 +409,67 @@ async def submit_prediction(
     return TournamentResponse(**tournament.to_dict())
 
 
-@router.post("/{tournament_id}/complete", response_model=TournamentResponse)
+@router.post("/{tournament_id}/predict/bulk")
+async def bulk_submit_predictions(
+    tournament_id: str,
+    request: BulkSubmitPredictionRequest
+) -> JSONResponse:
+    """
+    Submit predictions for many participants in one request
+
+    Invalid submissions are reported, not fatal
+    Returns a summary instead of the full tournament
+    """
+    tournament = storage.get_tournament(tournament_id)
+
+    if not tournament:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Tournament {tournament_id} not found"
+        )
+
+    if tournament.status != TournamentStatus.ACTIVE:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Tournament is not active"
+        )
+
+    accepted = []
+    rejected = []
+    for submission in request.submissions:
+        address = submission.participant_address
+        if address not in tournament.participants:
+            rejected.append({"participant": address, "reason": "Not a participant in this tournament"})
+            continue
+        if tournament.is_eliminated(address):
+            rejected.append({"participant": address, "reason": "Participant has been eliminated"})
+            continue
+
+        error = tournament.validation_error(submission.predictions)
+        if error:
+            rejected.append({"participant": address, "reason": error})
+            continue
+
+        tournament.set_predictions(address, submission.predictions)
+        accepted.append(address)
+
+    if accepted:
+        storage.update_tournament(tournament_id, tournament)
+
+        await websocket_manager.send_tournament_update(
+            tournament_id=tournament_id,
+            update_type="predictions_submitted",
+            data={"participants": len(accepted)}
+        )
+
+    return JSONResponse({
+        "tournament_id": tournament_id,
+        "accepted": len(accepted),
+        "rejected": rejected
+    })
+
+
+@router.post("/{tournament_id}/complete", response_model=TournamentResponse, response_model_exclude_unset=True)
 async def complete_tournament(tournament_id: str, creator_address: str) -> TournamentResponse:
     """
     Complete a tournament and calculate winners
@@ -325,39 +497,8 @@ async def complete_tournament(tournament_id: str, creator_address: str) -> Tourn
             detail="Tournament already completed"
         )
 
-    # Calculate scores
-    for participant in tournament.participants:
-        score = 0.0
-        predictions = tournament.predictions.get(participant, {})
-
-        for market_id, predicted_outcome in predictions.items():
-            market = storage.get_market(market_id)
-            if market and market.resolved_outcome:
-                if predicted_outcome == market.resolved_outcome:
-                    score += 1.0
-
-        tournament.participant_scores[participant] = score
-
-    # Determine winners (top 3)
-    sorted_participants = sorted(
-        tournament.participants,
-        key=lambda p: tournament.participant_scores.get(p, 0),
-        reverse=True
-    )
-    tournament.winners = sorted_participants[:3]
-
-    # Distribute prizes (simple distribution: 50%, 30%, 20%)
-    if len(tournament.winners) >= 1:
-        tournament.prize_distribution[tournament.winners[0]] = tournament.prize_pool * 0.5
-    if len(tournament.winners) >= 2:
-        tournament.prize_distribution[tournament.winners[1]] = tournament.prize_pool * 0.3
-    if len(tournament.winners) >= 3:
-        tournament.prize_distribution[tournament.winners[2]] = tournament.prize_pool * 0.2
-
-    # Update status
-    tournament.status = TournamentStatus.COMPLETED
-
-    storage.update_tournament(tournament_id, tournament)
+    # Scores are kept current as markets resolve, so only ranking remains
+    tournament_scoring.complete_tournament(tournament)
 
     # Broadcast completion
     await websocket_manager.send_tournament_update(
@@ -372,9 +513,19 @@ async def complete_tournament(tournament_id: str, creator_address: str) -> Tourn
     return TournamentResponse(**tournament.to_dict())
 
 
-@router.get("/{tournament_id}/leaderboard")
-async def get_tournament_leaderboard(tournament_id: str) -> JSONResponse:
-    """Get tournament leaderboard"""
+@router.get("/{tournament_id}/participants")
+async def get_tournament_participants(
+    tournament_id: str,
+    offset: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000)
+) -> JSONResponse:
+    """
+    Get a page of tournament participants in join order
+
+    Query Parameters:
+    - offset: Number of participants to skip
+    - limit: Maximum number of participants to return
+    """
     tournament = storage.get_tournament(tournament_id)
 
     if not tournament:
@@ -383,26 +534,145 @@ async def get_tournament_leaderboard(tournament_id: str) -> JSONResponse:
             detail=f"Tournament {tournament_id} not found"
         )
 
-    # Sort by score
-    leaderboard = [
-        {
-            "rank": idx + 1,
-            "participant": participant,
-            "score": tournament.participant_scores.get(participant, 0),
-            "prize": tournament.prize_distribution.get(participant, 0)
-        }
-        for idx, participant in enumerate(
-            sorted(
-                tournament.participants,
-                key=lambda p: tournament.participant_scores.get(p, 0),
-                reverse=True
-            )
+    return JSONResponse({
+        "tournament_id": tournament_id,
+        "total_participants": len(tournament.participants),
+        "offset": offset,
+        "limit": limit,
+        "participants": tournament.participants_page(offset, limit)
+    })
+
+
+@router.get("/{tournament_id}/scores")
+async def get_tournament_scores(
+    tournament_id: str,
+    offset: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000)
+) -> JSONResponse:
+    """
+    Get a page of participant scores in join order
+
+    Use the leaderboard for scores in rank order.
+
+    Query Parameters:
+    - offset: Number of participants to skip
+    - limit: Maximum number of scores to return
+    """
+    tournament = storage.get_tournament(tournament_id)
+
+    if not tournament:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Tournament {tournament_id} not found"
+        )
+
+    return JSONResponse({
+        "tournament_id": tournament_id,
+        "total_participants": len(tournament.participants),
+        "offset": offset,
+        "limit": limit,
+        "scores": tournament.scores_page(offset, limit)
+    })
+
+
+@router.get("/{tournament_id}/predictions")
+async def get_tournament_predictions(
+    tournament_id: str,
+    offset: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000)
+) -> JSONResponse:
+    """
+    Get submitted predictions for a page of participants in join order
+
+    Participants without predictions are skipped, so a page may hold fewer
+    than limit entries.
+
+    Query Parameters:
+    - offset: Number of participants to skip
+    - limit: Maximum number of participants to cover
+    """
+    tournament = storage.get_tournament(tournament_id)
+
+    if not tournament:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Tournament {tournament_id} not found"
         )
-    ]
+
+    return JSONResponse({
+        "tournament_id": tournament_id,
+        "total_participants": len(tournament.participants),
+        "offset": offset,
+        "limit": limit,
+        "predictions": tournament.predictions_page(offset, limit)
+    })
+
+
+@router.get("/{tournament_id}/leaderboard")
+async def get_tournament_leaderboard(
+    tournament_id: str,
+    offset: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000)
+) -> JSONResponse:
+    """
+    Get tournament leaderboard
+
+    Query Parameters:
+    - offset: Number of ranked entries to skip
+    - limit: Maximum number of entries to return
+    """
+    tournament = storage.get_tournament(tournament_id)
+
+    if not tournament:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Tournament {tournament_id} not found"
+        )
+
+    leaderboard = tournament.ranked_participants(offset, limit)
+    for entry in leaderboard:
+        entry["prize"] = tournament.prize_distribution.get(entry["participant"], 0)
 
     return JSONResponse({
         "tournament_id": tournament_id,
         "tournament_name": tournament.name,
         "status": tournament.status.value,
+        "total_participants": len(tournament.participants),
+        "offset": offset,
+        "limit": limit,
         "leaderboard": leaderboard
     })
+
+
+@router.get("/{tournament_id}/leaderboard/{participant_address}")
+async def get_participant_rank(tournament_id: str, participant_address: str) -> JSONResponse:
+    """Get a single participant's rank and score"""
+    tournament = storage.get_tournament(tournament_id)
+
+    if not tournament:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Tournament {tournament_id} not found"
+        )
+
+    rank = tournament.rank_of(participant_address)
+    if rank is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Not a participant in this tournament"
+        )
+
+    entry = {
+        "tournament_id": tournament_id,
+        "participant": participant_address,
+        "rank": rank,
+        "score": tournament.get_score(participant_address),
+        "prize": tournament.prize_distribution.get(participant_address, 0),
+        "total_participants": len(tournament.participants)
+    }
+    if tournament.is_battle_royale:
+        entry["eliminated_round"] = tournament.elimination_round_of(
+            tournament.participants.id_of(participant_address)
+        )
+
+    return JSONResponse(entry)
@@ -32,4 +32,8 @@ echo API Docs: http://localhost:8000/docs
 echo API: http://localhost:8000
 echo.
 
-uvicorn app:app --reload --host 0.0.0.0 --port 8000
+REM Protocol-level WebSocket keepalive from settings (uvicorn CLI ignores uvicorn.run options)
+for /f %%i in ('python -c "from config import settings; print(settings.WS_PING_INTERVAL)"') do set WS_PING_INTERVAL=%%i
+for /f %%i in ('python -c "from config import settings; print(settings.WS_PING_TIMEOUT)"') do set WS_PING_TIMEOUT=%%i
+
+uvicorn app:app --reload --host 0.0.0.0 --port 8000 --ws-ping-interval %WS_PING_INTERVAL% --ws-ping-timeout %WS_PING_TIMEOUT%
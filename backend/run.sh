@@ -33,4 +33,9 @@ echo "📊 API Docs: http://localhost:8000/docs"
 echo "🌐 API: http://localhost:8000"
 echo ""
 
-uvicorn app:app --reload --host 0.0.0.0 --port 8000
+# Protocol-level WebSocket keepalive from settings (uvicorn CLI ignores uvicorn.run options)
+WS_PING_INTERVAL=$(python -c "from config import settings; print(settings.WS_PING_INTERVAL)")
+WS_PING_TIMEOUT=$(python -c "from config import settings; print(settings.WS_PING_TIMEOUT)")
+
+uvicorn app:app --reload --host 0.0.0.0 --port 8000 \
+    --ws-ping-interval "$WS_PING_INTERVAL" --ws-ping-timeout "$WS_PING_TIMEOUT"
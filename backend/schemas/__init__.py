@@ -10,7 +10,9 @@ from schemas.tournament import (
     CreateTournamentRequest,
     TournamentResponse,
     JoinTournamentRequest,
-    SubmitPredictionRequest
+    SubmitPredictionRequest,
+    BulkJoinTournamentRequest,
+    BulkSubmitPredictionRequest
 )
 from schemas.stake import (
     StakeRequest,
@@ -26,6 +28,8 @@ __all__ = [
     "TournamentResponse",
     "JoinTournamentRequest",
     "SubmitPredictionRequest",
+    "BulkJoinTournamentRequest",
+    "BulkSubmitPredictionRequest",
     "StakeRequest",
     "StakeResponse"
 ]
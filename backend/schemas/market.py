@@ -69,6 +69,7 @@ class MarketResponse(BaseModel):
     prices: Dict[str, float]
     volumes: Dict[str, float]
     total_staked_insights: int
+    crowd_forecast: Optional[Dict[str, float]] = None
     ai_prediction: Optional[Dict[str, Any]]  # Changed from Dict[str, float] to allow mixed types
 
     class Config:
@@ -28,6 +28,7 @@ class StakeResponse(BaseModel):
     reward_amount: Optional[float]
     is_correct: Optional[bool]
     claimed: bool
+    payout_txn_id: Optional[str] = None
 
     class Config:
         from_attributes = True
@@ -1,8 +1,37 @@
 """Tournament schemas"""
 
 from datetime import datetime
-from typing import List, Dict, Optional
-from pydantic import BaseModel, Field, field_validator
+from typing import List, Dict, Optional, Union
+from pydantic import BaseModel, Field, field_validator, model_validator
+
+from models.payout import PayoutCurve
+from models.tournament import ScoringRule, TournamentMode
+from utils.dates import to_utc
+
+# Tolerance when checking that a forecast distribution sums to 1
+PROBABILITY_SUM_TOLERANCE = 0.01
+
+# Tolerance (in percentage points) when checking payout percentages sum to 100
+PAYOUT_SUM_TOLERANCE = 0.01
+
+
+class PayoutStructureRequest(BaseModel):
+    """How the prize pool is split over the final ranking"""
+    curve: PayoutCurve = PayoutCurve.TOP_K
+    percentages: List[float] = Field(default_factory=lambda: [50.0, 30.0, 20.0], min_length=1)
+    ratio: float = Field(0.7, gt=0, le=1)  # Geometric decay between places
+    places: int = Field(10, ge=1)  # Places paid on the geometric curve
+    top_percent: float = Field(10.0, gt=0, le=100)  # Share of the field paid
+
+    @field_validator('percentages')
+    @classmethod
+    def validate_percentages(cls, v: List[float]) -> List[float]:
+        """Validate top-k percentages are positive and add up to 100"""
+        if any(p <= 0 for p in v):
+            raise ValueError("Payout percentages must be positive")
+        if abs(sum(v) - 100) > PAYOUT_SUM_TOLERANCE:
+            raise ValueError("Payout percentages must sum to 100")
+        return v
 
 
 class CreateTournamentRequest(BaseModel):
@@ -14,9 +43,22 @@ class CreateTournamentRequest(BaseModel):
     prize_pool: float = Field(..., ge=0)
     start_time: datetime
     end_time: datetime
-    max_participants: int = Field(..., ge=2, le=1000)
+    max_participants: int = Field(..., ge=2, le=100_000)
+    scoring_rule: ScoringRule = ScoringRule.ACCURACY
+    mode: TournamentMode = TournamentMode.STANDARD
+    rounds: Optional[List[List[str]]] = None  # Market ids per round (battle royale)
+    elimination_fraction: float = Field(0.5, gt=0, lt=1)
+    payout: PayoutStructureRequest = Field(default_factory=PayoutStructureRequest)
     creator_address: str
 
+    @field_validator('start_time')
+    @classmethod
+    def validate_start_time(cls, v: datetime) -> datetime:
+        """Validate start time is in the future, leaving time to join"""
+        if to_utc(v) <= datetime.utcnow():
+            raise ValueError("Start time must be in the future")
+        return v
+
     @field_validator('end_time')
     @classmethod
     def validate_end_time(cls, v: datetime, info) -> datetime:
@@ -25,6 +67,24 @@ class CreateTournamentRequest(BaseModel):
             raise ValueError("End time must be after start time")
         return v
 
+    @model_validator(mode='after')
+    def validate_rounds(self) -> 'CreateTournamentRequest':
+        """Validate battle royale rounds partition the tournament's markets"""
+        if self.mode != TournamentMode.BATTLE_ROYALE:
+            if self.rounds is not None:
+                raise ValueError("Rounds are only supported in battle royale mode")
+            return self
+
+        if not self.rounds or len(self.rounds) < 2:
+            raise ValueError("Battle royale tournaments need at least 2 rounds")
+        if any(not round_markets for round_markets in self.rounds):
+            raise ValueError("Every round needs at least one market")
+
+        round_market_ids = [m for round_markets in self.rounds for m in round_markets]
+        if sorted(round_market_ids) != sorted(self.market_ids):
+            raise ValueError("Rounds must contain each tournament market exactly once")
+        return self
+
 
 class JoinTournamentRequest(BaseModel):
     """Request to join a tournament"""
@@ -34,29 +94,69 @@ class JoinTournamentRequest(BaseModel):
 class SubmitPredictionRequest(BaseModel):
     """Request to submit prediction for tournament"""
     participant_address: str
-    predictions: Dict[str, str]  # market_id -> outcome
+    # market_id -> outcome, or market_id -> {outcome: probability}
+    predictions: Dict[str, Union[str, Dict[str, float]]]
+
+    @field_validator('predictions')
+    @classmethod
+    def validate_distributions(
+        cls,
+        v: Dict[str, Union[str, Dict[str, float]]]
+    ) -> Dict[str, Union[str, Dict[str, float]]]:
+        """Validate probability forecasts are distributions"""
+        for market_id, forecast in v.items():
+            if isinstance(forecast, str):
+                continue
+            if not forecast:
+                raise ValueError(f"Empty forecast for market {market_id}")
+            if any(p < 0 or p > 1 for p in forecast.values()):
+                raise ValueError(f"Probabilities for market {market_id} must be between 0 and 1")
+            if abs(sum(forecast.values()) - 1.0) > PROBABILITY_SUM_TOLERANCE:
+                raise ValueError(f"Probabilities for market {market_id} must sum to 1")
+        return v
+
+
+class BulkJoinTournamentRequest(BaseModel):
+    """Request to join many participants to a tournament"""
+    participant_addresses: List[str] = Field(..., min_length=1, max_length=10_000)
+
+
+class BulkSubmitPredictionRequest(BaseModel):
+    """Request to submit predictions for many participants"""
+    submissions: List[SubmitPredictionRequest] = Field(..., min_length=1, max_length=10_000)
 
 
 class TournamentResponse(BaseModel):
-    """Tournament response"""
+    """Tournament response
+
+    Only id is guaranteed; the other fields depend on the requested projection.
+    """
     id: str
-    name: str
-    description: str
-    creator_address: str
-    market_ids: List[str]
-    entry_fee: float
-    prize_pool: float
-    start_time: str
-    end_time: str
-    max_participants: int
-    created_at: str
-    status: str
-    participants: List[str]
-    participant_count: int
-    participant_scores: Dict[str, float]
-    predictions: Dict[str, Dict[str, str]]
-    winners: List[str]
-    prize_distribution: Dict[str, float]
+    name: Optional[str] = None
+    description: Optional[str] = None
+    creator_address: Optional[str] = None
+    market_ids: Optional[List[str]] = None
+    entry_fee: Optional[float] = None
+    prize_pool: Optional[float] = None
+    start_time: Optional[str] = None
+    end_time: Optional[str] = None
+    max_participants: Optional[int] = None
+    scoring_rule: Optional[str] = None
+    created_at: Optional[str] = None
+    status: Optional[str] = None
+    participants: Optional[List[str]] = None
+    participant_count: Optional[int] = None
+    participant_scores: Optional[Dict[str, float]] = None
+    predictions: Optional[Dict[str, Dict[str, str]]] = None
+    winners: Optional[List[str]] = None
+    payout: Optional[Dict] = None
+    prize_distribution: Optional[Dict[str, float]] = None
+    prize_distribution_microalgos: Optional[Dict[str, int]] = None
+    mode: Optional[str] = None
+    rounds: Optional[List[List[str]]] = None
+    elimination_fraction: Optional[float] = None
+    current_round: Optional[int] = None
+    survivor_count: Optional[int] = None
 
     class Config:
         from_attributes = True
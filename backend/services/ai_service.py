@@ -20,7 +20,8 @@ class AIService:
         self,
         market_question: str,
         outcomes: List[str],
-        historical_data: Optional[Dict] = None
+        historical_data: Optional[Dict] = None,
+        crowd_forecast: Optional[Dict[str, float]] = None
     ) -> Dict[str, float]:
         """
         Generate AI prediction for a market
@@ -29,6 +30,7 @@ class AIService:
             market_question: The market question
             outcomes: List of possible outcomes
             historical_data: Historical market data (optional)
+            crowd_forecast: Stake-weighted crowd probabilities (optional)
 
         Returns:
             Dictionary mapping outcomes to predicted probabilities
@@ -46,6 +48,13 @@ class AIService:
             for outcome, weight in zip(outcomes, weights)
         }
 
+        # Lean on the staked crowd where there is one
+        if crowd_forecast:
+            predictions = {
+                outcome: (prob + crowd_forecast.get(outcome, 0.0)) / 2
+                for outcome, prob in predictions.items()
+            }
+
         self.predictions_generated += 1
 
         print(f"🤖 AI Prediction generated for: {market_question[:50]}...")
@@ -54,6 +63,19 @@ class AIService:
 
         return predictions
 
+    def predict_batch(self, requests: List[Dict]) -> List[Dict[str, float]]:
+        """
+        Generate AI predictions for several markets at once
+
+        Args:
+            requests: Keyword arguments of get_ai_prediction, one per market
+
+        Returns:
+            Predictions in request order
+        """
+        # A real model would run the whole batch in one forward pass
+        return [self.get_ai_prediction(**request) for request in requests]
+
     def get_ai_confidence(self, predictions: Dict[str, float]) -> float:
         """
         Calculate AI confidence score based on prediction distribution
@@ -130,35 +152,22 @@ class AIService:
     def analyze_market_sentiment(
         self,
         market_id: str,
-        trades: List[Dict]
+        windows: Dict
     ) -> Dict[str, any]:
         """
-        Analyze market sentiment based on trading activity
+        Analyze market sentiment based on recent trading activity
 
         Args:
             market_id: Market identifier
-            trades: List of trades
+            windows: Rolling per-outcome volumes (see SentimentWindows.snapshot)
 
         Returns:
             Sentiment analysis
         """
-        if not trades:
-            return {
-                "sentiment": "neutral",
-                "momentum": 0.0,
-                "trader_confidence": 0.5
-            }
-
-        # Count trades per outcome
-        outcome_volumes = {}
-        for trade in trades:
-            outcome = trade.get("outcome")
-            amount = trade.get("amount", 0)
-            outcome_volumes[outcome] = outcome_volumes.get(outcome, 0) + amount
-
+        outcome_volumes = windows["outcome_volumes"]
         total_volume = sum(outcome_volumes.values())
 
-        # Calculate sentiment
+        # Calculate sentiment from time-decayed volumes, so it tracks recent flow
         if total_volume == 0:
             sentiment = "neutral"
             momentum = 0.0
@@ -177,12 +186,20 @@ class AIService:
                 sentiment = "bearish"
                 momentum = -(0.5 - top_volume_pct)
 
+        # Confidence grows with recent trading activity, halfway at 10 recent trades
+        trader_confidence = windows["trades"] / (windows["trades"] + 10)
+
         return {
             "sentiment": sentiment,
             "momentum": momentum,
-            "trader_confidence": len(trades) / 100,  # Simple confidence metric
+            "trader_confidence": trader_confidence,
             "outcome_volumes": outcome_volumes,
-            "total_volume": total_volume
+            "total_volume": total_volume,
+            "window": {
+                "seconds": windows["window_seconds"],
+                "outcome_volumes": windows["window_volumes"],
+                "trades": windows["window_trades"]
+            }
         }
 
     def get_trading_recommendation(
@@ -4,11 +4,12 @@ Handles smart contracts, ASAs, and transactions
 """
 
 import os
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Tuple
 from dotenv import load_dotenv
 
 from algosdk.v2client import algod, indexer
-from algosdk import account, mnemonic, transaction
+from algosdk import account, constants, mnemonic, transaction
+from algosdk.error import AlgodHTTPError, IndexerHTTPError
 from algosdk.transaction import (
     AssetConfigTxn,
     ApplicationCreateTxn,
@@ -22,6 +23,19 @@ from algokit_utils import get_algod_client, get_indexer_client
 load_dotenv()
 
 
+class PaymentGroupUnconfirmed(Exception):
+    """A payment group was submitted but not seen confirmed in time
+
+    The group may still confirm until its last valid round, so its payments
+    must not be retried before then.
+    """
+
+    def __init__(self, txids: List[str], last_valid: int) -> None:
+        super().__init__(f"Payment group {txids[0]} not confirmed within timeout")
+        self.txids = txids
+        self.last_valid = last_valid
+
+
 class AlgorandService:
     """Service for interacting with Algorand blockchain"""
 
@@ -78,8 +92,8 @@ class AlgorandService:
         Returns:
             Transaction confirmation details
         """
-        last_round = self.algod_client.status().get("last-round")
-        txinfo = self.algod_client.pending_transaction_info(txid)
+        start_round = self.algod_client.status().get("last-round")
+        last_round = start_round
 
         while True:
             last_round += 1
@@ -87,7 +101,7 @@ class AlgorandService:
             txinfo = self.algod_client.pending_transaction_info(txid)
             if txinfo.get("confirmed-round", 0) > 0:
                 return txinfo
-            if last_round > last_round + timeout:
+            if last_round > start_round + timeout:
                 raise Exception("Transaction not confirmed within timeout")
 
     def create_asa(
@@ -269,6 +283,90 @@ class AlgorandService:
 
         return txid
 
+    def send_payment_group(self, payments: List[Tuple[str, int, str]]) -> List[str]:
+        """
+        Send up to 16 ALGO payments as one atomic transaction group
+
+        Suggested params are fetched once for the whole group, and the group
+        either confirms completely or not at all.
+
+        Args:
+            payments: (receiver, amount in microAlgos, note) per payment
+
+        Returns:
+            Transaction IDs in the order of payments
+
+        Raises:
+            PaymentGroupUnconfirmed: The group was submitted but not seen
+                confirmed in time
+        """
+        if not payments:
+            return []
+        if len(payments) > constants.TX_GROUP_LIMIT:
+            raise ValueError(
+                f"At most {constants.TX_GROUP_LIMIT} transactions fit in a group"
+            )
+
+        params = self.get_suggested_params()
+
+        txns = [
+            PaymentTxn(
+                sender=self.creator_address,
+                sp=params,
+                receiver=receiver,
+                amt=amount,
+                note=note.encode() if note else None
+            )
+            for receiver, amount, note in payments
+        ]
+        transaction.assign_group_id(txns)
+
+        # Sign and send
+        signed_txns = [txn.sign(self.creator_private_key) for txn in txns]
+        self.algod_client.send_transactions(signed_txns)
+
+        # Confirming any member confirms the whole group
+        txids = [txn.get_txid() for txn in txns]
+        try:
+            self.wait_for_confirmation(txids[0])
+        except Exception as e:
+            raise PaymentGroupUnconfirmed(txids, params.last) from e
+
+        return txids
+
+    def payment_confirmed(self, txid: str, last_valid: int) -> Optional[bool]:
+        """
+        Check on a submitted transaction whose confirmation timed out
+
+        Args:
+            txid: Transaction ID
+            last_valid: Last round in which the transaction could confirm
+
+        Returns:
+            True if confirmed, False if it can no longer confirm, None while pending
+        """
+        try:
+            txinfo = self.algod_client.pending_transaction_info(txid)
+        except AlgodHTTPError as e:
+            if e.code != 404:
+                raise
+            txinfo = {}  # No longer in the pool
+        if txinfo.get("confirmed-round", 0) > 0:
+            return True
+        if txinfo.get("pool-error"):
+            return False
+        if self.algod_client.status().get("last-round") <= last_valid:
+            return None
+
+        # Past its validity window: confirmed only if it made it on chain
+        try:
+            self.indexer_client.transaction(txid)
+            return True
+        except IndexerHTTPError as e:
+            if "no transaction found" in str(e).lower():
+                return False
+            raise
+
     def get_account_info(self, address: str) -> Dict:
         """
         Get account information
@@ -0,0 +1,211 @@
+"""
+AI inference executor
+Micro-batches prediction requests onto a process pool
+"""
+
+import asyncio
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, NamedTuple, Optional
+
+from config import settings
+from services.ai_service import ai_service
+from services.metrics import LatencyRecorder
+
+
+class InferenceRequest(NamedTuple):
+    """A queued prediction request and the future resolved with its result"""
+    inputs: Dict
+    future: asyncio.Future
+    queued_at: float
+
+
+def predict_batch(batch: List[Dict]) -> List[Dict[str, float]]:
+    """Run one batch of predictions (in a pool worker)"""
+    return ai_service.predict_batch(batch)
+
+
+class InferenceExecutor:
+    """Runs AI predictions in batches off the event loop
+
+    Requests are queued and gathered for up to ``batch_timeout`` seconds or
+    ``batch_size`` requests, then run as one batch on a process pool with
+    ``workers`` processes. At most ``workers`` batches are in flight, so while
+    the pool is busy requests accumulate into larger batches. Without a pool
+    (``workers`` = 0, or before start) batches run in a thread instead.
+    """
+
+    def __init__(
+        self,
+        batch_size: int = 32,
+        batch_timeout: float = 0.01,
+        workers: int = 2
+    ) -> None:
+        """Initialize executor"""
+        self.batch_size = batch_size
+        self.batch_timeout = batch_timeout
+        self.workers = workers
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._in_flight = 0
+
+        # Capacity metrics
+        self.batches_run = 0
+        self.predictions_run = 0
+        self.failed_batches = 0
+        self.queue_wait = LatencyRecorder()
+        self.batch_latency = LatencyRecorder()
+
+    async def start(self) -> None:
+        """Start the process pool and the batching loop"""
+        if self.workers > 0:
+            # Fresh interpreters; forking a process with a running event loop is unsafe
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        self._queue = asyncio.Queue()
+        self._slots = asyncio.Semaphore(max(self.workers, 1))
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop batching and shut the pool down"""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        if self._queue:
+            while not self._queue.empty():
+                request = self._queue.get_nowait()
+                if not request.future.done():
+                    request.future.cancel()
+            self._queue = None
+
+        if self._pool:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
+
+    async def predict(
+        self,
+        market_question: str,
+        outcomes: List[str],
+        historical_data: Optional[Dict] = None,
+        crowd_forecast: Optional[Dict[str, float]] = None
+    ) -> Dict[str, float]:
+        """
+        Get an AI prediction through the next batch
+
+        Args:
+            market_question: The market question
+            outcomes: List of possible outcomes
+            historical_data: Historical market data (optional)
+            crowd_forecast: Stake-weighted crowd probabilities (optional)
+
+        Returns:
+            Dictionary mapping outcomes to predicted probabilities
+        """
+        inputs = {
+            "market_question": market_question,
+            "outcomes": outcomes,
+            "historical_data": historical_data,
+            "crowd_forecast": crowd_forecast
+        }
+        loop = asyncio.get_running_loop()
+        request = InferenceRequest(inputs, loop.create_future(), time.monotonic())
+
+        if self._queue is None:
+            # Executor not started (scripts, tests): run a batch of one directly
+            await self._run_batch([request])
+        else:
+            self._queue.put_nowait(request)
+        return await request.future
+
+    async def _run(self) -> None:
+        """Gather queued requests into batches"""
+        loop = asyncio.get_running_loop()
+        while True:
+            await self._slots.acquire()
+            try:
+                batch = [await self._queue.get()]
+                deadline = loop.time() + self.batch_timeout
+                while len(batch) < self.batch_size:
+                    if not self._queue.empty():
+                        batch.append(self._queue.get_nowait())
+                        continue
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                    except asyncio.TimeoutError:
+                        break
+            except BaseException:
+                self._slots.release()
+                raise
+
+            task = asyncio.create_task(self._run_batch(batch))
+            task.add_done_callback(lambda _: self._slots.release())
+
+    async def _run_batch(self, batch: List[InferenceRequest]) -> None:
+        """Run one batch and resolve its futures"""
+        started = time.monotonic()
+        for request in batch:
+            self.queue_wait.record(started - request.queued_at)
+
+        self._in_flight += 1
+        try:
+            inputs = [request.inputs for request in batch]
+            if self._pool is not None:
+                loop = asyncio.get_running_loop()
+                results = await loop.run_in_executor(self._pool, predict_batch, inputs)
+            else:
+                results = await asyncio.to_thread(predict_batch, inputs)
+        except Exception as e:
+            print(f"Error running inference batch of {len(batch)}: {e}")
+            self.failed_batches += 1
+            for request in batch:
+                if not request.future.done():
+                    request.future.set_exception(e)
+            return
+        finally:
+            self._in_flight -= 1
+
+        self.batches_run += 1
+        self.predictions_run += len(batch)
+        self.batch_latency.record(time.monotonic() - started)
+        if self._pool is not None:
+            # Pool workers count in their own copy of the service
+            ai_service.predictions_generated += len(batch)
+
+        for request, result in zip(batch, results):
+            if not request.future.done():
+                request.future.set_result(result)
+
+    def get_metrics(self) -> dict:
+        """Get batching and queue metrics"""
+        return {
+            "workers": self.workers,
+            "queue_depth": self._queue.qsize() if self._queue else 0,
+            "batches_in_flight": self._in_flight,
+            "batches_run": self.batches_run,
+            "failed_batches": self.failed_batches,
+            "predictions_run": self.predictions_run,
+            "mean_batch_size": self.predictions_run / self.batches_run if self.batches_run else 0.0,
+            "queue_wait_ms": self.queue_wait.percentiles(),
+            "batch_latency_ms": self.batch_latency.percentiles()
+        }
+
+
+# Global singleton instance
+inference_executor = InferenceExecutor(
+    batch_size=settings.AI_INFERENCE_BATCH_SIZE,
+    batch_timeout=settings.AI_INFERENCE_BATCH_TIMEOUT_MS / 1000,
+    workers=settings.AI_INFERENCE_WORKERS
+)
@@ -0,0 +1,82 @@
+"""
+Lightweight in-process metrics for capacity planning
+"""
+
+import time
+from collections import deque
+from typing import Deque, Dict, Iterable
+
+
+class LatencyRecorder:
+    """Keeps the most recent latency samples and reports percentiles"""
+
+    def __init__(self, max_samples: int = 2048) -> None:
+        """Initialize recorder"""
+        self.samples: Deque[float] = deque(maxlen=max_samples)
+        self.count = 0
+
+    def record(self, seconds: float) -> None:
+        """
+        Record a latency sample
+
+        Args:
+            seconds: Observed latency in seconds
+        """
+        self.samples.append(seconds)
+        self.count += 1
+
+    def percentiles(self, points: Iterable[int] = (50, 90, 99)) -> Dict[str, float]:
+        """
+        Get latency percentiles in milliseconds
+
+        Args:
+            points: Percentiles to compute
+
+        Returns:
+            Dictionary like {"p50": 0.4, "p99": 3.1}
+        """
+        ordered = sorted(self.samples)
+        if not ordered:
+            return {f"p{p}": 0.0 for p in points}
+
+        # Nearest-rank percentiles
+        last = len(ordered) - 1
+        return {
+            f"p{p}": ordered[min(last, int(round(p / 100 * last)))] * 1000
+            for p in points
+        }
+
+
+class RateCounter:
+    """Counts events in one-second buckets over a sliding window"""
+
+    def __init__(self, window_seconds: int = 10) -> None:
+        """Initialize counter"""
+        self.window_seconds = window_seconds
+        self.buckets: Deque[list] = deque()  # [second, count]
+        self.total = 0
+
+    def add(self, count: int = 1) -> None:
+        """
+        Record events happening now
+
+        Args:
+            count: Number of events
+        """
+        now = int(time.monotonic())
+        if self.buckets and self.buckets[-1][0] == now:
+            self.buckets[-1][1] += count
+        else:
+            self.buckets.append([now, count])
+        self.total += count
+        self._expire(now)
+
+    def per_second(self) -> float:
+        """Average events per second over the window"""
+        self._expire(int(time.monotonic()))
+        return sum(count for _, count in self.buckets) / self.window_seconds
+
+    def _expire(self, now: int) -> None:
+        """Drop buckets that fell out of the window"""
+        while self.buckets and self.buckets[0][0] <= now - self.window_seconds:
+            self.buckets.popleft()
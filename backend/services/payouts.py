@@ -0,0 +1,269 @@
+"""
+Reward payout worker
+Packs reward payments into Algorand atomic transaction groups
+"""
+
+import asyncio
+import uuid
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple, Union
+
+from algosdk import constants
+
+from config import settings
+from models.stake import Stake
+from services.algorand import PaymentGroupUnconfirmed, algorand_service
+
+Payment = Tuple[str, int, str]  # (receiver, amount in microAlgos, note)
+
+
+class PayoutRequest(NamedTuple):
+    """A queued payment and the future resolved with its transaction id"""
+    payment: Payment
+    future: asyncio.Future
+
+
+class UnconfirmedPayout(NamedTuple):
+    """A payment that was submitted but not seen confirmed in time
+
+    ``confirmation`` resolves to True once the payment confirms, or to False
+    once it can no longer confirm and may be paid again.
+    """
+    txid: str
+    confirmation: asyncio.Future
+
+
+class UnconfirmedGroup(NamedTuple):
+    """A submitted group awaiting reconciliation"""
+    last_valid: int
+    confirmation: asyncio.Future
+
+
+def record_payout(stake: Stake, payout: Union[str, UnconfirmedPayout]) -> str:
+    """
+    Record a claimed stake's payment
+
+    A payment still awaiting confirmation keeps the stake claimed; the claim
+    is released only if the payment can no longer confirm.
+
+    Args:
+        stake: Claimed stake
+        payout: Transaction ID, or the unconfirmed payment
+
+    Returns:
+        Transaction ID
+    """
+    if not isinstance(payout, UnconfirmedPayout):
+        stake.payout_txn_id = payout
+        stake.payout_confirmed = True
+        return payout
+
+    stake.payout_txn_id = payout.txid
+    stake.payout_confirmed = False
+
+    def settle(confirmation: asyncio.Future) -> None:
+        if confirmation.cancelled() or stake.payout_txn_id != payout.txid:
+            return
+        if confirmation.result():
+            stake.payout_confirmed = True
+        else:
+            stake.claimed = False
+            stake.payout_txn_id = None
+
+    payout.confirmation.add_done_callback(settle)
+    return payout.txid
+
+
+class PayoutWorker:
+    """Sends queued reward payments in atomic groups
+
+    Payments from concurrent claims are queued and sent together in groups of
+    up to ``group_size``, waiting at most ``flush_interval`` seconds for a
+    group to fill up. Each group costs one suggested-params fetch and one
+    submission to algod. With payouts disabled, groups are assigned mock
+    transaction ids instead of being sent.
+
+    A group that was submitted but not seen confirmed in time is neither paid
+    nor failed: its payments resolve to ``UnconfirmedPayout`` and the group is
+    checked again every ``reconcile_interval`` seconds until it confirms or
+    its validity window passes.
+    """
+
+    def __init__(
+        self,
+        group_size: int = 16,
+        flush_interval: float = 0.05,
+        reconcile_interval: float = 10.0,
+        enabled: bool = False
+    ) -> None:
+        """Initialize worker"""
+        self.group_size = min(group_size, constants.TX_GROUP_LIMIT)
+        self.flush_interval = flush_interval
+        self.reconcile_interval = reconcile_interval
+        self.enabled = enabled
+        self.groups_sent = 0
+        self.payments_sent = 0
+        self.groups_unconfirmed = 0
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._reconcile_task: Optional[asyncio.Task] = None
+        self._collecting: List[PayoutRequest] = []  # Group being filled by _run
+        self._in_flight: Set[asyncio.Task] = set()
+        self._unconfirmed: Dict[str, UnconfirmedGroup] = {}  # first txid -> group
+
+    async def start(self) -> None:
+        """Start draining the payout queue and reconciling unconfirmed groups"""
+        self._queue = asyncio.Queue()
+        self._task = asyncio.create_task(self._run())
+        self._reconcile_task = asyncio.create_task(self._reconcile_loop())
+
+    async def stop(self) -> None:
+        """Send queued payouts and stop"""
+        for task in (self._task, self._reconcile_task):
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._task = None
+        self._reconcile_task = None
+
+        if self._in_flight:
+            await asyncio.gather(*self._in_flight)
+
+        if self._queue:
+            # Includes the group _run was still filling when it was cancelled
+            pending, self._collecting = self._collecting, []
+            while not self._queue.empty():
+                pending.append(self._queue.get_nowait())
+            self._queue = None
+            for start in range(0, len(pending), self.group_size):
+                await self._send_group(pending[start:start + self.group_size])
+
+    async def pay_many(self, payments: List[Payment]) -> List[Union[str, Exception]]:
+        """
+        Pay a batch of rewards
+
+        Payments may span several groups; each group succeeds or fails as a
+        whole, independently of the others.
+
+        Args:
+            payments: (receiver, amount in microAlgos, note) per payment
+
+        Returns:
+            Transaction ID, ``UnconfirmedPayout`` or the error that failed its
+            group, per payment
+        """
+        loop = asyncio.get_running_loop()
+        requests = [PayoutRequest(payment, loop.create_future()) for payment in payments]
+
+        if self._queue is None:
+            # Worker not started (scripts, tests): send directly
+            for start in range(0, len(requests), self.group_size):
+                await self._send_group(requests[start:start + self.group_size])
+        else:
+            for request in requests:
+                self._queue.put_nowait(request)
+
+        return list(await asyncio.gather(
+            *(r.future for r in requests), return_exceptions=True
+        ))
+
+    async def _run(self) -> None:
+        """Drain the queue in groups, keeping several groups in flight"""
+        while True:
+            group = self._collecting = [await self._queue.get()]
+
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + self.flush_interval
+            while len(group) < self.group_size:
+                if not self._queue.empty():
+                    group.append(self._queue.get_nowait())
+                    continue
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    group.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            # Confirmation takes a few seconds, so don't hold up the next group
+            task = asyncio.create_task(self._send_group(group))
+            self._collecting = []
+            self._in_flight.add(task)
+            task.add_done_callback(self._in_flight.discard)
+
+    async def _send_group(self, group: List[PayoutRequest]) -> None:
+        """Send one atomic group and resolve its futures"""
+        payments = [request.payment for request in group]
+        try:
+            if self.enabled:
+                # algod calls block, so keep them off the event loop
+                txids = await asyncio.to_thread(algorand_service.send_payment_group, payments)
+            else:
+                txids = [f"reward_txn_{uuid.uuid4().hex[:12]}" for _ in payments]
+        except PaymentGroupUnconfirmed as e:
+            # Submitted, so it may still confirm: never report it as failed
+            print(f"Payout group {e.txids[0]} unconfirmed, reconciling later")
+            confirmation = asyncio.get_running_loop().create_future()
+            self._unconfirmed[e.txids[0]] = UnconfirmedGroup(e.last_valid, confirmation)
+            self.groups_unconfirmed += 1
+            for request, txid in zip(group, e.txids):
+                if not request.future.done():
+                    request.future.set_result(UnconfirmedPayout(txid, confirmation))
+            return
+        except Exception as e:
+            print(f"Error sending payout group of {len(group)}: {e}")
+            for request in group:
+                if not request.future.done():
+                    request.future.set_exception(e)
+            return
+
+        self.groups_sent += 1
+        self.payments_sent += len(group)
+        for request, txid in zip(group, txids):
+            if not request.future.done():
+                request.future.set_result(txid)
+
+    async def reconcile(self) -> int:
+        """
+        Check on unconfirmed groups and resolve those that settled
+
+        Returns:
+            Number of groups resolved
+        """
+        resolved = 0
+        for txid, group in list(self._unconfirmed.items()):
+            try:
+                confirmed = await asyncio.to_thread(
+                    algorand_service.payment_confirmed, txid, group.last_valid
+                )
+            except Exception as e:
+                print(f"Error reconciling payout group {txid}: {e}")
+                continue
+            if confirmed is None:
+                continue
+
+            del self._unconfirmed[txid]
+            resolved += 1
+            if confirmed:
+                self.groups_sent += 1
+            if not group.confirmation.done():
+                group.confirmation.set_result(confirmed)
+        return resolved
+
+    async def _reconcile_loop(self) -> None:
+        """Reconcile unconfirmed groups every interval"""
+        while True:
+            await asyncio.sleep(self.reconcile_interval)
+            await self.reconcile()
+
+
+# Global singleton instance
+payout_worker = PayoutWorker(
+    group_size=settings.PAYOUT_GROUP_SIZE,
+    flush_interval=settings.PAYOUT_FLUSH_INTERVAL_MS / 1000,
+    reconcile_interval=settings.PAYOUT_RECONCILE_INTERVAL_SECONDS,
+    enabled=settings.PAYOUTS_ENABLED
+)
@@ -0,0 +1,180 @@
+"""
+AI prediction cache
+Versioned, TTL-bounded LRU cache with single-flight computation
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Dict, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from config import settings
+from models.feature_store import FEATURE_NAMES
+from models.market import Market
+from services.inference import inference_executor
+from storage import storage
+
+CacheKey = Tuple[str, int]  # (market_id, market version)
+
+
+def historical_data(market: Market, features: Optional[np.ndarray] = None) -> Dict:
+    """
+    Model inputs from the incrementally maintained feature store
+
+    Args:
+        market: Market to describe
+        features: The market's row of a feature matrix (looked up if omitted)
+
+    Returns:
+        Current prices and named features
+    """
+    if features is None:
+        features = storage.features.vector(market.id)
+    return {
+        "current_prices": market.prices,
+        "features": dict(zip(FEATURE_NAMES, features.tolist()))
+    }
+
+
+class CachedPrediction(NamedTuple):
+    """A prediction, when it was computed and when it stops being served"""
+    version: int
+    computed_at: float
+    expires_at: float
+    prediction: Dict[str, float]
+
+
+class PredictionCache:
+    """Caches AI predictions per market state
+
+    An entry is served while the market's version matches the one it was
+    computed for and its TTL has not run out; trades, stakes and resolution
+    bump the version. Only the latest version per market is kept, and the
+    least recently used markets are evicted beyond ``max_size``.
+
+    Concurrent misses for the same (market, version) share one computation.
+    Misses and refreshes feed the model the same inputs (``historical_data``).
+    """
+
+    def __init__(self, max_size: int = 10_000, ttl: float = 300.0) -> None:
+        """Initialize cache"""
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, CachedPrediction]" = OrderedDict()
+        self._inflight: Dict[CacheKey, asyncio.Task] = {}
+        self.hits = 0
+        self.misses = 0
+        self.shared = 0  # Misses that joined an in-flight computation
+        self.refreshes = 0
+
+    def entry(self, market_id: str) -> Optional[CachedPrediction]:
+        """Get a market's latest entry, fresh or not"""
+        return self._entries.get(market_id)
+
+    def peek(self, market: Market) -> Optional[Dict[str, float]]:
+        """Get a fresh cached prediction without computing one"""
+        entry = self._entries.get(market.id)
+        if entry is None or entry.version != market.version or entry.expires_at <= time.monotonic():
+            return None
+        self._entries.move_to_end(market.id)
+        return entry.prediction
+
+    async def get(self, market: Market) -> Dict[str, float]:
+        """
+        Get the prediction for a market's current state
+
+        Args:
+            market: Market to predict
+
+        Returns:
+            Outcome probabilities
+        """
+        prediction = self.peek(market)
+        if prediction is not None:
+            self.hits += 1
+            return prediction
+
+        key = (market.id, market.version)
+        task = self._inflight.get(key)
+        if task is not None:
+            self.shared += 1
+        else:
+            self.misses += 1
+            task = self._start(key, market)
+        return await asyncio.shield(task)
+
+    async def refresh(self, market: Market, features: Optional[np.ndarray] = None) -> Dict[str, float]:
+        """
+        Recompute a market's prediction regardless of what is cached
+
+        Args:
+            market: Market to predict
+            features: The market's row of a feature matrix (looked up if omitted)
+
+        Returns:
+            Outcome probabilities
+        """
+        self.refreshes += 1
+        return await asyncio.shield(self._start((market.id, market.version), market, features))
+
+    def invalidate(self, market_id: str) -> None:
+        """Drop a market's cached prediction"""
+        self._entries.pop(market_id, None)
+
+    def _start(self, key: CacheKey, market: Market, features: Optional[np.ndarray] = None) -> asyncio.Task:
+        """Start computing a prediction and register it as in flight"""
+        task = asyncio.create_task(self._compute(market, key[1], features))
+        self._inflight[key] = task
+        task.add_done_callback(lambda done: self._finish(key, done))
+        return task
+
+    def _finish(self, key: CacheKey, task: asyncio.Task) -> None:
+        """Unregister a finished computation (unless a refresh replaced it)"""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+
+    async def _compute(self, market: Market, version: int, features: Optional[np.ndarray]) -> Dict[str, float]:
+        """Run the model in the next inference batch and store the result"""
+        prediction = await inference_executor.predict(
+            market_question=market.question,
+            outcomes=market.outcomes,
+            historical_data=historical_data(market, features),
+            crowd_forecast=market.crowd_forecast
+        )
+
+        current = self._entries.get(market.id)
+        if current is not None and current.version > version:
+            return prediction  # The market moved on while this was computed
+
+        # Latest prediction is also shown on the market and used for edge scans
+        market.ai_prediction = prediction
+        storage.edge_index.set_prediction(market, prediction)
+
+        now = time.monotonic()
+        self._entries[market.id] = CachedPrediction(version, now, now + self.ttl, prediction)
+        self._entries.move_to_end(market.id)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+        return prediction
+
+    def get_metrics(self) -> dict:
+        """Get cache effectiveness counters"""
+        lookups = self.hits + self.misses + self.shared
+        return {
+            "entries": len(self._entries),
+            "in_flight": len(self._inflight),
+            "hits": self.hits,
+            "misses": self.misses,
+            "shared": self.shared,
+            "refreshes": self.refreshes,
+            "hit_rate": (self.hits + self.shared) / lookups if lookups else 0.0
+        }
+
+
+# Global singleton instance
+prediction_cache = PredictionCache(
+    max_size=settings.AI_PREDICTION_CACHE_SIZE,
+    ttl=settings.AI_PREDICTION_TTL_SECONDS
+)
@@ -0,0 +1,224 @@
+"""
+AI prediction refresher
+Refreshes stale predictions in the background within a compute budget
+"""
+
+import asyncio
+import heapq
+import itertools
+import time
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from config import settings
+from models.market import Market, MarketStatus
+from services.prediction_cache import prediction_cache
+from storage import storage
+from utils.dates import to_utc
+
+# (due time.monotonic(), sequence number, market_id)
+ScheduleEntry = Tuple[float, int, str]
+
+
+class PredictionRefresher:
+    """Keeps active markets' AI predictions within their staleness budgets
+
+    A prediction is due once ``max_updates`` trades and stakes have hit its
+    market, or once it is older than the market's age budget: a tenth of the
+    time left until ``end_time``, clamped to [``min_age``, ``max_age``].
+
+    Markets wait in a min-heap keyed on when their prediction falls due, so
+    each tick pops only the due markets, at most ``max_per_minute`` per
+    minute across all markets; markets never predicted are due on creation.
+    Entries are re-keyed lazily: a popped market whose prediction was
+    recomputed in the meantime is pushed back at its new due time, and
+    superseded entries are skipped.
+    """
+
+    def __init__(
+        self,
+        interval: float = 5.0,
+        max_per_minute: int = 600,
+        max_updates: int = 10,
+        min_age: float = 60.0,
+        max_age: float = 3600.0
+    ) -> None:
+        """Initialize refresher"""
+        self.interval = interval
+        self.max_per_minute = max_per_minute
+        self.max_updates = max_updates
+        self.min_age = min_age
+        self.max_age = max_age
+        self.heap: List[ScheduleEntry] = []
+        self._scheduled: Dict[str, float] = {}  # market_id -> due time of its live entry
+        self._sequence = itertools.count()
+        self._task: Optional[asyncio.Task] = None
+
+        # Capacity metrics
+        self.refreshes = 0
+        self.failed_refreshes = 0
+        self.last_due = 0
+        self.lag = 0.0  # Seconds the oldest due market has waited
+
+    @property
+    def budget(self) -> int:
+        """Refreshes allowed per tick"""
+        return max(1, int(self.max_per_minute * self.interval / 60))
+
+    async def start(self) -> None:
+        """Schedule every active market and start the refresh loop"""
+        for market in storage.get_active_markets():
+            self.schedule(market)
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the refresh loop"""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def age_budget(self, market: Market, now: datetime) -> float:
+        """Seconds a market's prediction may age before it is due"""
+        time_left = (to_utc(market.end_time) - now).total_seconds()
+        return min(self.max_age, max(self.min_age, time_left / 10))
+
+    def due_at(self, market: Market, now: datetime, clock: float) -> float:
+        """
+        When a market's prediction runs out of age budget
+
+        Args:
+            market: Active market
+            now: Current UTC time
+            clock: Current time.monotonic()
+
+        Returns:
+            time.monotonic() deadline (now if it was never predicted)
+        """
+        entry = prediction_cache.entry(market.id)
+        if entry is None:
+            return clock
+        return entry.computed_at + self.age_budget(market, now)
+
+    def urgency(self, market: Market, now: datetime, clock: float) -> float:
+        """
+        How far a market's prediction is past its staleness budget
+
+        Args:
+            market: Active market
+            now: Current UTC time
+            clock: Current time.monotonic()
+
+        Returns:
+            >= 1 when due, infinity if it was never predicted
+        """
+        entry = prediction_cache.entry(market.id)
+        if entry is None:
+            return float("inf")
+        updates = market.version - entry.version
+        age = clock - entry.computed_at
+        return max(updates / self.max_updates, age / self.age_budget(market, now))
+
+    def schedule(self, market: Market, due: Optional[float] = None) -> None:
+        """
+        Queue a market for refresh when its prediction falls due
+
+        Args:
+            market: Active market
+            due: time.monotonic() deadline (from its cached prediction if omitted)
+        """
+        if due is None:
+            due = self.due_at(market, datetime.utcnow(), time.monotonic())
+        scheduled = self._scheduled.get(market.id)
+        if scheduled is not None and scheduled <= due:
+            return  # Already due no later than that
+        self._scheduled[market.id] = due
+        heapq.heappush(self.heap, (due, next(self._sequence), market.id))
+
+    def note_update(self, market: Market) -> None:
+        """Make a market due now once enough trades and stakes have hit it"""
+        entry = prediction_cache.entry(market.id)
+        if entry is not None and market.version - entry.version >= self.max_updates:
+            self.schedule(market, time.monotonic())
+
+    def due_markets(self) -> List[Market]:
+        """Pop the most overdue active markets, up to the per-tick budget"""
+        now = datetime.utcnow()
+        clock = time.monotonic()
+        due: List[Market] = []
+        while self.heap and self.heap[0][0] <= clock and len(due) < self.budget:
+            scheduled, _, market_id = heapq.heappop(self.heap)
+            if self._scheduled.get(market_id) != scheduled:
+                continue  # Superseded by an earlier entry
+            del self._scheduled[market_id]
+
+            market = storage.get_market(market_id)
+            if market is None or market.status != MarketStatus.ACTIVE:
+                continue
+            if self.urgency(market, now, clock) < 1:
+                self.schedule(market, self.due_at(market, now, clock))  # Refreshed meanwhile
+                continue
+            due.append(market)
+
+        self.last_due = len(due)
+        self.lag = max(0.0, clock - self.heap[0][0]) if self.heap else 0.0
+        return due
+
+    async def refresh_due(self) -> int:
+        """
+        Refresh the most overdue predictions
+
+        Returns:
+            Number of predictions refreshed
+        """
+        markets = self.due_markets()
+        if not markets:
+            return 0
+
+        features = storage.features.matrix([m.id for m in markets])
+        results = await asyncio.gather(
+            *(prediction_cache.refresh(m, row) for m, row in zip(markets, features)),
+            return_exceptions=True
+        )
+
+        retry_at = time.monotonic() + self.min_age
+        for market, result in zip(markets, results):
+            self.schedule(market, retry_at if isinstance(result, Exception) else None)
+
+        failed = sum(isinstance(result, Exception) for result in results)
+        self.failed_refreshes += failed
+        self.refreshes += len(results) - failed
+        return len(results) - failed
+
+    async def _run(self) -> None:
+        """Refresh due markets every interval"""
+        while True:
+            try:
+                await self.refresh_due()
+            except Exception as e:
+                print(f"Error refreshing AI predictions: {e}")
+            await asyncio.sleep(self.interval)
+
+    def get_metrics(self) -> dict:
+        """Get refresh and budget metrics"""
+        return {
+            "refreshes": self.refreshes,
+            "failed_refreshes": self.failed_refreshes,
+            "budget_per_tick": self.budget,
+            "scheduled": len(self._scheduled),
+            "last_due": self.last_due,
+            "lag_seconds": self.lag
+        }
+
+
+# Global singleton instance
+prediction_refresher = PredictionRefresher(
+    interval=settings.AI_REFRESH_INTERVAL_SECONDS,
+    max_per_minute=settings.AI_REFRESH_MAX_PER_MINUTE,
+    max_updates=settings.AI_REFRESH_MAX_UPDATES,
+    min_age=settings.AI_REFRESH_MIN_AGE_SECONDS,
+    max_age=settings.AI_REFRESH_MAX_AGE_SECONDS
+)
@@ -0,0 +1,87 @@
+"""
+Prize distribution engine
+Splits a tournament prize pool over the final ranking in integer microAlgos
+"""
+
+import math
+
+import numpy as np
+
+from models.payout import PayoutCurve, PayoutStructure
+
+MICROALGOS_PER_ALGO = 1_000_000
+
+
+def to_microalgos(algos: float) -> int:
+    """Convert an ALGO amount to microAlgos"""
+    return int(round(algos * MICROALGOS_PER_ALGO))
+
+
+def payout_weights(structure: PayoutStructure, field_size: int) -> np.ndarray:
+    """
+    Share of the pool paid to each finishing position
+
+    Curves with more paid places than entrants are truncated and renormalized,
+    so the whole pool is always paid out.
+
+    Args:
+        structure: Payout curve and parameters
+        field_size: Number of ranked participants
+
+    Returns:
+        Weights per position 1..field_size, summing to 1 (all zero if empty)
+    """
+    weights = np.zeros(field_size, dtype=np.float64)
+    if field_size == 0:
+        return weights
+
+    if structure.curve == PayoutCurve.TOP_K:
+        paid = np.asarray(structure.percentages[:field_size], dtype=np.float64)
+    elif structure.curve == PayoutCurve.GEOMETRIC:
+        places = min(structure.places, field_size)
+        paid = structure.ratio ** np.arange(places, dtype=np.float64)
+    elif structure.curve == PayoutCurve.TOP_PERCENT:
+        places = min(field_size, max(1, math.ceil(field_size * structure.top_percent / 100)))
+        paid = np.ones(places, dtype=np.float64)
+    else:
+        raise ValueError(f"Unknown payout curve: {structure.curve}")
+
+    weights[:len(paid)] = paid / paid.sum()
+    return weights
+
+
+def distribute(pool: int, weights: np.ndarray, new_group: np.ndarray) -> np.ndarray:
+    """
+    Split a pool over ranked positions, sharing prizes between ties
+
+    Tied participants pool the prizes of the positions they occupy and split
+    them evenly. Amounts are then floored to whole units and the leftover
+    units go to the largest fractional remainders (better rank first), so the
+    result sums to exactly pool.
+
+    Args:
+        pool: Prize pool in integer units (microAlgos)
+        weights: Share per position, from payout_weights
+        new_group: True where a position's score differs from the one above
+
+    Returns:
+        Integer amount per position
+    """
+    if len(weights) == 0:
+        return np.zeros(0, dtype=np.int64)
+
+    exact = pool * weights
+
+    # Average each run of tied positions
+    group = np.cumsum(new_group) - 1
+    group_total = np.bincount(group, weights=exact)
+    group_size = np.bincount(group)
+    exact = group_total[group] / group_size[group]
+
+    amounts = np.floor(exact).astype(np.int64)
+    leftover = pool - int(amounts.sum())
+    if leftover > 0:
+        # Stable sort keeps rank order among equal remainders
+        order = np.argsort(amounts - exact, kind="stable")
+        amounts[order[:leftover]] += 1
+    return amounts
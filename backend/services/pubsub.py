@@ -0,0 +1,446 @@
+"""
+Pub/sub transports for fanning WebSocket broadcasts out across workers
+
+Each uvicorn worker owns its own sockets, so a broadcast issued in one worker
+is delivered to its local clients directly and published on the bus for every
+other worker to deliver to theirs. Envelopes are stamped with the publishing
+worker's id and never delivered back to it, so each subscriber sees an update
+exactly once.
+"""
+
+import asyncio
+import json
+import os
+import uuid
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from config import settings
+
+BusHandler = Callable[[dict], Awaitable[None]]
+
+
+def _decode_frame(frame: bytes) -> Optional[List[dict]]:
+    """Decode a batch of envelopes, logging and skipping malformed frames"""
+    try:
+        batch = json.loads(frame)
+    except ValueError as e:
+        print(f"Skipping malformed pub/sub frame: {e}")
+        return None
+    if not isinstance(batch, list) or not all(isinstance(envelope, dict) for envelope in batch):
+        print("Skipping pub/sub frame that is not a list of envelopes")
+        return None
+    return batch
+
+
+class PubSubBackend:
+    """Base class for cross-worker pub/sub transports
+
+    Published envelopes are queued and flushed in batches of up to
+    ``batch_size``, waiting at most ``flush_interval`` seconds for a batch
+    to fill up. Subclasses implement ``_open``, ``_close`` and ``_send_batch``
+    and hand received batches to ``_deliver``.
+    """
+
+    def __init__(self, batch_size: int = 100, flush_interval: float = 0.005) -> None:
+        """Initialize backend"""
+        self.worker_id = uuid.uuid4().hex
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._handler: Optional[BusHandler] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._flush_task: Optional[asyncio.Task] = None
+
+    @property
+    def pending(self) -> int:
+        """Number of envelopes waiting to be flushed"""
+        return self._queue.qsize() if self._queue else 0
+
+    async def start(self, handler: BusHandler) -> None:
+        """
+        Open the transport and start flushing published envelopes
+
+        Args:
+            handler: Coroutine called with each envelope from other workers
+        """
+        self._handler = handler
+        self._queue = asyncio.Queue()
+        await self._open()
+        self._flush_task = asyncio.create_task(self._flush_loop())
+
+    async def stop(self) -> None:
+        """Flush pending envelopes and close the transport"""
+        if self._flush_task:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+
+        if self._queue and not self._queue.empty():
+            batch = []
+            while not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            try:
+                await self._send_batch(batch)
+            except Exception as e:
+                print(f"Error flushing pub/sub batch on shutdown: {e}")
+
+        self._queue = None
+        await self._close()
+
+    async def publish(self, envelope: dict) -> None:
+        """
+        Queue an envelope for delivery to the other workers
+
+        Args:
+            envelope: JSON-serializable message envelope
+        """
+        if self._queue is None:
+            return  # Bus not started (single worker scripts, tests)
+
+        envelope["origin"] = self.worker_id
+        self._queue.put_nowait(envelope)
+
+    async def _flush_loop(self) -> None:
+        """Drain the publish queue in batches"""
+        while True:
+            batch = [await self._queue.get()]
+
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + self.flush_interval
+            while len(batch) < self.batch_size:
+                if not self._queue.empty():
+                    batch.append(self._queue.get_nowait())
+                    continue
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            try:
+                await self._send_batch(batch)
+            except Exception as e:
+                print(f"Error publishing pub/sub batch of {len(batch)}: {e}")
+
+    async def _deliver(self, batch: List[dict]) -> None:
+        """Hand envelopes published by other workers to the handler"""
+        for envelope in batch:
+            if envelope.get("origin") == self.worker_id:
+                continue
+            try:
+                await self._handler(envelope)
+            except Exception as e:
+                print(f"Error handling pub/sub envelope: {e}")
+
+    async def _open(self) -> None:
+        """Open the underlying transport"""
+
+    async def _close(self) -> None:
+        """Close the underlying transport"""
+
+    async def _send_batch(self, batch: List[dict]) -> None:
+        """Send a batch of envelopes to the other workers"""
+        raise NotImplementedError
+
+
+class InProcessPubSub(PubSubBackend):
+    """Pub/sub between managers living in the same process
+
+    Backends sharing a ``hub`` list deliver to each other; a backend with its
+    own hub (the default) has no peers, which is the single-worker setup.
+    """
+
+    def __init__(self, hub: Optional[List["InProcessPubSub"]] = None, **kwargs) -> None:
+        """Initialize backend"""
+        super().__init__(**kwargs)
+        self.hub = hub if hub is not None else []
+
+    async def _open(self) -> None:
+        """Join the hub"""
+        self.hub.append(self)
+
+    async def _close(self) -> None:
+        """Leave the hub"""
+        if self in self.hub:
+            self.hub.remove(self)
+
+    async def _send_batch(self, batch: List[dict]) -> None:
+        """Deliver the batch to every other backend on the hub"""
+        for peer in list(self.hub):
+            if peer is not self:
+                await peer._deliver(batch)
+
+
+class UnixSocketPubSub(PubSubBackend):
+    """Pub/sub over a Unix domain socket broker
+
+    The first worker to take the lock file becomes the broker and listens on
+    the socket; the others connect to it. Frames are newline-delimited JSON
+    arrays of envelopes. The broker relays each frame to every peer except the
+    sender. If the broker goes away, peers race for the lock again.
+    """
+
+    RECONNECT_DELAY = 0.5
+
+    def __init__(self, path: str, **kwargs) -> None:
+        """Initialize backend"""
+        super().__init__(**kwargs)
+        self.path = path
+        self.lock_path = f"{path}.lock"
+        self.is_broker = False
+        self._lock_fd: Optional[int] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._peers: Dict[int, asyncio.StreamWriter] = {}
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._reader_task: Optional[asyncio.Task] = None
+        self._closing = False
+
+    async def _open(self) -> None:
+        """Become the broker or connect to the existing one"""
+        self._closing = False
+        await self._connect()
+
+    async def _connect(self) -> None:
+        """Elect a broker via the lock file and attach to it"""
+        while not self._closing:
+            if self._try_lock():
+                await self._serve()
+                return
+            try:
+                reader, writer = await asyncio.open_unix_connection(
+                    self.path, limit=2 ** 24
+                )
+            except (FileNotFoundError, ConnectionRefusedError):
+                await asyncio.sleep(self.RECONNECT_DELAY)
+                continue
+
+            self._writer = writer
+            self._reader_task = asyncio.create_task(self._read_from_broker(reader))
+            print(f"📡 Worker {self.worker_id[:8]} connected to pub/sub broker {self.path}")
+            return
+
+    def _try_lock(self) -> bool:
+        """Try to take the broker lock without blocking"""
+        import fcntl
+
+        fd = os.open(self.lock_path, os.O_CREAT | os.O_RDWR, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            os.close(fd)
+            return False
+        self._lock_fd = fd
+        return True
+
+    async def _serve(self) -> None:
+        """Listen for peer workers as the broker"""
+        if os.path.exists(self.path):
+            os.unlink(self.path)  # Stale socket from a dead broker
+
+        self._server = await asyncio.start_unix_server(
+            self._handle_peer, path=self.path, limit=2 ** 24
+        )
+        self.is_broker = True
+        print(f"📡 Worker {self.worker_id[:8]} is the pub/sub broker on {self.path}")
+
+    async def _handle_peer(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter
+    ) -> None:
+        """Relay frames from one peer to the broker and all other peers"""
+        peer_id = id(writer)
+        self._peers[peer_id] = writer
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                batch = _decode_frame(line)
+                if batch is None:
+                    continue  # Not relayed either
+                await self._relay(line, exclude=peer_id)
+                await self._deliver(batch)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self._peers.pop(peer_id, None)
+            writer.close()
+
+    async def _relay(self, frame: bytes, exclude: Optional[int] = None) -> None:
+        """Write a frame to every connected peer, draining them concurrently"""
+        peers = [(peer_id, writer) for peer_id, writer in self._peers.items() if peer_id != exclude]
+        for _, writer in peers:
+            writer.write(frame)
+
+        # A slow peer delays this relay by its own drain time, not everyone's
+        results = await asyncio.gather(
+            *(writer.drain() for _, writer in peers), return_exceptions=True
+        )
+        for (peer_id, _), result in zip(peers, results):
+            if isinstance(result, Exception):
+                print(f"Dropping pub/sub peer after failed write: {result!r}")
+                self._peers.pop(peer_id, None)
+
+    async def _read_from_broker(self, reader: asyncio.StreamReader) -> None:
+        """Deliver frames relayed by the broker, reconnecting if it dies"""
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                batch = _decode_frame(line)
+                if batch is not None:
+                    await self._deliver(batch)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+
+        self._writer = None
+        if not self._closing:
+            print(f"📡 Lost pub/sub broker, worker {self.worker_id[:8]} reconnecting...")
+            await self._connect()
+
+    async def _send_batch(self, batch: List[dict]) -> None:
+        """Send a frame to the broker, or to all peers when we are the broker"""
+        frame = json.dumps(batch).encode() + b"\n"
+        if self.is_broker:
+            await self._relay(frame)
+        elif self._writer is not None:
+            self._writer.write(frame)
+            await self._writer.drain()
+
+    async def _close(self) -> None:
+        """Tear down broker or client connection"""
+        self._closing = True
+
+        if self._reader_task:
+            self._reader_task.cancel()
+            self._reader_task = None
+        if self._writer:
+            self._writer.close()
+            self._writer = None
+
+        if self._server:
+            self._server.close()
+            for writer in self._peers.values():
+                writer.close()
+            self._peers.clear()
+            self._server = None
+            self.is_broker = False
+            if os.path.exists(self.path):
+                os.unlink(self.path)
+
+        if self._lock_fd is not None:
+            os.close(self._lock_fd)
+            self._lock_fd = None
+
+
+class RedisPubSub(PubSubBackend):
+    """Pub/sub over a Redis (or Redis-compatible) channel
+
+    Malformed messages are logged and skipped. If the subscription's
+    connection fails, the reader resubscribes after ``RECONNECT_DELAY``;
+    batches published meanwhile are missed.
+    """
+
+    RECONNECT_DELAY = 0.5
+
+    def __init__(self, url: str, channel: str, **kwargs) -> None:
+        """Initialize backend"""
+        super().__init__(**kwargs)
+        self.url = url
+        self.channel = channel
+        self._client = None
+        self._pubsub = None
+        self._reader_task: Optional[asyncio.Task] = None
+
+    async def _open(self) -> None:
+        """Connect and subscribe to the channel"""
+        try:
+            import redis.asyncio as aioredis
+        except ImportError as e:
+            raise RuntimeError(
+                "The redis pub/sub backend requires the 'redis' package"
+            ) from e
+
+        self._client = aioredis.from_url(self.url)
+        await self._subscribe()
+        self._reader_task = asyncio.create_task(self._read())
+        print(f"📡 Worker {self.worker_id[:8]} subscribed to {self.channel} on {self.url}")
+
+    async def _subscribe(self) -> None:
+        """Open a fresh subscription to the channel"""
+        self._pubsub = self._client.pubsub()
+        await self._pubsub.subscribe(self.channel)
+
+    async def _drop_subscription(self) -> None:
+        """Discard a broken subscription"""
+        pubsub, self._pubsub = self._pubsub, None
+        if pubsub is not None:
+            try:
+                await pubsub.aclose()
+            except Exception:
+                pass  # Connection already gone
+
+    async def _read(self) -> None:
+        """Deliver batches published on the channel, resubscribing on failure"""
+        while True:
+            try:
+                if self._pubsub is None:
+                    await self._subscribe()
+                    print(f"📡 Worker {self.worker_id[:8]} resubscribed to {self.channel}")
+
+                async for message in self._pubsub.listen():
+                    if message.get("type") != "message":
+                        continue
+                    batch = _decode_frame(message["data"])
+                    if batch is not None:
+                        await self._deliver(batch)
+                raise ConnectionError("Subscription ended")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"📡 Lost Redis subscription ({e!r}), worker {self.worker_id[:8]} resubscribing...")
+                await self._drop_subscription()
+                await asyncio.sleep(self.RECONNECT_DELAY)
+
+    async def _send_batch(self, batch: List[dict]) -> None:
+        """Publish a batch on the channel"""
+        await self._client.publish(self.channel, json.dumps(batch))
+
+    async def _close(self) -> None:
+        """Unsubscribe and disconnect"""
+        if self._reader_task:
+            self._reader_task.cancel()
+            self._reader_task = None
+        if self._pubsub:
+            try:
+                await self._pubsub.unsubscribe(self.channel)
+            except Exception as e:
+                print(f"Error unsubscribing from {self.channel}: {e}")
+            await self._drop_subscription()
+        if self._client:
+            await self._client.aclose()
+            self._client = None
+
+
+def create_pubsub_backend() -> PubSubBackend:
+    """Create the pub/sub backend selected by WS_PUBSUB_BACKEND"""
+    options = {
+        "batch_size": settings.WS_PUBSUB_BATCH_SIZE,
+        "flush_interval": settings.WS_PUBSUB_FLUSH_INTERVAL_MS / 1000,
+    }
+    backend = settings.WS_PUBSUB_BACKEND.lower()
+
+    if backend == "memory":
+        return InProcessPubSub(**options)
+    if backend == "unix":
+        return UnixSocketPubSub(settings.WS_PUBSUB_SOCKET_PATH, **options)
+    if backend == "redis":
+        return RedisPubSub(settings.REDIS_URL, settings.WS_PUBSUB_CHANNEL, **options)
+
+    raise ValueError(f"Unknown WS_PUBSUB_BACKEND: {settings.WS_PUBSUB_BACKEND}")
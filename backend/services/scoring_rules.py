@@ -0,0 +1,95 @@
+"""
+Proper scoring rules for probabilistic tournament forecasts
+All rules are positively oriented: higher totals rank higher
+"""
+
+from typing import Dict, Callable
+
+import numpy as np
+
+# Floor for log scores so a zero-probability miss costs a finite amount
+LOG_SCORE_FLOOR = 1e-6
+
+
+def quadratic_score(probabilities: np.ndarray, outcomes: np.ndarray) -> np.ndarray:
+    """
+    Brier (quadratic) score, 2 * p_o - sum(p^2), which equals 1 - Brier
+
+    Args:
+        probabilities: Forecasts shaped (participants, markets, outcomes)
+        outcomes: Winning outcome index per market, shaped (markets,)
+
+    Returns:
+        Scores shaped (participants, markets)
+    """
+    p_outcome = _outcome_probability(probabilities, outcomes)
+    return 2.0 * p_outcome - _sum_of_squares(probabilities)
+
+
+def log_score(probabilities: np.ndarray, outcomes: np.ndarray) -> np.ndarray:
+    """
+    Logarithmic score, ln(p_o)
+
+    Args:
+        probabilities: Forecasts shaped (participants, markets, outcomes)
+        outcomes: Winning outcome index per market, shaped (markets,)
+
+    Returns:
+        Scores shaped (participants, markets)
+    """
+    p_outcome = _outcome_probability(probabilities, outcomes)
+    return np.log(np.maximum(p_outcome, LOG_SCORE_FLOOR))
+
+
+def spherical_score(probabilities: np.ndarray, outcomes: np.ndarray) -> np.ndarray:
+    """
+    Spherical score, p_o / ||p||
+
+    Args:
+        probabilities: Forecasts shaped (participants, markets, outcomes)
+        outcomes: Winning outcome index per market, shaped (markets,)
+
+    Returns:
+        Scores shaped (participants, markets)
+    """
+    p_outcome = _outcome_probability(probabilities, outcomes)
+    norms = np.sqrt(_sum_of_squares(probabilities))
+    return np.divide(p_outcome, norms, out=np.zeros_like(p_outcome), where=norms > 0)
+
+
+SCORING_RULES: Dict[str, Callable[[np.ndarray, np.ndarray], np.ndarray]] = {
+    "brier": quadratic_score,
+    "log": log_score,
+    "spherical": spherical_score,
+}
+
+
+def score_forecasts(rule: str, probabilities: np.ndarray, outcomes: np.ndarray) -> np.ndarray:
+    """
+    Score every participant's forecasts on every resolved market
+
+    Args:
+        rule: One of brier, log or spherical
+        probabilities: Forecasts shaped (participants, markets, outcomes)
+        outcomes: Winning outcome index per market, shaped (markets,)
+
+    Returns:
+        Total score per participant, shaped (participants,)
+    """
+    if probabilities.shape[1] == 0:
+        return np.zeros(probabilities.shape[0], dtype=np.float64)
+    return SCORING_RULES[rule](probabilities, outcomes).sum(axis=1, dtype=np.float64)
+
+
+def _sum_of_squares(probabilities: np.ndarray) -> np.ndarray:
+    """Squared norm of each forecast (outcome axes are short, so loop over them)"""
+    total = np.zeros(probabilities.shape[:2], dtype=probabilities.dtype)
+    for k in range(probabilities.shape[2]):
+        total += probabilities[..., k] * probabilities[..., k]
+    return total
+
+
+def _outcome_probability(probabilities: np.ndarray, outcomes: np.ndarray) -> np.ndarray:
+    """Probability each forecast assigned to the winning outcome"""
+    markets = np.arange(probabilities.shape[1])
+    return probabilities[:, markets, outcomes.astype(np.intp)]
@@ -0,0 +1,63 @@
+"""
+Stake settlement service
+Computes stake rewards when a market resolves
+"""
+
+import numpy as np
+
+from models.market import Market
+from models.stake_book import ClaimLedger
+from storage import storage
+
+
+class SettlementService:
+    """Service for settling insight stakes"""
+
+    def settle_market(self, market: Market) -> ClaimLedger:
+        """
+        Settle every stake on a resolved market in one vectorized pass
+
+        Correct stakes get their amount back plus a share of the incorrect
+        stakes proportional to their amount. Stakers' calibration aggregates
+        are updated from the same arrays.
+
+        Args:
+            market: Market with resolved_outcome set
+
+        Returns:
+            The market's claim ledger
+        """
+        book = storage.get_stake_book(market.id)
+        amounts = book.amounts
+
+        winning_code = book.outcome_codes.get(market.resolved_outcome)
+        if winning_code is None:
+            correct = np.zeros(len(amounts), dtype=bool)
+        else:
+            correct = book.codes == winning_code
+
+        total_staked = float(amounts.sum())
+        total_correct = float(amounts[correct].sum())
+        total_incorrect = total_staked - total_correct
+
+        rewards = np.zeros(len(amounts), dtype=np.float64)
+        if total_correct > 0:
+            # Reward = original stake + proportional share of incorrect stakes
+            winning_amounts = amounts[correct]
+            rewards[correct] = winning_amounts + winning_amounts / total_correct * total_incorrect
+
+        storage.calibration.record(book.staker_ids, book.confidences, correct, amounts)
+
+        book.ledger = ClaimLedger(
+            winning_outcome=market.resolved_outcome,
+            correct=correct,
+            rewards=rewards,
+            rows=book.rows,
+            total_correct=total_correct,
+            total_incorrect=total_incorrect
+        )
+        return book.ledger
+
+
+# Global singleton instance
+settlement_service = SettlementService()
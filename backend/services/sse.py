@@ -0,0 +1,227 @@
+"""
+Server-Sent Events fan-out for read-only market update consumers
+"""
+
+import asyncio
+import json
+import uuid
+from collections import deque
+from typing import AsyncIterator, Deque, Dict, List, NamedTuple, Optional, Set
+
+from config import settings
+
+FIREHOSE = "*"
+
+
+class SSEEvent(NamedTuple):
+    """A serialized market update ready to be written to any listener"""
+    id: int  # Sequence number within this broadcaster's epoch
+    market_id: str
+    payload: bytes
+
+
+class SSEListener:
+    """One connected SSE client"""
+
+    def __init__(self, topic: str, queue_size: int) -> None:
+        """Initialize listener"""
+        self.topic = topic
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.dropped = False
+
+
+class SSEBroadcaster:
+    """Fans market updates out to SSE listeners
+
+    Every update is encoded into its SSE wire format once and the same bytes
+    object is queued for every listener. A bounded history of recent events
+    lets clients resume from ``Last-Event-ID``.
+
+    Event ids are ``<epoch>-<sequence>``, where the epoch is random per
+    broadcaster (i.e. per worker process and restart), so an id is only
+    meaningful to the worker that issued it. A client resuming from another
+    worker's id, or from an event that has already left the history, gets a
+    ``reset`` event telling it to refetch current state instead of a replay.
+    """
+
+    def __init__(
+        self,
+        history_size: int = 1000,
+        queue_size: int = 256,
+        keepalive_seconds: float = 15.0,
+        retry_ms: int = 3000
+    ) -> None:
+        """Initialize broadcaster"""
+        self.epoch = uuid.uuid4().hex[:8]
+        self.history: Deque[SSEEvent] = deque(maxlen=history_size)
+        self.queue_size = queue_size
+        self.keepalive_seconds = keepalive_seconds
+        self.retry_ms = retry_ms
+        self.listeners: Dict[str, Set[SSEListener]] = {}  # market_id or FIREHOSE -> listeners
+        self.next_id = 1
+        self.dropped_listeners = 0
+        self.resets = 0
+
+    def publish(self, market_id: str, message: str) -> None:
+        """
+        Publish a serialized market update to listeners
+
+        Args:
+            market_id: Market identifier
+            message: JSON-encoded update (as sent over WebSocket)
+        """
+        event_id = self.next_id
+        self.next_id += 1
+
+        event = SSEEvent(
+            id=event_id,
+            market_id=market_id,
+            payload=f"id: {self.epoch}-{event_id}\nevent: market_update\ndata: {message}\n\n".encode()
+        )
+        self.history.append(event)
+
+        for topic in (market_id, FIREHOSE):
+            for listener in list(self.listeners.get(topic, ())):
+                self._enqueue(listener, event)
+
+    def _enqueue(self, listener: SSEListener, event: SSEEvent) -> None:
+        """Queue an event, cutting off listeners that fell too far behind"""
+        try:
+            listener.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # The client reconnects with Last-Event-ID and replays from history
+            listener.dropped = True
+            self.dropped_listeners += 1
+            self._remove(listener)
+            while not listener.queue.empty():
+                listener.queue.get_nowait()
+            listener.queue.put_nowait(None)
+
+    def _remove(self, listener: SSEListener) -> None:
+        """Stop delivering to a listener"""
+        listeners = self.listeners.get(listener.topic)
+        if listeners is not None:
+            listeners.discard(listener)
+            if not listeners:
+                del self.listeners[listener.topic]
+
+    def sequence_of(self, last_event_id: str) -> Optional[int]:
+        """
+        Get the sequence number of an event id issued by this broadcaster
+
+        Args:
+            last_event_id: Event id as sent by the client
+
+        Returns:
+            Sequence number, or None for ids from another worker or epoch
+        """
+        epoch, _, sequence = last_event_id.rpartition("-")
+        if epoch != self.epoch or not sequence.isdigit():
+            return None
+        return int(sequence)
+
+    def replay(self, last_sequence: int, market_id: Optional[str] = None) -> Optional[List[SSEEvent]]:
+        """
+        Get buffered events newer than last_sequence
+
+        Args:
+            last_sequence: Sequence number of the last event the client received
+            market_id: Only replay events for this market (None for all)
+
+        Returns:
+            Events in publication order, or None if some have already left
+            the history
+        """
+        if last_sequence >= self.next_id - 1:
+            return []
+        if not self.history or self.history[0].id > last_sequence + 1:
+            return None
+
+        # Ids are contiguous, so the first event to replay is found by offset
+        start = last_sequence - self.history[0].id + 1
+        events = list(self.history)[start:]
+        if market_id is not None:
+            events = [e for e in events if e.market_id == market_id]
+        return events
+
+    def _reset_frame(self, reason: str) -> bytes:
+        """Encode an event telling the client to refetch state, carrying the latest id"""
+        self.resets += 1
+        data = json.dumps({"type": "reset", "reason": reason})
+        return f"id: {self.epoch}-{self.next_id - 1}\nevent: reset\ndata: {data}\n\n".encode()
+
+    async def stream(
+        self,
+        market_id: Optional[str] = None,
+        last_event_id: Optional[str] = None
+    ) -> AsyncIterator[bytes]:
+        """
+        Stream SSE frames for one market, or every market if market_id is None
+
+        Args:
+            market_id: Market identifier (None for the firehose)
+            last_event_id: Resume after this event id
+
+        Yields:
+            Encoded SSE frames
+        """
+        topic = market_id if market_id is not None else FIREHOSE
+        listener = SSEListener(topic, self.queue_size)
+        self.listeners.setdefault(topic, set()).add(listener)
+
+        try:
+            yield f"retry: {self.retry_ms}\n\n".encode()
+
+            replayed_up_to = 0
+            if last_event_id is not None:
+                last_sequence = self.sequence_of(last_event_id)
+                events = None if last_sequence is None else self.replay(last_sequence, market_id)
+                if events is None:
+                    # Events queued so far are covered by the client's refetch
+                    replayed_up_to = self.next_id - 1
+                    yield self._reset_frame(
+                        "unknown_stream" if last_sequence is None else "history_expired"
+                    )
+                else:
+                    for event in events:
+                        replayed_up_to = event.id
+                        yield event.payload
+
+            while True:
+                try:
+                    event = await asyncio.wait_for(
+                        listener.queue.get(), self.keepalive_seconds
+                    )
+                except asyncio.TimeoutError:
+                    yield b": keepalive\n\n"
+                    continue
+
+                if event is None:
+                    break  # Dropped for falling behind
+                if event.id <= replayed_up_to:
+                    continue  # Already sent during replay
+                yield event.payload
+        finally:
+            self._remove(listener)
+
+    def get_metrics(self) -> dict:
+        """Get listener counts and queue depths"""
+        listeners = [l for group in self.listeners.values() for l in group]
+        return {
+            "listeners": len(listeners),
+            "firehose_listeners": len(self.listeners.get(FIREHOSE, ())),
+            "max_queue_depth": max((l.queue.qsize() for l in listeners), default=0),
+            "history_size": len(self.history),
+            "last_event_id": f"{self.epoch}-{self.next_id - 1}",
+            "dropped_listeners": self.dropped_listeners,
+            "resets": self.resets
+        }
+
+
+# Global singleton instance
+sse_broadcaster = SSEBroadcaster(
+    history_size=settings.SSE_HISTORY_SIZE,
+    queue_size=settings.SSE_QUEUE_SIZE,
+    keepalive_seconds=settings.SSE_KEEPALIVE_SECONDS,
+    retry_ms=settings.SSE_RETRY_MS
+)
@@ -0,0 +1,175 @@
+"""
+Tournament lifecycle scheduler
+Starts and completes tournaments when their start_time and end_time arrive
+"""
+
+import asyncio
+import heapq
+import itertools
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from config import settings
+from models.tournament import Tournament, TournamentStatus
+from services.tournament_scoring import tournament_scoring
+from services.websocket import websocket_manager
+from storage import storage
+from utils.dates import to_utc
+
+START = "start"
+COMPLETE = "complete"
+
+# (due time, sequence number, tournament_id, action)
+ScheduleEntry = Tuple[datetime, int, str, str]
+
+
+class TournamentScheduler:
+    """Fires tournament start and end deadlines from a time-ordered heap
+
+    The loop sleeps until the earliest deadline or until a new entry is
+    scheduled, so idle tournaments cost nothing. Entries are never removed
+    when a tournament is started or completed by hand; the action re-checks
+    the tournament status when it fires and skips stale entries instead.
+    """
+
+    def __init__(self, min_participants: int = 2) -> None:
+        """Initialize scheduler"""
+        self.min_participants = min_participants
+        self.heap: List[ScheduleEntry] = []
+        self._sequence = itertools.count()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        """
+        Schedule every open tournament and start the loop
+
+        Deadlines that passed while the server was down are due immediately,
+        so they are recovered on the loop's first iteration.
+        """
+        self._wakeup = asyncio.Event()
+        for tournament in storage.get_all_tournaments():
+            self.schedule(tournament)
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the loop"""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._wakeup = None
+
+    def schedule(self, tournament: Tournament) -> None:
+        """
+        Schedule a tournament's pending start and end deadlines
+
+        Args:
+            tournament: Tournament to schedule
+        """
+        if tournament.status == TournamentStatus.PENDING:
+            self._push(tournament.start_time, tournament.id, START)
+        if tournament.status in (TournamentStatus.PENDING, TournamentStatus.ACTIVE):
+            self._push(tournament.end_time, tournament.id, COMPLETE)
+
+    def _push(self, due: datetime, tournament_id: str, action: str) -> None:
+        """Add an entry and wake the loop if it is the new earliest deadline"""
+        entry = (to_utc(due), next(self._sequence), tournament_id, action)
+        heapq.heappush(self.heap, entry)
+        if self._wakeup is not None and self.heap[0] is entry:
+            self._wakeup.set()
+
+    async def _run(self) -> None:
+        """Sleep until the next deadline and fire it"""
+        while True:
+            self._wakeup.clear()
+
+            if not self.heap:
+                await self._wakeup.wait()
+                continue
+
+            delay = (self.heap[0][0] - datetime.utcnow()).total_seconds()
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            _, _, tournament_id, action = heapq.heappop(self.heap)
+            try:
+                await self._fire(tournament_id, action)
+            except Exception as e:
+                print(f"Error running scheduled {action} for {tournament_id}: {e}")
+
+    async def _fire(self, tournament_id: str, action: str) -> None:
+        """Run a due action if the tournament is still in the expected state"""
+        tournament = storage.get_tournament(tournament_id)
+        if not tournament:
+            return
+
+        if action == START and tournament.status == TournamentStatus.PENDING:
+            if len(tournament.participants) < self.min_participants:
+                await self._cancel(tournament)
+            else:
+                await self._start(tournament)
+        elif action == COMPLETE and tournament.status == TournamentStatus.ACTIVE:
+            await self._complete(tournament)
+
+    async def _start(self, tournament: Tournament) -> None:
+        """Activate a tournament that reached its start time"""
+        tournament.status = TournamentStatus.ACTIVE
+        storage.update_tournament(tournament.id, tournament)
+
+        await websocket_manager.send_tournament_update(
+            tournament_id=tournament.id,
+            update_type="started",
+            data={
+                "start_time": datetime.utcnow().isoformat(),
+                "participant_count": len(tournament.participants)
+            }
+        )
+
+        for result in tournament_scoring.advance_rounds(tournament):
+            await websocket_manager.send_tournament_update(
+                tournament_id=tournament.id,
+                update_type="round_completed",
+                data=result
+            )
+
+    async def _cancel(self, tournament: Tournament) -> None:
+        """Cancel a tournament that reached its start time without enough players"""
+        tournament.status = TournamentStatus.CANCELLED
+        storage.update_tournament(tournament.id, tournament)
+
+        await websocket_manager.send_tournament_update(
+            tournament_id=tournament.id,
+            update_type="cancelled",
+            data={
+                "reason": f"Fewer than {self.min_participants} participants at start time",
+                "participant_count": len(tournament.participants)
+            }
+        )
+
+    async def _complete(self, tournament: Tournament) -> None:
+        """Complete a tournament that reached its end time"""
+        # Scores are kept current as markets resolve, so only ranking remains
+        tournament_scoring.complete_tournament(tournament)
+
+        await websocket_manager.send_tournament_update(
+            tournament_id=tournament.id,
+            update_type="completed",
+            data={
+                "winners": tournament.winners,
+                "prize_distribution": tournament.prize_distribution
+            }
+        )
+
+
+# Global singleton instance
+tournament_scheduler = TournamentScheduler(
+    min_participants=settings.MIN_TOURNAMENT_PARTICIPANTS
+)
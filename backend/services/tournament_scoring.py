@@ -0,0 +1,222 @@
+"""
+Tournament scoring service
+Keeps participant scores up to date as tournament markets resolve
+"""
+
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from models.market import Market
+from models.tournament import Tournament, TournamentStatus, ScoringRule
+from services.prize_distribution import (
+    MICROALGOS_PER_ALGO,
+    distribute,
+    payout_weights,
+    to_microalgos
+)
+from services.scoring_rules import score_forecasts
+from storage import storage
+
+
+class TournamentScoringService:
+    """Service for incremental tournament scoring"""
+
+    def register_tournament(self, tournament: Tournament) -> None:
+        """
+        Apply outcomes of markets that resolved before the tournament existed
+
+        Args:
+            tournament: Newly created tournament
+        """
+        for market_id in tournament.market_ids:
+            market = storage.get_market(market_id)
+            if market and market.resolved_outcome:
+                self.apply_resolution(tournament, market_id, market.resolved_outcome)
+
+    def on_market_resolved(self, market: Market) -> List[Tournament]:
+        """
+        Update scores in every open tournament that includes a resolved market
+
+        Args:
+            market: The market that was just resolved
+
+        Returns:
+            Tournaments whose scores were updated
+        """
+        affected = []
+        for tournament in storage.get_tournaments_by_market(market.id):
+            if tournament.status in (TournamentStatus.COMPLETED, TournamentStatus.CANCELLED):
+                continue
+            self.apply_resolution(tournament, market.id, market.resolved_outcome)
+            affected.append(tournament)
+        return affected
+
+    def apply_resolution(self, tournament: Tournament, market_id: str, outcome: str) -> int:
+        """
+        Add every participant's score on a newly resolved market
+
+        One vectorized pass over the market's column of the prediction
+        matrix; a no-op if the market was already applied. Battle royale
+        tournaments only score their survivors.
+
+        Args:
+            tournament: Tournament to update
+            market_id: Resolved market
+            outcome: Winning outcome
+
+        Returns:
+            Number of participants whose score changed
+        """
+        if market_id in tournament.resolved_outcomes:
+            return 0
+        tournament.resolved_outcomes[market_id] = outcome
+
+        rows = tournament.scoring_ids()
+        delta = self.score_markets(tournament, {market_id: outcome}, rows)
+        changed = np.flatnonzero(delta)
+        participant_ids = changed if rows is None else rows[changed]
+        tournament.set_scores(participant_ids, tournament.scores[participant_ids] + delta[changed])
+        return len(changed)
+
+    def advance_rounds(self, tournament: Tournament) -> List[Dict]:
+        """
+        Eliminate the bottom of each battle royale round whose markets have resolved
+
+        Survivors are ranked on cumulative score (ties keep join order) and
+        the lowest elimination_fraction of them is cut, always leaving at
+        least one. The final round eliminates nobody; it is decided when the
+        tournament completes.
+
+        Args:
+            tournament: Tournament
+
+        Returns:
+            One summary per round that was closed
+        """
+        results = []
+        if not tournament.is_battle_royale or tournament.status != TournamentStatus.ACTIVE:
+            return results
+
+        last_round = len(tournament.rounds) - 1
+        while (
+            tournament.current_round < last_round
+            and tournament.round_resolved(tournament.current_round)
+        ):
+            survivors = tournament.survivors.ids
+            cut = min(
+                int(len(survivors) * tournament.elimination_fraction),
+                len(survivors) - 1
+            )
+
+            # Best first: score descending, then participant id ascending
+            order = np.lexsort((survivors, -tournament.scores[survivors]))
+            eliminated = survivors[order[len(survivors) - cut:]]
+            tournament.eliminate(eliminated)
+
+            results.append({
+                "round": tournament.current_round,
+                "eliminated": len(eliminated),
+                "survivors": len(tournament.survivors)
+            })
+            tournament.current_round += 1
+
+        if results:
+            storage.update_tournament(tournament.id, tournament)
+        return results
+
+    def score_markets(
+        self,
+        tournament: Tournament,
+        resolved_outcomes: Dict[str, str],
+        rows: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Score participants on a set of resolved markets under the tournament's rule
+
+        Args:
+            tournament: Tournament
+            resolved_outcomes: market_id -> winning outcome
+            rows: Participant ids to score (all participants if None)
+
+        Returns:
+            Total score per participant
+        """
+        matrix = tournament.prediction_matrix
+        if tournament.scoring_rule == ScoringRule.ACCURACY:
+            return matrix.score(resolved_outcomes, rows)
+
+        columns, winners = matrix.resolved_columns(resolved_outcomes)
+        return score_forecasts(
+            tournament.scoring_rule.value, matrix.forecasts(columns, rows), winners
+        )
+
+    def rescore_participant(self, tournament: Tournament, participant: str) -> float:
+        """
+        Recompute one participant's score on the markets resolved so far
+
+        Args:
+            tournament: Tournament
+            participant: Participant address
+
+        Returns:
+            The participant's new score
+        """
+        return float(self.rescore_participants(tournament, [participant])[0])
+
+    def rescore_participants(self, tournament: Tournament, participants: List[str]) -> np.ndarray:
+        """
+        Recompute scores on the markets resolved so far for a batch of participants
+
+        Args:
+            tournament: Tournament
+            participants: Participant addresses
+
+        Returns:
+            New scores in the same order
+        """
+        participant_ids = np.array(
+            [tournament.participants.id_of(p) for p in participants], dtype=np.intp
+        )
+        scores = self.score_markets(tournament, tournament.resolved_outcomes, participant_ids)
+        tournament.set_scores(participant_ids, scores)
+        return scores
+
+    def complete_tournament(self, tournament: Tournament) -> None:
+        """
+        Rank participants on their live scores and distribute prizes
+
+        Args:
+            tournament: Tournament to complete
+        """
+        ranked_ids, new_group = tournament.final_ranking()
+
+        # Determine winners (top 3)
+        tournament.winners = [
+            tournament.participants.address_of(participant_id)
+            for participant_id in ranked_ids[:3].tolist()
+        ]
+
+        # Distribute prizes along the tournament's payout curve
+        amounts = distribute(
+            to_microalgos(tournament.prize_pool),
+            payout_weights(tournament.payout, len(ranked_ids)),
+            new_group
+        )
+        paid = np.flatnonzero(amounts)
+        tournament.prize_distribution_microalgos = {
+            tournament.participants.address_of(participant_id): amount
+            for participant_id, amount in zip(ranked_ids[paid].tolist(), amounts[paid].tolist())
+        }
+        tournament.prize_distribution = {
+            address: amount / MICROALGOS_PER_ALGO
+            for address, amount in tournament.prize_distribution_microalgos.items()
+        }
+
+        # Update status
+        tournament.status = TournamentStatus.COMPLETED
+        storage.update_tournament(tournament.id, tournament)
+
+
+# Global singleton instance
+tournament_scoring = TournamentScoringService()
@@ -2,17 +2,104 @@
 WebSocket manager for real-time updates
 """
 
-from typing import Dict, List
+import asyncio
+import json
+import time
+from typing import Dict, Optional, Set, Tuple
 from fastapi import WebSocket
 
+from config import settings
+from services.metrics import LatencyRecorder, RateCounter
+from services.pubsub import PubSubBackend, InProcessPubSub, create_pubsub_backend
+from services.sse import sse_broadcaster
+
+PING_MESSAGE = json.dumps({"type": "ping"})
+
+# Opt-in topic for platform-wide announcements (new markets, tournaments)
+ANNOUNCEMENTS_TOPIC = "announcements"
+
+SUBSCRIPTION_CHANNELS = ("market", "tournament", "topic")
 
-class WebSocketManager:
-    """Manager for WebSocket connections"""
 
-    def __init__(self) -> None:
+class WebSocketManager:
+    """Manager for WebSocket connections
+
+    Liveness is checked at two levels. uvicorn sends protocol-level ping
+    frames (``WS_PING_INTERVAL``) that browsers answer automatically, and
+    closes connections that miss a pong within ``WS_PING_TIMEOUT``; this
+    covers passive clients that never write. Clients that answer the
+    application-level ``{"type": "ping"}`` with a pong opt in to the stricter
+    check and are reaped once silent for ``idle_timeout``. Stalled sends are
+    reaped for every client.
+    """
+
+    def __init__(
+        self,
+        pubsub: Optional[PubSubBackend] = None,
+        heartbeat_interval: float = 20.0,
+        idle_timeout: float = 60.0,
+        send_timeout: float = 5.0
+    ) -> None:
         """Initialize WebSocket manager"""
         self.active_connections: Dict[str, WebSocket] = {}
-        self.market_subscribers: Dict[str, List[str]] = {}  # market_id -> [client_ids]
+        self.market_subscribers: Dict[str, Set[str]] = {}  # market_id -> {client_ids}
+        self.tournament_subscribers: Dict[str, Set[str]] = {}  # tournament_id -> {client_ids}
+        self.topic_subscribers: Dict[str, Set[str]] = {}  # topic -> {client_ids}
+        self.client_subscriptions: Dict[str, Set[Tuple[str, str]]] = {}  # client_id -> {(channel, key)}
+        self.pubsub = pubsub or InProcessPubSub()
+
+        # Liveness tracking
+        self.heartbeat_interval = heartbeat_interval
+        self.idle_timeout = idle_timeout
+        self.send_timeout = send_timeout
+        self.last_seen: Dict[str, float] = {}  # client_id -> monotonic time
+        self.heartbeat_clients: Set[str] = set()  # Clients answering application-level pings
+        self._heartbeat_task: Optional[asyncio.Task] = None
+
+        # Capacity metrics
+        self.send_latency = LatencyRecorder()
+        self.sent_rate = RateCounter()
+        self.failed_sends = 0
+        self.reaped_connections = 0
+
+    async def start(self) -> None:
+        """Attach to the pub/sub bus and start the heartbeat loop"""
+        await self.pubsub.start(self._handle_bus_message)
+        self._heartbeat_task = asyncio.create_task(self._heartbeat_loop())
+
+    async def stop(self) -> None:
+        """Stop the heartbeat loop and detach from the pub/sub bus"""
+        if self._heartbeat_task:
+            self._heartbeat_task.cancel()
+            try:
+                await self._heartbeat_task
+            except asyncio.CancelledError:
+                pass
+            self._heartbeat_task = None
+        await self.pubsub.stop()
+
+    async def _handle_bus_message(self, envelope: dict) -> None:
+        """
+        Deliver a broadcast published by another worker to local clients
+
+        Args:
+            envelope: Bus envelope with target and message
+        """
+        target = envelope.get("target")
+        message = envelope.get("message", "")
+
+        if target == "broadcast":
+            await self._deliver_to_all(message)
+        elif target == "market":
+            await self._deliver_to_market(envelope.get("market_id"), message)
+        elif target == "tournament":
+            await self._deliver_to_group(
+                self.tournament_subscribers, envelope.get("tournament_id"), message
+            )
+        elif target == "topic":
+            await self._deliver_to_group(
+                self.topic_subscribers, envelope.get("topic"), message
+            )
 
     async def connect(self, websocket: WebSocket, client_id: str) -> None:
         """
@@ -24,6 +111,7 @@ class WebSocketManager:
         """
         await websocket.accept()
         self.active_connections[client_id] = websocket
+        self.last_seen[client_id] = time.monotonic()
         print(f"🔌 Client {client_id} connected. Total connections: {len(self.active_connections)}")
 
     async def disconnect(self, client_id: str) -> None:
@@ -35,11 +123,12 @@ class WebSocketManager:
         """
         if client_id in self.active_connections:
             del self.active_connections[client_id]
+        self.last_seen.pop(client_id, None)
+        self.heartbeat_clients.discard(client_id)
 
-        # Remove from all market subscriptions
-        for market_id in self.market_subscribers:
-            if client_id in self.market_subscribers[market_id]:
-                self.market_subscribers[market_id].remove(client_id)
+        # Remove from every subscription the client holds
+        for channel, key in self.client_subscriptions.pop(client_id, set()):
+            self._remove_subscriber(self._registry(channel), key, client_id)
 
         print(f"🔌 Client {client_id} disconnected. Total connections: {len(self.active_connections)}")
 
@@ -48,6 +137,200 @@ class WebSocketManager:
         for client_id in list(self.active_connections.keys()):
             await self.disconnect(client_id)
 
+    def touch(self, client_id: str) -> None:
+        """
+        Record inbound activity from a client
+
+        Args:
+            client_id: Client identifier
+        """
+        if client_id in self.active_connections:
+            self.last_seen[client_id] = time.monotonic()
+
+    @staticmethod
+    def is_pong(data: str) -> bool:
+        """Check whether an inbound frame is a heartbeat reply"""
+        if data == "pong":
+            return True
+        try:
+            return json.loads(data).get("type") == "pong"
+        except (ValueError, AttributeError):
+            return False
+
+    async def handle_client_message(self, client_id: str, data: str) -> bool:
+        """
+        Handle heartbeat replies and subscription commands from a client
+
+        Commands look like {"action": "subscribe", "channel": "tournament", "id": "..."}
+        where channel is market, tournament or topic.
+
+        Args:
+            client_id: Client identifier
+            data: Raw inbound frame
+
+        Returns:
+            Whether the frame was handled
+        """
+        if self.is_pong(data):
+            self.heartbeat_clients.add(client_id)
+            return True
+
+        try:
+            command = json.loads(data)
+        except ValueError:
+            return False
+        if not isinstance(command, dict):
+            return False
+
+        action = command.get("action")
+        channel = command.get("channel")
+        key = command.get("id")
+        if action not in ("subscribe", "unsubscribe") or channel not in SUBSCRIPTION_CHANNELS:
+            return False
+        if not isinstance(key, str) or not key:
+            return False
+
+        if action == "subscribe":
+            self._add_subscriber(channel, key, client_id)
+        else:
+            self._discard_subscription(channel, key, client_id)
+
+        await self._send(client_id, json.dumps({
+            "type": f"{action}d",
+            "channel": channel,
+            "id": key
+        }))
+        return True
+
+    def _registry(self, channel: str) -> Dict[str, Set[str]]:
+        """Get the subscriber registry for a channel"""
+        if channel == "market":
+            return self.market_subscribers
+        if channel == "tournament":
+            return self.tournament_subscribers
+        return self.topic_subscribers
+
+    def _add_subscriber(self, channel: str, key: str, client_id: str) -> bool:
+        """Subscribe a client to a channel key, returning False if already subscribed"""
+        subscribers = self._registry(channel).setdefault(key, set())
+        if client_id in subscribers:
+            return False
+
+        subscribers.add(client_id)
+        self.client_subscriptions.setdefault(client_id, set()).add((channel, key))
+        return True
+
+    def _discard_subscription(self, channel: str, key: str, client_id: str) -> bool:
+        """Unsubscribe a client from a channel key, returning False if not subscribed"""
+        if not self._remove_subscriber(self._registry(channel), key, client_id):
+            return False
+
+        subscriptions = self.client_subscriptions.get(client_id)
+        if subscriptions is not None:
+            subscriptions.discard((channel, key))
+        return True
+
+    @staticmethod
+    def _remove_subscriber(registry: Dict[str, Set[str]], key: str, client_id: str) -> bool:
+        """Remove a client from one registry entry, dropping empty entries"""
+        subscribers = registry.get(key)
+        if not subscribers or client_id not in subscribers:
+            return False
+
+        subscribers.discard(client_id)
+        if not subscribers:
+            del registry[key]
+        return True
+
+    async def _heartbeat_loop(self) -> None:
+        """Ping live clients and reap idle or half-open ones"""
+        while True:
+            await asyncio.sleep(self.heartbeat_interval)
+            await self.reap_idle_connections()
+            for client_id in list(self.active_connections.keys()):
+                await self._send(client_id, PING_MESSAGE)
+
+    async def reap_idle_connections(self) -> int:
+        """
+        Close heartbeat clients that have not been heard from within idle_timeout
+
+        Clients that never answered an application-level ping are left to
+        uvicorn's protocol-level ping/pong.
+
+        Returns:
+            Number of connections reaped
+        """
+        cutoff = time.monotonic() - self.idle_timeout
+        idle = [cid for cid in self.heartbeat_clients if self.last_seen.get(cid, cutoff) < cutoff]
+        for client_id in idle:
+            await self._reap(client_id, reason="idle")
+        return len(idle)
+
+    async def _reap(self, client_id: str, reason: str) -> None:
+        """Close and forget a dead connection"""
+        websocket = self.active_connections.get(client_id)
+        if websocket is None:
+            return
+
+        print(f"💀 Reaping {reason} WebSocket client {client_id}")
+        self.reaped_connections += 1
+        await self.disconnect(client_id)
+        try:
+            await asyncio.wait_for(websocket.close(code=1001), self.send_timeout)
+        except Exception:
+            pass  # Already gone
+
+    async def _send(self, client_id: str, message: str) -> bool:
+        """
+        Send a message to one client, dropping it if the send fails or stalls
+
+        Args:
+            client_id: Client identifier
+            message: Message to send
+
+        Returns:
+            Whether the message was sent
+        """
+        websocket = self.active_connections.get(client_id)
+        if websocket is None:
+            return False
+
+        started = time.perf_counter()
+        try:
+            await asyncio.wait_for(websocket.send_text(message), self.send_timeout)
+        except Exception as e:
+            print(f"Error sending to {client_id}: {e!r}")
+            self.failed_sends += 1
+            await self._reap(client_id, reason="half-open")
+            return False
+
+        self.send_latency.record(time.perf_counter() - started)
+        self.sent_rate.add()
+        return True
+
+    def get_metrics(self) -> dict:
+        """Get connection capacity metrics for this worker"""
+        return {
+            "connections": len(self.active_connections),
+            "market_subscriptions": sum(len(s) for s in self.market_subscribers.values()),
+            "tournament_subscriptions": sum(len(s) for s in self.tournament_subscribers.values()),
+            "topic_subscriptions": {
+                topic: len(s) for topic, s in self.topic_subscribers.items()
+            },
+            "queue_depths": {
+                "pubsub_pending": self.pubsub.pending
+            },
+            "send_latency_ms": self.send_latency.percentiles(),
+            "messages_per_second": self.sent_rate.per_second(),
+            "messages_sent": self.sent_rate.total,
+            "failed_sends": self.failed_sends,
+            "reaped_connections": self.reaped_connections,
+            "heartbeat_clients": len(self.heartbeat_clients),
+            "heartbeat_interval": self.heartbeat_interval,
+            "idle_timeout": self.idle_timeout,
+            "worker_id": self.pubsub.worker_id
+        }
+
     async def send_personal_message(self, message: str, client_id: str) -> None:
         """
         Send a message to a specific client
@@ -56,22 +339,22 @@ class WebSocketManager:
             message: Message to send
             client_id: Client identifier
         """
-        if client_id in self.active_connections:
-            websocket = self.active_connections[client_id]
-            await websocket.send_text(message)
+        await self._send(client_id, message)
 
     async def broadcast(self, message: str) -> None:
         """
-        Broadcast a message to all connected clients
+        Broadcast a message to all connected clients on every worker
 
         Args:
             message: Message to broadcast
         """
-        for client_id, websocket in self.active_connections.items():
-            try:
-                await websocket.send_text(message)
-            except Exception as e:
-                print(f"Error broadcasting to {client_id}: {e}")
+        await self._deliver_to_all(message)
+        await self.pubsub.publish({"target": "broadcast", "message": message})
+
+    async def _deliver_to_all(self, message: str) -> None:
+        """Send a message to all clients connected to this worker"""
+        for client_id in list(self.active_connections.keys()):
+            await self._send(client_id, message)
 
     async def subscribe_to_market(self, client_id: str, market_id: str) -> None:
         """
@@ -81,11 +364,7 @@ class WebSocketManager:
             client_id: Client identifier
             market_id: Market identifier
         """
-        if market_id not in self.market_subscribers:
-            self.market_subscribers[market_id] = []
-
-        if client_id not in self.market_subscribers[market_id]:
-            self.market_subscribers[market_id].append(client_id)
+        if self._add_subscriber("market", market_id, client_id):
             print(f"📊 Client {client_id} subscribed to market {market_id}")
 
     async def unsubscribe_from_market(self, client_id: str, market_id: str) -> None:
@@ -96,30 +375,123 @@ class WebSocketManager:
             client_id: Client identifier
             market_id: Market identifier
         """
-        if market_id in self.market_subscribers:
-            if client_id in self.market_subscribers[market_id]:
-                self.market_subscribers[market_id].remove(client_id)
-                print(f"📊 Client {client_id} unsubscribed from market {market_id}")
+        if self._discard_subscription("market", market_id, client_id):
+            print(f"📊 Client {client_id} unsubscribed from market {market_id}")
+
+    async def subscribe_to_tournament(self, client_id: str, tournament_id: str) -> None:
+        """
+        Subscribe a client to tournament updates
+
+        Args:
+            client_id: Client identifier
+            tournament_id: Tournament identifier
+        """
+        if self._add_subscriber("tournament", tournament_id, client_id):
+            print(f"🏆 Client {client_id} subscribed to tournament {tournament_id}")
+
+    async def unsubscribe_from_tournament(self, client_id: str, tournament_id: str) -> None:
+        """
+        Unsubscribe a client from tournament updates
+
+        Args:
+            client_id: Client identifier
+            tournament_id: Tournament identifier
+        """
+        if self._discard_subscription("tournament", tournament_id, client_id):
+            print(f"🏆 Client {client_id} unsubscribed from tournament {tournament_id}")
+
+    async def subscribe_to_topic(self, client_id: str, topic: str) -> None:
+        """
+        Subscribe a client to a named topic such as announcements
+
+        Args:
+            client_id: Client identifier
+            topic: Topic name
+        """
+        self._add_subscriber("topic", topic, client_id)
+
+    async def unsubscribe_from_topic(self, client_id: str, topic: str) -> None:
+        """
+        Unsubscribe a client from a named topic
+
+        Args:
+            client_id: Client identifier
+            topic: Topic name
+        """
+        self._discard_subscription("topic", topic, client_id)
 
     async def broadcast_to_market(self, market_id: str, message: str) -> None:
         """
-        Broadcast a message to all subscribers of a market
+        Broadcast a message to all subscribers of a market on every worker
 
         Args:
             market_id: Market identifier
             message: Message to broadcast
         """
-        if market_id not in self.market_subscribers:
+        await self._deliver_to_market(market_id, message)
+        await self.pubsub.publish({
+            "target": "market",
+            "market_id": market_id,
+            "message": message
+        })
+
+    async def _deliver_to_market(self, market_id: str, message: str) -> None:
+        """Send a message to market subscribers connected to this worker"""
+        sse_broadcaster.publish(market_id, message)
+        await self._deliver_to_group(self.market_subscribers, market_id, message)
+
+    async def broadcast_to_tournament(self, tournament_id: str, message: str) -> None:
+        """
+        Broadcast a message to all subscribers of a tournament on every worker
+
+        Args:
+            tournament_id: Tournament identifier
+            message: Message to broadcast
+        """
+        await self._deliver_to_group(self.tournament_subscribers, tournament_id, message)
+        await self.pubsub.publish({
+            "target": "tournament",
+            "tournament_id": tournament_id,
+            "message": message
+        })
+
+    async def broadcast_to_topic(self, topic: str, message: str) -> None:
+        """
+        Broadcast a message to all subscribers of a topic on every worker
+
+        Args:
+            topic: Topic name
+            message: Message to broadcast
+        """
+        await self._deliver_to_group(self.topic_subscribers, topic, message)
+        await self.pubsub.publish({
+            "target": "topic",
+            "topic": topic,
+            "message": message
+        })
+
+    async def announce(self, message: str) -> None:
+        """
+        Send a platform-wide announcement to clients that opted in
+
+        Args:
+            message: Announcement text
+        """
+        await self.broadcast_to_topic(ANNOUNCEMENTS_TOPIC, message)
+
+    async def _deliver_to_group(
+        self,
+        registry: Dict[str, Set[str]],
+        key: Optional[str],
+        message: str
+    ) -> None:
+        """Send a message to the local subscribers of one registry entry"""
+        subscribers = registry.get(key)
+        if not subscribers:
             return
 
-        subscribers = self.market_subscribers[market_id]
-        for client_id in subscribers:
-            if client_id in self.active_connections:
-                try:
-                    websocket = self.active_connections[client_id]
-                    await websocket.send_text(message)
-                except Exception as e:
-                    print(f"Error sending to {client_id}: {e}")
+        for client_id in list(subscribers):
+            await self._send(client_id, message)
 
     async def send_market_update(
         self,
@@ -135,8 +507,6 @@ class WebSocketManager:
             update_type: Type of update (trade, price_change, resolution, etc.)
             data: Update data
         """
-        import json
-
         message = json.dumps({
             "type": "market_update",
             "market_id": market_id,
@@ -154,15 +524,13 @@ class WebSocketManager:
         data: dict
     ) -> None:
         """
-        Send a tournament update to all connected clients
+        Send a tournament update to the tournament's subscribers
 
         Args:
             tournament_id: Tournament identifier
             update_type: Type of update
             data: Update data
         """
-        import json
-
         message = json.dumps({
             "type": "tournament_update",
             "tournament_id": tournament_id,
@@ -170,8 +538,13 @@ class WebSocketManager:
             "data": data
         })
 
-        await self.broadcast(message)
+        await self.broadcast_to_tournament(tournament_id, message)
 
 
 # Global singleton instance
-websocket_manager = WebSocketManager()
+websocket_manager = WebSocketManager(
+    create_pubsub_backend(),
+    heartbeat_interval=settings.WS_HEARTBEAT_INTERVAL,
+    idle_timeout=settings.WS_IDLE_TIMEOUT,
+    send_timeout=settings.WS_SEND_TIMEOUT
+)
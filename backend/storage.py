@@ -4,10 +4,16 @@ Replace with actual database (PostgreSQL) in production
 """
 
 from typing import Dict, List, Optional
+from models.calibration import CalibrationBook
+from models.edge_index import EdgeIndex
+from models.feature_store import FeatureStore
+from models.sentiment import SentimentWindows
 from models.market import Market
 from models.tournament import Tournament
 from models.trade import Trade
 from models.stake import Stake
+from models.stake_book import ClaimLedger, StakeBook
+from models.stake_insights import MarketInsights
 from models.user import User
 
 
@@ -27,11 +33,22 @@ class InMemoryStorage:
         self.trades_by_user: Dict[str, List[str]] = {}  # user_address -> [trade_ids]
         self.stakes_by_market: Dict[str, List[str]] = {}  # market_id -> [stake_ids]
         self.stakes_by_user: Dict[str, List[str]] = {}  # user_address -> [stake_ids]
+        self.tournaments_by_market: Dict[str, List[str]] = {}  # market_id -> [tournament_ids]
+
+        # Running aggregates
+        self.stake_insights: Dict[str, MarketInsights] = {}  # market_id -> insights
+        self.stake_books: Dict[str, StakeBook] = {}  # market_id -> stake columns
+        self.calibration = CalibrationBook()  # per-staker calibration and reputation
+        self.edge_index = EdgeIndex()  # AI probabilities vs prices across markets
+        self.features = FeatureStore()  # per-market model features
+        self.sentiment = SentimentWindows()  # recent per-outcome trading volume
 
     # Market operations
     def create_market(self, market: Market) -> Market:
         """Create a new market"""
         self.markets[market.id] = market
+        self.edge_index.update_market(market)
+        self.features.add_market(market)
         return market
 
     def get_market(self, market_id: str) -> Optional[Market]:
@@ -49,12 +66,20 @@ class InMemoryStorage:
     def update_market(self, market_id: str, market: Market) -> Market:
         """Update a market"""
         self.markets[market_id] = market
+        self.edge_index.update_market(market)
         return market
 
     # Tournament operations
     def create_tournament(self, tournament: Tournament) -> Tournament:
         """Create a new tournament"""
         self.tournaments[tournament.id] = tournament
+
+        # Update indexes
+        for market_id in tournament.market_ids:
+            if market_id not in self.tournaments_by_market:
+                self.tournaments_by_market[market_id] = []
+            self.tournaments_by_market[market_id].append(tournament.id)
+
         return tournament
 
     def get_tournament(self, tournament_id: str) -> Optional[Tournament]:
@@ -65,6 +90,11 @@ class InMemoryStorage:
         """Get all tournaments"""
         return list(self.tournaments.values())
 
+    def get_tournaments_by_market(self, market_id: str) -> List[Tournament]:
+        """Get all tournaments that include a market"""
+        tournament_ids = self.tournaments_by_market.get(market_id, [])
+        return [self.tournaments[tid] for tid in tournament_ids if tid in self.tournaments]
+
     def update_tournament(self, tournament_id: str, tournament: Tournament) -> Tournament:
         """Update a tournament"""
         self.tournaments[tournament_id] = tournament
@@ -84,6 +114,12 @@ class InMemoryStorage:
             self.trades_by_user[trade.trader_address] = []
         self.trades_by_user[trade.trader_address].append(trade.id)
 
+        # Update aggregates
+        market = self.markets.get(trade.market_id)
+        if market:
+            self.features.record_trade(market, trade)
+            self.sentiment.record_trade(market, trade)
+
         return trade
 
     def get_trade(self, trade_id: str) -> Optional[Trade]:
@@ -114,6 +150,32 @@ class InMemoryStorage:
             self.stakes_by_user[stake.staker_address] = []
         self.stakes_by_user[stake.staker_address].append(stake.id)
 
+        if stake.market_id not in self.stake_books:
+            self.stake_books[stake.market_id] = StakeBook()
+        stake.book = self.stake_books[stake.market_id]
+        stake.row = stake.book.add(
+            stake.id,
+            stake.outcome,
+            stake.amount,
+            staker_id=self.calibration.staker_id(stake.staker_address),
+            confidence=stake.confidence
+        )
+
+        # Update aggregates
+        if stake.market_id not in self.stake_insights:
+            self.stake_insights[stake.market_id] = MarketInsights()
+        self.stake_insights[stake.market_id].add(stake)
+
+        market = self.markets.get(stake.market_id)
+        if market:
+            market.crowd.add(
+                stake.outcome,
+                stake.amount,
+                stake.confidence,
+                reputation=self.calibration.reputation_of(stake.staker_address)
+            )
+            self.features.record_stake(market, stake)
+
         return stake
 
     def get_stake(self, stake_id: str) -> Optional[Stake]:
@@ -130,6 +192,21 @@ class InMemoryStorage:
         stake_ids = self.stakes_by_user.get(user_address, [])
         return [self.stakes[sid] for sid in stake_ids if sid in self.stakes]
 
+    def get_stake_insights(self, market_id: str) -> MarketInsights:
+        """Get running stake aggregates for a market"""
+        return self.stake_insights.get(market_id) or MarketInsights()
+
+    def get_stake_book(self, market_id: str) -> StakeBook:
+        """Get the column-oriented stakes of a market"""
+        if market_id not in self.stake_books:
+            self.stake_books[market_id] = StakeBook()
+        return self.stake_books[market_id]
+
+    def get_claim_ledger(self, market_id: str) -> Optional[ClaimLedger]:
+        """Get a market's settlement ledger (None until it resolves)"""
+        book = self.stake_books.get(market_id)
+        return book.ledger if book else None
+
     # User operations
     def create_user(self, user: User) -> User:
         """Create a new user"""
@@ -0,0 +1,75 @@
+"""Shared fixtures for backend tests"""
+
+import os
+import sys
+
+import pytest
+from fastapi.testclient import TestClient
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import app  # noqa: E402
+from models.reasoning_store import reasoning_store  # noqa: E402
+
+API = "/api/v1"
+
+
+@pytest.fixture(autouse=True)
+def reasoning_dir(tmp_path, monkeypatch) -> str:
+    """Archive resolved reasoning under the test's temporary directory"""
+    directory = str(tmp_path / "reasoning")
+    monkeypatch.setattr(reasoning_store, "directory", directory)
+    return directory
+
+
+@pytest.fixture
+def client() -> TestClient:
+    """API client without the lifespan, so no background workers run"""
+    return TestClient(app)
+
+
+@pytest.fixture
+def create_market(client):
+    """Create a binary market and return its id"""
+    def create(creator: str = "CREATOR") -> str:
+        response = client.post(f"{API}/markets/", json={
+            "question": "Will it rain tomorrow in the city?",
+            "description": "A description long enough for validation",
+            "category": "Weather",
+            "outcomes": ["Yes", "No"],
+            "end_time": "2030-01-01T00:00:00",
+            "resolution_source": "NOAA data",
+            "initial_liquidity": 10,
+            "creator_address": creator
+        })
+        assert response.status_code == 201, response.text
+        return response.json()["id"]
+    return create
+
+
+@pytest.fixture
+def resolve_market(client):
+    """Resolve a market created by CREATOR"""
+    def resolve(market_id: str, outcome: str) -> None:
+        response = client.post(f"{API}/markets/{market_id}/resolve", json={
+            "resolver_address": "CREATOR", "winning_outcome": outcome
+        })
+        assert response.status_code == 200, response.text
+    return resolve
+
+
+@pytest.fixture
+def create_stake(client):
+    """Stake on a market outcome and return the stake id"""
+    def create(market_id: str, staker: str, outcome: str, amount: float = 1.0) -> str:
+        response = client.post(f"{API}/staking/", json={
+            "market_id": market_id,
+            "staker_address": staker,
+            "outcome": outcome,
+            "amount": amount,
+            "reasoning": f"{staker} expects {outcome} for good reasons",
+            "confidence": 0.5
+        })
+        assert response.status_code == 201, response.text
+        return response.json()["id"]
+    return create
@@ -0,0 +1,84 @@
+"""Battle royale leaderboard and prize consistency"""
+
+import pytest
+
+from tests.conftest import API
+
+
+def forecast(yes: float) -> dict:
+    return {"Yes": yes, "No": round(1 - yes, 2)}
+
+
+def start_royale(client, first: str, second: str, participants: list) -> str:
+    """Create and start a two-round Brier battle royale and return its URL"""
+    response = client.post(f"{API}/tournaments/", json={
+        "name": "Royale", "description": "A description long enough for validation",
+        "market_ids": [first, second], "entry_fee": 0, "prize_pool": 100,
+        "start_time": "2029-01-01T00:00:00", "end_time": "2029-02-01T00:00:00",
+        "max_participants": 10, "creator_address": "CREATOR", "scoring_rule": "brier",
+        "mode": "battle_royale", "rounds": [[first], [second]], "elimination_fraction": 0.5
+    })
+    assert response.status_code == 201, response.text
+    tournament = f"{API}/tournaments/{response.json()['id']}"
+
+    client.post(f"{tournament}/join/bulk", json={"participant_addresses": participants})
+    client.post(f"{tournament}/start", params={"creator_address": "CREATOR"})
+    return tournament
+
+
+def scores(client, tournament: str) -> dict:
+    entries = client.get(f"{tournament}/scores").json()["scores"]
+    return {entry["participant"]: entry["score"] for entry in entries}
+
+
+def test_eliminated_participants_rank_below_survivors(client, create_market, resolve_market):
+    first, second = create_market(), create_market()
+    tournament = start_royale(client, first, second, ["A", "B", "C", "D"])
+    round_one = {"A": 0.9, "B": 0.8, "C": 0.3, "D": 0.7}
+    for address, yes in round_one.items():
+        client.post(f"{tournament}/predict", json={
+            "participant_address": address, "predictions": {first: forecast(yes)}
+        })
+    resolve_market(first, "Yes")  # C and D are eliminated
+
+    # B collapses in round two, ending below D's score
+    client.post(f"{tournament}/predict", json={"participant_address": "A", "predictions": {second: forecast(0.9)}})
+    client.post(f"{tournament}/predict", json={"participant_address": "B", "predictions": {second: forecast(0.0)}})
+    resolve_market(second, "Yes")
+
+    live = client.get(f"{tournament}/leaderboard").json()["leaderboard"]
+    assert [entry["participant"] for entry in live] == ["A", "B", "D", "C"]
+
+    response = client.post(f"{tournament}/complete", params={"creator_address": "CREATOR"})
+    assert response.status_code == 200, response.text
+    assert response.json()["winners"] == ["A", "B", "D"]
+
+    final = client.get(f"{tournament}/leaderboard").json()["leaderboard"]
+    assert [entry["participant"] for entry in final] == ["A", "B", "D", "C"]
+    prizes = [entry["prize"] for entry in final]
+    assert prizes == sorted(prizes, reverse=True)
+
+    entry = client.get(f"{tournament}/leaderboard/B").json()
+    assert entry["rank"] == 2
+    assert entry["prize"] == final[1]["prize"]
+
+
+def test_later_rounds_keep_earlier_forecasts(client, create_market, resolve_market):
+    first, second = create_market(), create_market()
+    tournament = start_royale(client, first, second, ["A", "B"])
+    for address, yes in (("A", 0.9), ("B", 0.2)):
+        client.post(f"{tournament}/predict", json={
+            "participant_address": address, "predictions": {first: forecast(yes)}
+        })
+    resolve_market(first, "Yes")
+    round_one = scores(client, tournament)
+    assert round_one["A"] == pytest.approx(0.98)
+
+    response = client.post(f"{tournament}/predict", json={
+        "participant_address": "A", "predictions": {second: forecast(0.6)}
+    })
+    assert response.status_code == 200, response.text
+    assert scores(client, tournament) == round_one
+
+    predictions = client.get(f"{tournament}/predictions").json()["predictions"]
+    assert predictions[0]["forecasts"] == {first: forecast(0.9), second: forecast(0.6)}
@@ -0,0 +1,112 @@
+"""Reward claims and payout confirmation"""
+
+import asyncio
+
+from models.stake import Stake
+from services import payouts
+from services.algorand import PaymentGroupUnconfirmed
+from services.payouts import PayoutWorker, UnconfirmedPayout, record_payout
+from tests.conftest import API
+
+
+def test_stake_is_paid_once(client, create_market, create_stake, resolve_market):
+    market_id = create_market()
+    winner = create_stake(market_id, "WINNER", "Yes")
+    loser = create_stake(market_id, "LOSER", "No")
+
+    response = client.post(f"{API}/staking/{winner}/claim", params={"claimer_address": "WINNER"})
+    assert response.status_code == 400  # Not resolved yet
+
+    resolve_market(market_id, "Yes")
+    response = client.post(f"{API}/staking/{winner}/claim", params={"claimer_address": "WINNER"})
+    assert response.status_code == 200, response.text
+    assert response.json()["confirmed"] is True
+    assert response.json()["reward_amount"] == 2.0
+
+    response = client.post(f"{API}/staking/{winner}/claim", params={"claimer_address": "WINNER"})
+    assert response.json()["detail"] == "Rewards already claimed"
+    response = client.post(f"{API}/staking/user/WINNER/claim")
+    assert response.json()["detail"] == "No rewards available"
+    response = client.post(f"{API}/staking/{loser}/claim", params={"claimer_address": "LOSER"})
+    assert response.status_code == 400
+
+
+def test_bulk_claim_skips_claimed_stakes(client, create_market, create_stake, resolve_market):
+    market_id = create_market()
+    stakes = [create_stake(market_id, "BULK", "Yes") for _ in range(3)]
+    create_stake(market_id, "OTHER", "No", amount=3.0)
+    resolve_market(market_id, "Yes")
+
+    client.post(f"{API}/staking/{stakes[0]}/claim", params={"claimer_address": "BULK"})
+    response = client.post(f"{API}/staking/user/BULK/claim").json()
+    assert response["success"] is True
+    assert sorted(claim["stake_id"] for claim in response["claims"]) == sorted(stakes[1:])
+    assert response["total_reward"] == 4.0
+
+    response = client.post(f"{API}/staking/user/BULK/claim")
+    assert response.status_code == 400
+
+
+def unconfirmed_worker(monkeypatch, confirmed):
+    """A live worker whose groups always time out and then reconcile to confirmed"""
+    def send_payment_group(payments):
+        raise PaymentGroupUnconfirmed([f"txn{i}" for i in range(len(payments))], last_valid=100)
+
+    monkeypatch.setattr(payouts.algorand_service, "send_payment_group", send_payment_group)
+    monkeypatch.setattr(payouts.algorand_service, "payment_confirmed", lambda txid, last_valid: confirmed)
+    return PayoutWorker(enabled=True)
+
+
+def claimed_stake() -> Stake:
+    stake = Stake("stake_test", "market_test", "STAKER", "Yes", 1.0, "A reason to stake", 0.5)
+    stake.claimed = True
+    return stake
+
+
+def test_unconfirmed_payout_keeps_claim_until_it_lands(monkeypatch):
+    async def scenario():
+        worker = unconfirmed_worker(monkeypatch, confirmed=None)
+        stake = claimed_stake()
+        payout, = await worker.pay_many([("STAKER", 1_000_000, "reward")])
+        assert isinstance(payout, UnconfirmedPayout)
+        assert record_payout(stake, payout) == "txn0"
+
+        assert await worker.reconcile() == 0  # Still pending
+        assert stake.claimed and not stake.payout_confirmed
+
+        monkeypatch.setattr(payouts.algorand_service, "payment_confirmed", lambda txid, last_valid: True)
+        assert await worker.reconcile() == 1
+        await asyncio.sleep(0)
+        return stake
+
+    stake = asyncio.run(scenario())
+    assert stake.claimed and stake.payout_confirmed
+    assert stake.payout_txn_id == "txn0"
+
+
+def test_expired_payout_releases_claim(monkeypatch):
+    async def scenario():
+        worker = unconfirmed_worker(monkeypatch, confirmed=False)
+        stake = claimed_stake()
+        payout, = await worker.pay_many([("STAKER", 1_000_000, "reward")])
+        record_payout(stake, payout)
+        assert await worker.reconcile() == 1
+        await asyncio.sleep(0)
+        return stake
+
+    stake = asyncio.run(scenario())
+    assert not stake.claimed
+    assert stake.payout_txn_id is None
+
+
+def test_stop_sends_partially_collected_group():
+    async def scenario():
+        worker = PayoutWorker(group_size=4, flush_interval=60.0)
+        await worker.start()
+        claim = asyncio.create_task(worker.pay_many([("STAKER", 1_000_000, "reward")]))
+        await asyncio.sleep(0.01)  # The worker is now waiting for the group to fill
+        await worker.stop()
+        return await asyncio.wait_for(claim, 1.0)
+
+    txn_id, = asyncio.run(scenario())
+    assert txn_id.startswith("reward_txn_")
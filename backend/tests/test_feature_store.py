@@ -0,0 +1,41 @@
+"""Per-market model features"""
+
+import numpy as np
+
+from models.feature_store import TRADER_BUCKET_SECONDS, TRADER_BUCKETS, FeatureStore
+
+NOW = 1_700_000_000.0
+
+
+def unique_traders(store: FeatureStore, now: float) -> np.ndarray:
+    return store._unique_traders(np.arange(len(store)), now)
+
+
+def test_unique_traders_are_estimated_in_fixed_memory():
+    store = FeatureStore(capacity=2)
+    store._row("small")
+    store._row("large")
+    registers = store._trader_registers.nbytes
+    for i in range(3):
+        store._record_trader(0, f"small_{i}", NOW)
+        store._record_trader(0, f"small_{i}", NOW)  # Repeat traders count once
+    for i in range(2000):
+        store._record_trader(1, f"large_{i}", NOW)
+
+    small, large = unique_traders(store, NOW)
+    assert round(small) == 3
+    assert abs(large - 2000) < 2000 * 0.25
+    assert store._trader_registers.nbytes == registers
+
+
+def test_unique_traders_expire_as_buckets_rotate():
+    store = FeatureStore()
+    store._row("market")
+    store._record_trader(0, "early", NOW)
+    later = NOW + (TRADER_BUCKETS - 1) * TRADER_BUCKET_SECONDS
+    store._record_trader(0, "late", later)
+    assert round(unique_traders(store, later)[0]) == 2
+
+    after_window = NOW + TRADER_BUCKETS * TRADER_BUCKET_SECONDS
+    assert round(unique_traders(store, after_window)[0]) == 1
+    assert unique_traders(store, later + TRADER_BUCKETS * TRADER_BUCKET_SECONDS)[0] == 0
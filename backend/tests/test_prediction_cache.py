@@ -0,0 +1,92 @@
+"""AI prediction cache"""
+
+import asyncio
+
+import pytest
+
+from services import prediction_cache as cache_module
+from services.prediction_cache import PredictionCache
+from storage import storage
+
+
+@pytest.fixture
+def model_calls(monkeypatch):
+    """Replace the model with one that records its inputs"""
+    calls = []
+
+    async def predict(market_question, outcomes, historical_data=None, crowd_forecast=None):
+        calls.append(historical_data)
+        await asyncio.sleep(0.01)
+        return {outcome: 1 / len(outcomes) for outcome in outcomes}
+
+    monkeypatch.setattr(cache_module.inference_executor, "predict", predict)
+    return calls
+
+
+def test_hits_until_market_changes(create_market, model_calls):
+    market = storage.get_market(create_market())
+    cache = PredictionCache()
+
+    async def scenario():
+        first = await cache.get(market)
+        assert await cache.get(market) is first
+        market.version += 1
+        await cache.get(market)
+
+    asyncio.run(scenario())
+    assert len(model_calls) == 2
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_concurrent_misses_share_one_computation(create_market, model_calls):
+    market = storage.get_market(create_market())
+    cache = PredictionCache()
+
+    async def scenario():
+        return await asyncio.gather(*(cache.get(market) for _ in range(5)))
+
+    predictions = asyncio.run(scenario())
+    assert len(model_calls) == 1
+    assert all(prediction is predictions[0] for prediction in predictions)
+    assert (cache.misses, cache.shared) == (1, 4)
+
+
+def test_expired_entries_are_recomputed(create_market, model_calls):
+    market = storage.get_market(create_market())
+    cache = PredictionCache(ttl=0.0)
+
+    async def scenario():
+        await cache.get(market)
+        await cache.get(market)
+
+    asyncio.run(scenario())
+    assert len(model_calls) == 2
+
+
+def test_misses_and_refreshes_use_the_same_inputs(create_market, model_calls):
+    market = storage.get_market(create_market())
+    cache = PredictionCache()
+
+    async def scenario():
+        await cache.get(market)
+        await cache.refresh(market)
+        await cache.refresh(market, storage.features.matrix([market.id])[0])
+
+    asyncio.run(scenario())
+    miss, refresh, batched = model_calls
+    assert miss["features"].keys() == refresh["features"].keys() == batched["features"].keys()
+    assert miss["current_prices"] == refresh["current_prices"] == market.prices
+    assert miss["features"]["price"] == batched["features"]["price"]
+
+
+def test_lru_evicts_least_recent_market(create_market, model_calls):
+    markets = [storage.get_market(create_market()) for _ in range(3)]
+    cache = PredictionCache(max_size=2)
+
+    async def scenario():
+        for market in markets:
+            await cache.get(market)
+
+    asyncio.run(scenario())
+    assert cache.entry(markets[0].id) is None
+    assert cache.entry(markets[2].id) is not None
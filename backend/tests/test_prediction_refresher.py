@@ -0,0 +1,64 @@
+"""Background AI prediction refresher"""
+
+import asyncio
+import time
+
+import pytest
+
+from services import prediction_cache as cache_module
+from services.prediction_refresher import PredictionRefresher
+from storage import storage
+
+
+@pytest.fixture(autouse=True)
+def instant_model(monkeypatch):
+    async def predict(market_question, outcomes, historical_data=None, crowd_forecast=None):
+        return {outcome: 1 / len(outcomes) for outcome in outcomes}
+
+    monkeypatch.setattr(cache_module.inference_executor, "predict", predict)
+
+
+def test_pops_only_due_markets_within_budget(create_market):
+    refresher = PredictionRefresher(interval=6.0, max_per_minute=20)  # Budget of 2 per tick
+    markets = [storage.get_market(create_market()) for _ in range(3)]
+    for market in markets:
+        refresher.schedule(market)
+
+    assert asyncio.run(refresher.refresh_due()) == 2
+    assert asyncio.run(refresher.refresh_due()) == 1
+    assert asyncio.run(refresher.refresh_due()) == 0  # Everything fresh and rescheduled
+    assert refresher.get_metrics()["scheduled"] == 3
+    assert refresher.heap[0][0] > time.monotonic()
+
+
+def test_most_overdue_market_goes_first(create_market):
+    refresher = PredictionRefresher(interval=6.0, max_per_minute=10)  # Budget of 1
+    later, earlier = (storage.get_market(create_market()) for _ in range(2))
+    clock = time.monotonic()
+    refresher.schedule(later, clock - 1)
+    refresher.schedule(earlier, clock - 5)
+    assert refresher.due_markets() == [earlier]
+
+
+def test_enough_updates_make_a_market_due(create_market):
+    refresher = PredictionRefresher(max_updates=3)
+    market = storage.get_market(create_market())
+    refresher.schedule(market)
+    asyncio.run(refresher.refresh_due())
+    assert refresher.due_markets() == []
+
+    for _ in range(3):
+        market.version += 1
+        refresher.note_update(market)
+    assert refresher.due_markets() == [market]
+
+
+def test_markets_refreshed_elsewhere_are_pushed_back(create_market):
+    refresher = PredictionRefresher()
+    market = storage.get_market(create_market())
+    refresher.schedule(market)
+    asyncio.run(cache_module.prediction_cache.refresh(market))  # e.g. a manual refresh
+
+    assert refresher.due_markets() == []
+    assert len(refresher.heap) == 1
+    assert refresher.heap[0][0] > time.monotonic()
@@ -0,0 +1,109 @@
+"""Cross-worker pub/sub transports"""
+
+import asyncio
+import json
+
+from services.pubsub import RedisPubSub, UnixSocketPubSub
+
+
+def test_broker_skips_malformed_frames(tmp_path):
+    async def scenario():
+        received = []
+
+        async def handler(envelope):
+            received.append(envelope["message"])
+
+        broker = UnixSocketPubSub(str(tmp_path / "bus.sock"))
+        await broker.start(handler)
+        reader, writer = await asyncio.open_unix_connection(broker.path)
+        writer.write(b"not json\n[1, 2]\n")
+        writer.write(json.dumps([{"origin": "peer", "message": "hello"}]).encode() + b"\n")
+        await writer.drain()
+        await asyncio.sleep(0.05)
+
+        connected = len(broker._peers)
+        writer.close()
+        await writer.wait_closed()
+        await asyncio.sleep(0.05)  # Let the broker see the peer leave
+        await broker.stop()
+        return received, connected
+
+    received, connected = asyncio.run(scenario())
+    assert received == ["hello"]
+    assert connected == 1
+
+
+def test_slow_peer_does_not_serialize_relay(tmp_path):
+    class SlowWriter:
+        def __init__(self):
+            self.frames = []
+
+        def write(self, frame):
+            self.frames.append(frame)
+
+        async def drain(self):
+            await asyncio.sleep(0.1)
+
+    async def scenario():
+        broker = UnixSocketPubSub(str(tmp_path / "bus.sock"))
+        broker._peers = {i: SlowWriter() for i in range(5)}
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        await broker._relay(b"[]\n")
+        return loop.time() - started, broker._peers
+
+    elapsed, peers = asyncio.run(scenario())
+    assert elapsed < 0.3
+    assert all(writer.frames == [b"[]\n"] for writer in peers.values())
+
+
+class FlakyPubSub:
+    """Redis subscription whose first connection drops"""
+
+    def __init__(self, attempt):
+        self.attempt = attempt
+
+    async def subscribe(self, channel):
+        pass
+
+    async def listen(self):
+        if self.attempt == 0:
+            raise ConnectionError("Connection reset by peer")
+        yield {"type": "subscribe", "data": 1}
+        yield {"type": "message", "data": b"{broken"}
+        yield {"type": "message", "data": json.dumps([{"origin": "peer", "message": "hi"}]).encode()}
+        await asyncio.sleep(10)
+
+    async def aclose(self):
+        pass
+
+
+class FlakyClient:
+    def __init__(self):
+        self.subscriptions = 0
+
+    def pubsub(self):
+        self.subscriptions += 1
+        return FlakyPubSub(self.subscriptions - 1)
+
+
+def test_redis_reader_resubscribes_after_connection_loss():
+    async def scenario():
+        received = []
+
+        async def handler(envelope):
+            received.append(envelope["message"])
+
+        bus = RedisPubSub("redis://unused", "channel")
+        bus.RECONNECT_DELAY = 0.01
+        bus._handler = handler
+        bus._client = FlakyClient()
+        await bus._subscribe()
+        reader = asyncio.create_task(bus._read())
+        await asyncio.sleep(0.1)
+        reader.cancel()
+        return received, bus._client.subscriptions
+
+    received, subscriptions = asyncio.run(scenario())
+    assert received == ["hi"]
+    assert subscriptions == 2
@@ -0,0 +1,83 @@
+"""Reasoning interning and the cold segment tier"""
+
+import asyncio
+import os
+
+import pytest
+
+from models.reasoning_store import ReasoningStore, reasoning_store
+from tests.conftest import API
+
+TEXTS = ["Rain is likely given the forecast", "Dry season makes rain unlikely"]
+
+
+@pytest.fixture
+def store(tmp_path) -> ReasoningStore:
+    return ReasoningStore(str(tmp_path / "segments"), cache_size=0)
+
+
+def archived(store: ReasoningStore) -> list:
+    """Intern TEXTS once each and archive them to one segment"""
+    keys = [store.intern(text) for text in TEXTS]
+    assert asyncio.run(store.archive("market", keys)) == len(TEXTS)
+    return keys
+
+
+def test_identical_texts_share_one_reference_counted_copy(store):
+    first = store.intern(TEXTS[0])
+    assert store.intern(TEXTS[0]) == first
+    assert store.intern(TEXTS[1]) != first
+
+    assert store.release([first]) == []  # Still used by the other stake
+    assert store.release([first]) == [first]
+
+
+def test_cold_texts_are_read_from_their_segment(store):
+    keys = archived(store)
+    assert os.listdir(store.directory) == ["market.seg"]
+    assert [store.get(key) for key in keys] == TEXTS
+
+
+def test_texts_still_referenced_stay_in_memory(store):
+    shared = store.intern(TEXTS[0])
+    store.intern(TEXTS[0])  # Same text on a market that is still open
+    keys = [shared, store.intern(TEXTS[1])]
+    assert asyncio.run(store.archive("market", keys)) == 1
+
+    os.remove(os.path.join(store.directory, "market.seg"))
+    assert store.get(shared) == TEXTS[0]
+
+
+def test_missing_segment_reads_as_empty(store):
+    keys = archived(store)
+    os.remove(os.path.join(store.directory, "market.seg"))
+    assert [store.get(key) for key in keys] == ["", ""]
+
+
+def test_corrupt_segment_reads_as_empty(store):
+    keys = archived(store)
+    with open(os.path.join(store.directory, "market.seg"), "r+b") as segment:
+        segment.write(b"\x00" * 8)
+    assert store.get(keys[0]) == ""
+
+    with open(os.path.join(store.directory, "market.seg"), "r+b") as segment:
+        segment.truncate(4)
+    assert store.get(keys[1]) == ""
+
+
+def test_resolution_archives_reasoning(
+    client, create_market, create_stake, resolve_market, reasoning_dir, monkeypatch
+):
+    monkeypatch.setattr(reasoning_store, "cache_size", 0)
+    market_id = create_market()
+    stake_id = create_stake(market_id, "ARCHIVED", "Yes")
+    resolve_market(market_id, "Yes")
+
+    assert os.listdir(reasoning_dir) == [f"{market_id}.seg"]
+    response = client.get(f"{API}/staking/{stake_id}")
+    assert response.json()["reasoning"] == "ARCHIVED expects Yes for good reasons"
+
+    os.remove(os.path.join(reasoning_dir, f"{market_id}.seg"))
+    response = client.get(f"{API}/staking/market/{market_id}")
+    assert response.status_code == 200
+    assert response.json()[0]["reasoning"] == ""
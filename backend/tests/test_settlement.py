@@ -0,0 +1,83 @@
+"""Stake settlement at resolution"""
+
+import numpy as np
+import pytest
+
+from models.stake_book import StakeBook
+from storage import storage
+from tests.conftest import API
+
+
+def test_rewards_split_the_losing_pool(client, create_market, create_stake, resolve_market):
+    market_id = create_market()
+    small = create_stake(market_id, "SMALL", "Yes", amount=1.0)
+    large = create_stake(market_id, "LARGE", "Yes", amount=3.0)
+    loser = create_stake(market_id, "LOSER", "No", amount=2.0)
+    resolve_market(market_id, "Yes")
+
+    ledger = storage.get_claim_ledger(market_id)
+    assert ledger.winning_outcome == "Yes"
+    assert (ledger.total_correct, ledger.total_incorrect) == (4.0, 2.0)
+    assert ledger.reward_for(small) == pytest.approx(1.5)
+    assert ledger.reward_for(large) == pytest.approx(4.5)
+    assert ledger.reward_for(loser) is None
+    assert ledger.rewards.sum() == pytest.approx(6.0)
+
+    stake = storage.get_stake(loser)
+    assert (stake.is_correct, stake.reward_amount) == (False, None)
+
+
+def test_ledger_is_read_only(create_market, create_stake, resolve_market):
+    market_id = create_market()
+    create_stake(market_id, "STAKER", "Yes")
+    resolve_market(market_id, "Yes")
+
+    ledger = storage.get_claim_ledger(market_id)
+    with pytest.raises(ValueError):
+        ledger.rewards[0] = 100.0
+
+
+def test_stakes_are_unsettled_until_resolution(client, create_market, create_stake):
+    market_id = create_market()
+    stake_id = create_stake(market_id, "EARLY", "Yes")
+
+    assert storage.get_claim_ledger(market_id) is None
+    stake = storage.get_stake(stake_id)
+    assert (stake.is_correct, stake.reward_amount) == (None, None)
+    response = client.post(f"{API}/staking/{stake_id}/claim", params={"claimer_address": "EARLY"})
+    assert response.status_code == 400
+
+
+def test_market_resolves_once(client, create_market, create_stake, resolve_market):
+    market_id = create_market()
+    stake_id = create_stake(market_id, "STAKER", "Yes")
+    resolve_market(market_id, "Yes")
+    ledger = storage.get_claim_ledger(market_id)
+
+    response = client.post(f"{API}/markets/{market_id}/resolve", json={
+        "resolver_address": "CREATOR", "winning_outcome": "No"
+    })
+    assert response.json()["detail"] == "Market already resolved"
+    assert storage.get_claim_ledger(market_id) is ledger
+    assert ledger.reward_for(stake_id) == 1.0
+
+
+def test_no_winners_pays_nothing(create_market, create_stake, resolve_market):
+    market_id = create_market()
+    create_stake(market_id, "LOSER", "No", amount=5.0)
+    resolve_market(market_id, "Yes")
+
+    ledger = storage.get_claim_ledger(market_id)
+    assert ledger.total_correct == 0.0
+    assert not ledger.rewards.any()
+
+
+def test_stake_book_grows_past_capacity():
+    book = StakeBook(capacity=2)
+    for i in range(5):
+        assert book.add(f"stake{i}", "Yes" if i % 2 else "No", float(i)) == i
+
+    assert len(book) == 5
+    assert book.outcome_names == ["No", "Yes"]
+    np.testing.assert_array_equal(book.amounts, [0, 1, 2, 3, 4])
+    np.testing.assert_array_equal(book.codes, [0, 1, 0, 1, 0])
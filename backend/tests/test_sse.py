@@ -0,0 +1,56 @@
+"""Server-Sent Events resume and reset"""
+
+import asyncio
+from typing import List, Optional
+
+from services.sse import SSEBroadcaster
+
+
+def read_frames(broadcaster: SSEBroadcaster, last_event_id: Optional[str], count: int) -> List[bytes]:
+    """Collect the first frames of a firehose stream"""
+    async def collect():
+        frames = []
+        async for frame in broadcaster.stream(last_event_id=last_event_id):
+            frames.append(frame)
+            if len(frames) == count:
+                break
+        return frames
+    return asyncio.run(collect())
+
+
+def publish(broadcaster: SSEBroadcaster, count: int) -> None:
+    for i in range(count):
+        broadcaster.publish(f"market_{i % 2}", f'{{"i": {i}}}')
+
+
+def test_retry_is_separate_from_keepalive():
+    broadcaster = SSEBroadcaster(keepalive_seconds=15.0, retry_ms=2500)
+    assert read_frames(broadcaster, None, 1) == [b"retry: 2500\n\n"]
+
+
+def test_resume_replays_missed_events():
+    broadcaster = SSEBroadcaster(history_size=10)
+    publish(broadcaster, 5)
+    frames = read_frames(broadcaster, f"{broadcaster.epoch}-3", 3)
+    assert frames[1].startswith(f"id: {broadcaster.epoch}-4\n".encode())
+    assert frames[2].startswith(f"id: {broadcaster.epoch}-5\n".encode())
+
+
+def test_expired_history_sends_reset():
+    broadcaster = SSEBroadcaster(history_size=3)
+    publish(broadcaster, 10)
+    _, frame = read_frames(broadcaster, f"{broadcaster.epoch}-2", 2)
+    assert b"event: reset\n" in frame
+    assert b"history_expired" in frame
+    assert frame.startswith(f"id: {broadcaster.epoch}-10\n".encode())
+
+
+def test_ids_from_another_worker_send_reset():
+    broadcaster = SSEBroadcaster()
+    other = SSEBroadcaster()
+    publish(broadcaster, 5)
+    assert broadcaster.sequence_of(f"{other.epoch}-3") is None
+    assert broadcaster.sequence_of("3") is None
+    _, frame = read_frames(broadcaster, f"{other.epoch}-3", 2)
+    assert b"event: reset\n" in frame
+    assert b"unknown_stream" in frame
@@ -0,0 +1,67 @@
+"""Incremental stake insights"""
+
+import random
+
+import pytest
+
+from models.stake import Stake
+from models.stake_insights import MarketInsights
+from tests.conftest import API
+
+
+def make_stake(i: int, outcome: str, amount: float, confidence: float) -> Stake:
+    return Stake(
+        id=f"stake{i}",
+        market_id="MARKET",
+        staker_address=f"STAKER{i}",
+        outcome=outcome,
+        amount=amount,
+        reasoning="Some reasoning for the stake",
+        confidence=confidence
+    )
+
+
+def test_aggregates_match_a_full_recompute():
+    rng = random.Random(7)
+    stakes = [
+        make_stake(i, rng.choice(["Yes", "No"]), rng.choice([1.0, 2.0, 5.0]), rng.choice([0.2, 0.5, 0.8]))
+        for i in range(200)
+    ]
+    insights = MarketInsights()
+    for stake in stakes:
+        insights.add(stake)
+
+    assert insights.total_stakes == len(stakes)
+    assert insights.total_amount_staked == pytest.approx(sum(s.amount for s in stakes))
+    for outcome in ("Yes", "No"):
+        on_outcome = [s for s in stakes if s.outcome == outcome]
+        aggregates = insights.get_outcome(outcome)
+        assert aggregates.num_stakers == len(on_outcome)
+        assert aggregates.total_staked == pytest.approx(sum(s.amount for s in on_outcome))
+        assert aggregates.avg_confidence == pytest.approx(
+            sum(s.confidence for s in on_outcome) / len(on_outcome)
+        )
+        # Stable sort: earlier stakes win ties
+        expected = sorted(on_outcome, key=lambda s: s.amount * s.confidence, reverse=True)[:3]
+        assert aggregates.top_stake_ids() == [s.id for s in expected]
+
+
+def test_outcome_without_stakes_is_empty():
+    aggregates = MarketInsights().get_outcome("Yes")
+    assert (aggregates.total_staked, aggregates.num_stakers, aggregates.avg_confidence) == (0.0, 0, 0)
+    assert aggregates.top_stake_ids() == []
+
+
+def test_insights_endpoint(client, create_market, create_stake):
+    market_id = create_market()
+    for staker, amount in (("A", 1.0), ("B", 4.0), ("C", 2.0), ("D", 3.0)):
+        create_stake(market_id, staker, "Yes", amount=amount)
+    create_stake(market_id, "E", "No", amount=2.0)
+
+    response = client.get(f"{API}/staking/market/{market_id}/insights").json()
+    assert response["total_stakes"] == 5
+    assert response["total_amount_staked"] == 12.0
+    yes = response["outcome_insights"]["Yes"]
+    assert (yes["total_staked"], yes["num_stakers"], yes["avg_confidence"]) == (10.0, 4, 0.5)
+    assert [entry["staker"] for entry in yes["top_reasoning"]] == ["B", "D", "C"]
+    assert [entry["staker"] for entry in response["outcome_insights"]["No"]["top_reasoning"]] == ["E"]
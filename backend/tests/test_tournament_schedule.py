@@ -0,0 +1,29 @@
+"""Tournament creation timing"""
+
+from datetime import datetime, timedelta
+
+from tests.conftest import API
+
+
+def tournament_body(market_id: str, start_time: datetime) -> dict:
+    return {
+        "name": "Timing cup", "description": "A description long enough for validation",
+        "market_ids": [market_id], "entry_fee": 0, "prize_pool": 100,
+        "start_time": start_time.isoformat(),
+        "end_time": (start_time + timedelta(days=7)).isoformat(),
+        "max_participants": 10, "creator_address": "CREATOR"
+    }
+
+
+def test_past_start_time_is_rejected(client, create_market):
+    body = tournament_body(create_market(), datetime.utcnow() - timedelta(minutes=1))
+    response = client.post(f"{API}/tournaments/", json=body)
+    assert response.status_code == 422
+    assert "Start time must be in the future" in response.text
+
+
+def test_future_start_time_stays_pending(client, create_market):
+    body = tournament_body(create_market(), datetime.utcnow() + timedelta(hours=1))
+    response = client.post(f"{API}/tournaments/", json=body)
+    assert response.status_code == 201, response.text
+    assert response.json()["status"] == "pending"
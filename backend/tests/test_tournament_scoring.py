@@ -0,0 +1,65 @@
+"""Tournament scoring as markets resolve"""
+
+from tests.conftest import API
+
+
+def start_tournament(client, market_ids: list, participants: list) -> str:
+    """Create and start an accuracy tournament and return its URL"""
+    response = client.post(f"{API}/tournaments/", json={
+        "name": "Weekly", "description": "A description long enough for validation",
+        "market_ids": market_ids, "entry_fee": 0, "prize_pool": 100,
+        "start_time": "2029-01-01T00:00:00", "end_time": "2029-02-01T00:00:00",
+        "max_participants": 10, "creator_address": "CREATOR"
+    })
+    assert response.status_code == 201, response.text
+    tournament = f"{API}/tournaments/{response.json()['id']}"
+
+    client.post(f"{tournament}/join/bulk", json={"participant_addresses": participants})
+    response = client.post(f"{tournament}/start", params={"creator_address": "CREATOR"})
+    assert response.status_code == 200, response.text
+    return tournament
+
+
+def score_of(client, tournament: str, address: str) -> float:
+    return client.get(f"{tournament}/leaderboard/{address}").json()["score"]
+
+
+def test_picks_are_scored_when_their_market_resolves(client, create_market, resolve_market):
+    first, second = create_market(), create_market()
+    tournament = start_tournament(client, [first, second], ["A", "B"])
+
+    client.post(f"{tournament}/predict", json={
+        "participant_address": "A", "predictions": {first: "Yes", second: "Yes"}
+    })
+    assert score_of(client, tournament, "A") == 0.0
+
+    resolve_market(first, "Yes")
+    assert score_of(client, tournament, "A") == 1.0
+    resolve_market(second, "No")
+    assert score_of(client, tournament, "A") == 1.0
+
+
+def test_resolved_markets_take_no_predictions(client, create_market, resolve_market):
+    first, second = create_market(), create_market()
+    tournament = start_tournament(client, [first, second], ["A", "B"])
+
+    client.post(f"{tournament}/predict", json={"participant_address": "A", "predictions": {first: "No"}})
+    resolve_market(first, "Yes")
+    assert score_of(client, tournament, "A") == 0.0
+
+    response = client.post(f"{tournament}/predict", json={
+        "participant_address": "A", "predictions": {first: "Yes", second: "Yes"}
+    })
+    assert response.status_code == 400
+    assert response.json()["detail"] == f"Market {first} has already resolved"
+
+    response = client.post(f"{tournament}/predict/bulk", json={"submissions": [
+        {"participant_address": "A", "predictions": {first: "Yes"}},
+        {"participant_address": "B", "predictions": {second: "Yes"}}
+    ]}).json()
+    assert response["accepted"] == 1
+    assert response["rejected"] == [{"participant": "A", "reason": f"Market {first} has already resolved"}]
+
+    assert score_of(client, tournament, "A") == 0.0
+    predictions = client.get(f"{tournament}/predictions").json()["predictions"]
+    assert predictions[0] == {"participant": "A", "predictions": {first: "No"}}
@@ -0,0 +1 @@
+"""Shared helpers for PolyGrand backend"""
@@ -0,0 +1,21 @@
+"""Datetime helpers
+
+Models store naive datetimes in UTC; these normalize values that arrive
+timezone-aware.
+"""
+
+from datetime import datetime, timezone
+
+
+def to_utc(moment: datetime) -> datetime:
+    """Normalize a datetime to naive UTC, the convention used across models"""
+    if moment.tzinfo is not None:
+        return moment.astimezone(timezone.utc).replace(tzinfo=None)
+    return moment
+
+
+def epoch_seconds(moment: datetime) -> float:
+    """Seconds since the epoch of a datetime (naive values are UTC)"""
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.timestamp()